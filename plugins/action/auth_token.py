@@ -4,15 +4,21 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 # Generates an auth token. No parameters required.
+# Parameters:
+#   timeout: Seconds to wait for the login response, overriding the read_timeout host option (float).
+# A valid token cached by an earlier task or another fork is returned instead of
+# logging in again.
 # Example:
 #   - name: Generate auth token
 #     itential.platform.auth_token:
 
 from ansible.plugins.action import ActionBase
-from ansible.module_utils.common import yaml
-from ansible_collections.itential.platform.plugins.module_utils.login import login
-from ansible_collections.itential.platform.plugins.module_utils import host as spec
-from ansible_collections.itential.core.plugins.module_utils import hosts
+from ansible_collections.itential.platform.plugins.module_utils.login import get_token
+from ansible_collections.itential.platform.plugins.module_utils.request import get_host
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import task_timeout
+from ansible_collections.itential.platform.plugins.module_utils.profiling import profile_action
+from ansible_collections.itential.platform.plugins.module_utils.tracing import trace_action
+from ansible_collections.itential.platform.plugins.module_utils.metrics import batch_action
 
 class ActionModule(ActionBase):
 
@@ -20,13 +26,15 @@ class ActionModule(ActionBase):
     _supports_async = False
     _requires_connection = False
 
+    @profile_action
+    @trace_action
+    @batch_action
     def run(self, tmp=None, task_vars=None):
         inventory_hostname = task_vars["inventory_hostname"]
         hostvars = task_vars["hostvars"].get(inventory_hostname)
 
-        schema = yaml.yaml_load(spec.DOCUMENTATION)
-        host = hosts.new(schema, hostvars)
+        host = get_host(hostvars)
 
-        auth_token = login(host)
+        auth_token = get_token(host, task_timeout(self._task.args))
 
         return {"auth_token": auth_token}
@@ -0,0 +1,117 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Sends many API requests to Itential Platform from a single task.
+# Parameters:
+#   requests: A list of requests, each with an endpoint and optionally a method
+#             (default GET), params, data and idempotent.
+#   concurrency: The maximum number of requests in flight at the same time (int, default 4).
+#   fail_on_error: Fail the task if any request fails (bool, default true).
+#   fields: Only return these fields of each JSON body, given as dotted paths (list or
+#           comma-separated str).  Also accepted as select.
+#   max_items: Return at most this many items of each list body (int).
+#   return_body: Return the JSON bodies, set to false to only return the status and
+#                timings of each request (bool, default true).
+#   timeout: Seconds to wait for each response, overriding the read_timeout host option (float).
+#   deadline: Seconds all requests together may take.  Requests not sent by then are
+#             reported as failed (float).
+#   idempotent: Whether requests may be resent after the server may have acted on them,
+#               unless set for a request (bool, default true for GET and false otherwise).
+#
+# Every request is sent even if another request fails.  Results are returned in the
+# same order as requests, each with its status, JSON body, timing and any error.
+#
+# Example:
+#   - name: Fetch several adapters
+#     itential.platform.batch_request:
+#       concurrency: 8
+#       requests:
+#         - endpoint: /adapters/network-adapter
+#         - endpoint: /adapters/security-adapter
+#         - method: PUT
+#           endpoint: /adapters/email-adapter/restart
+
+from ansible.plugins.action import ActionBase
+from ansible.errors import AnsibleError
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.itential.platform.plugins.module_utils.request import make_request, is_idempotent, VALID_HTTP_METHODS
+from ansible_collections.itential.platform.plugins.module_utils import parallel
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import task_timeout, task_deadline
+from ansible_collections.itential.platform.plugins.module_utils.projection import Projection
+from ansible_collections.itential.platform.plugins.module_utils.profiling import profile_action
+from ansible_collections.itential.platform.plugins.module_utils.tracing import trace_action
+from ansible_collections.itential.platform.plugins.module_utils.metrics import batch_action
+
+
+class ActionModule(ActionBase):
+
+    _supports_check_mode = False
+    _supports_async = False
+    _requires_connection = False
+
+    @profile_action
+    @trace_action
+    @batch_action
+    def run(self, tmp=None, task_vars=None):
+        """Send a list of Itential Platform API requests with bounded concurrency."""
+
+        module_args = self._task.args
+
+        requests = module_args.get("requests")
+        if not requests or not isinstance(requests, list):
+            raise AnsibleError("'requests' must be a non-empty list.")
+
+        # Validate every request before sending any of them
+        for index, request in enumerate(requests):
+            if not isinstance(request, dict):
+                raise AnsibleError(f"'requests[{index}]' must be a dictionary.")
+            if not request.get("endpoint"):
+                raise AnsibleError(f"'requests[{index}].endpoint' must be provided.")
+            method = request.get("method", "GET")
+            if method not in VALID_HTTP_METHODS:
+                raise AnsibleError(f"Invalid HTTP method '{method}' in 'requests[{index}]'. Allowed values: {', '.join(sorted(VALID_HTTP_METHODS))}")
+
+        concurrency = parallel.validate_concurrency(module_args.get("concurrency", 4))
+        fail_on_error = boolean(module_args.get("fail_on_error", True))
+        timeout = task_timeout(module_args)
+        deadline = task_deadline(module_args)
+        shape = Projection.from_args(module_args)
+
+        def send(request):
+            method = request.get("method", "GET")
+            result = make_request(
+                task_vars,
+                method,
+                request["endpoint"],
+                params=request.get("params"),
+                data=request.get("data"),
+                timeout=timeout,
+                deadline=deadline,
+                return_body=shape is None or shape.return_body,
+                idempotent=is_idempotent(method, request.get("idempotent", module_args.get("idempotent"))),
+            )
+            return result if shape is None else shape.apply(result)
+
+        results = []
+        failed = 0
+        for outcome in parallel.run_ordered(send, requests, concurrency):
+            if outcome.failed:
+                failed += 1
+                response = {"failed": True, "msg": str(outcome.error)}
+            else:
+                response = outcome.result
+            response.update({
+                "method": outcome.item.get("method", "GET"),
+                "endpoint": outcome.item["endpoint"],
+                "duration": outcome.duration,
+            })
+            results.append(response)
+
+        result = {"changed": False, "results": results, "failed_count": failed}
+
+        if failed and fail_on_error:
+            result.update({"failed": True, "msg": f"{failed} of {len(requests)} request(s) failed"})
+
+        return result
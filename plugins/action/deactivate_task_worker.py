@@ -4,12 +4,18 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 # Deactivates the Itential Platform task worker. No parameters required.
+# Parameters:
+#   timeout: Seconds to wait for the response, overriding the read_timeout host option (float).
 # Example:
 #   - name: Deactivate task worker
 #     itential.platform.deactivate_task_worker:
 
 from ansible.plugins.action import ActionBase
 from ansible_collections.itential.platform.plugins.module_utils.request import make_request
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import task_timeout
+from ansible_collections.itential.platform.plugins.module_utils.profiling import profile_action
+from ansible_collections.itential.platform.plugins.module_utils.tracing import trace_action
+from ansible_collections.itential.platform.plugins.module_utils.metrics import batch_action
 
 class ActionModule(ActionBase):
 
@@ -17,9 +23,12 @@ class ActionModule(ActionBase):
     _supports_async = False
     _requires_connection = False
 
+    @profile_action
+    @trace_action
+    @batch_action
     def run(self, tmp=None, task_vars=None):
 
         endpoint = "/workflow_engine/deactivate"
         method = "POST"
 
-        return make_request(task_vars, method, endpoint)
+        return make_request(task_vars, method, endpoint, timeout=task_timeout(self._task.args))
@@ -5,7 +5,13 @@
 
 from ansible.plugins.action import ActionBase
 from ansible.errors import AnsibleError
-from ansible_collections.itential.platform.plugins.module_utils.request import make_request
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.itential.platform.plugins.module_utils.request import make_request, download_request, is_idempotent
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import task_timeout
+from ansible_collections.itential.platform.plugins.module_utils.projection import Projection
+from ansible_collections.itential.platform.plugins.module_utils.profiling import profile_action
+from ansible_collections.itential.platform.plugins.module_utils.tracing import trace_action
+from ansible_collections.itential.platform.plugins.module_utils.metrics import batch_action
 
 class ActionModule(ActionBase):
 
@@ -15,6 +21,9 @@ class ActionModule(ActionBase):
 
     ALLOWED_METHODS = {"GET", "PUT", "POST", "DELETE"}
 
+    @profile_action
+    @trace_action
+    @batch_action
     def run(self, tmp=None, task_vars=None):
 
         module_args = self._task.args
@@ -30,5 +39,41 @@ class ActionModule(ActionBase):
 
         params = module_args.get("params", None)
         data = module_args.get("data", None)
+        timeout = task_timeout(module_args)
+        compress = boolean(module_args.get("compress", False))
+        dest = module_args.get("dest", None)
+        idempotent = is_idempotent(method, module_args.get("idempotent"))
 
-        return make_request(task_vars, method, endpoint, params=params, data=data)
+        if dest:
+            return download_request(
+                task_vars,
+                method,
+                endpoint,
+                dest,
+                params=params,
+                data=data,
+                checksum=module_args.get("checksum", None),
+                timeout=timeout,
+                compress=compress,
+                idempotent=idempotent,
+            )
+
+        if module_args.get("checksum"):
+            raise AnsibleError("'checksum' requires 'dest'.")
+
+        shape = Projection.from_args(module_args)
+        if shape is None:
+            return make_request(task_vars, method, endpoint, params=params, data=data, timeout=timeout, compress=compress, idempotent=idempotent)
+
+        result = make_request(
+            task_vars,
+            method,
+            endpoint,
+            params=params,
+            data=data,
+            timeout=timeout,
+            compress=compress,
+            return_body=shape.return_body,
+            idempotent=idempotent,
+        )
+        return shape.apply(result)
@@ -4,14 +4,50 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 # Retrieves list of jobs from Itential Platform. No parameters required.
+# Any other key/value pair is used as an equality filter on the jobs.
+# Parameters:
+#   page_size: Retrieve every matching job, page_size jobs per request (int).
+#   concurrency: The maximum number of pages fetched at the same time (int, default 1).
+#   dest: Stream the matching jobs to this controller file as NDJSON instead of
+#         returning them (str).  Implies pagination.  The file is left untouched, and
+#         the task reports no change, when its content is the same.
+#   fields: Only return these job fields, given as dotted paths (list or comma-separated str).
+#           Also accepted as select.
+#   max_items: Return at most this many jobs (int).
+#   return_body: Return the jobs, set to false to only return the status and timings (bool, default true).
+#   timeout: Seconds to wait for each response, overriding the read_timeout host option (float).
+#   deadline: Seconds the whole retrieval may take, across every page (float).
 # Returns: List of job objects with their status and details.
 # Example:
 #   - name: Get all jobs
 #     itential.platform.get_jobs:
 #     register: jobs_result
+#
+#   - name: Export every completed job to a file, four pages at a time
+#     itential.platform.get_jobs:
+#       status: complete
+#       page_size: 500
+#       concurrency: 4
+#       dest: /tmp/jobs.ndjson
+#
+#   - name: Get the name and status of at most ten running jobs
+#     itential.platform.get_jobs:
+#       status: running
+#       fields: name,status
+#       max_items: 10
 
 from ansible.plugins.action import ActionBase
 from ansible_collections.itential.platform.plugins.module_utils.request import make_request
+from ansible_collections.itential.platform.plugins.module_utils import pagination
+from ansible_collections.itential.platform.plugins.module_utils import parallel
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import task_timeout, task_deadline
+from ansible_collections.itential.platform.plugins.module_utils import projection
+from ansible_collections.itential.platform.plugins.module_utils.profiling import profile_action
+from ansible_collections.itential.platform.plugins.module_utils.tracing import trace_action
+from ansible_collections.itential.platform.plugins.module_utils.metrics import batch_action
+
+# Task arguments that control retrieval rather than filter the jobs
+RESERVED_ARGS = ("page_size", "concurrency", "dest", "timeout", "deadline") + projection.RESERVED_ARGS
 
 
 class ActionModule(ActionBase):
@@ -20,9 +56,16 @@ class ActionModule(ActionBase):
     _supports_async = False
     _requires_connection = False
 
+    @profile_action
+    @trace_action
+    @batch_action
     def run(self, tmp=None, task_vars=None):
 
-        module_args = self._task.args
+        module_args = dict(self._task.args)
+        options = {key: module_args.pop(key) for key in RESERVED_ARGS if key in module_args}
+        timeout = task_timeout(options)
+        deadline = task_deadline(options)
+        shape = projection.Projection.from_args(options)
 
         params = {}
         for key, value in module_args.items():
@@ -33,5 +76,41 @@ class ActionModule(ActionBase):
         method = "GET"
 
         params["include"] = "name,status"
+        if shape is not None and shape.include:
+            # The server only returns the included fields, include every field that is kept
+            params["include"] = shape.include
+
+        if "page_size" not in options and "dest" not in options:
+            if shape is None:
+                return make_request(task_vars, method, endpoint, params=params, timeout=timeout, deadline=deadline)
+            if shape.max_items:
+                params["limit"] = shape.max_items
+            return projection.projected_request(task_vars, method, endpoint, shape, params=params, timeout=timeout, deadline=deadline)
+
+        paginator = pagination.Paginator(
+            task_vars,
+            endpoint,
+            params=params,
+            page_size=parallel.positive_int("page_size", options.get("page_size", pagination.DEFAULT_PAGE_SIZE)),
+            concurrency=parallel.validate_concurrency(options.get("concurrency", 1)),
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+        pages = paginator if shape is None else shape.pages(paginator)
+
+        if "dest" in options:
+            written = pagination.write_ndjson(options["dest"], pages)
+            written.update({"dest": options["dest"], "total": paginator.total, "pages": paginator.pages, "timing": paginator.timing()})
+            return written
 
-        return make_request(task_vars, method, endpoint, params=params)
+        jobs = [job for page in pages for job in page]
+        result = {
+            "changed": False,
+            "json": {"data": jobs, "metadata": {"total": paginator.total, "count": len(jobs)}},
+            "pages": paginator.pages,
+            "timing": paginator.timing(),
+        }
+        if shape is not None and not shape.return_body:
+            del result["json"]
+        return result
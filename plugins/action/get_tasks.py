@@ -4,15 +4,47 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 # Retrieves list of tasks from Itential Platform. Supports filtering via parameters.
-# Returns: List of task objects with their status, details, and type.
+# Parameters:
+#   snapshot: Synchronize incrementally into this controller file (str).  Only tasks
+#             changed since the checkpoint stored in the snapshot are requested.
+#   checkpoint_field: The task field used as the checkpoint (str, default last_updated).
+#   page_size: The number of tasks requested per page in incremental mode (int, default 100).
+#   concurrency: The maximum number of pages fetched at the same time (int, default 1).
+#   dest: Stream the matching tasks to this controller file as NDJSON instead of
+#         returning them (str).  Implies pagination, cannot be combined with snapshot.
+#   fields: Only return these task fields, given as dotted paths (list or comma-separated str).
+#           Also accepted as select.  The snapshot stores the top-level fields whole.
+#   max_items: Return at most this many tasks (int).
+#   return_body: Return the tasks, set to false to only return the status and timings (bool, default true).
+#   timeout: Seconds to wait for each response, overriding the read_timeout host option (float).
+#   deadline: Seconds the whole retrieval may take, across every page (float).
+# Returns: List of task objects with their status, details, and type.  In incremental
+#          mode only the tasks that changed since the previous run are returned.
 # Example:
 #   - name: Get tasks by status
 #     itential.platform.get_tasks:
 #       status: completed
 #     register: completed_tasks
+#
+#   - name: Poll for changed tasks
+#     itential.platform.get_tasks:
+#       snapshot: /var/lib/itential/tasks.json
+#     register: changed_tasks
 
 from ansible.plugins.action import ActionBase
+from ansible.errors import AnsibleError
 from ansible_collections.itential.platform.plugins.module_utils.request import make_request
+from ansible_collections.itential.platform.plugins.module_utils import pagination
+from ansible_collections.itential.platform.plugins.module_utils import parallel
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import task_timeout, task_deadline
+from ansible_collections.itential.platform.plugins.module_utils import snapshot
+from ansible_collections.itential.platform.plugins.module_utils import projection
+from ansible_collections.itential.platform.plugins.module_utils.profiling import profile_action
+from ansible_collections.itential.platform.plugins.module_utils.tracing import trace_action
+from ansible_collections.itential.platform.plugins.module_utils.metrics import batch_action
+
+# Task arguments that control retrieval rather than filter the tasks
+RESERVED_ARGS = ("snapshot", "checkpoint_field", "page_size", "concurrency", "dest", "timeout", "deadline") + projection.RESERVED_ARGS
 
 
 class ActionModule(ActionBase):
@@ -21,9 +53,16 @@ class ActionModule(ActionBase):
     _supports_async = False
     _requires_connection = False
 
+    @profile_action
+    @trace_action
+    @batch_action
     def run(self, tmp=None, task_vars=None):
 
-        module_args = self._task.args
+        module_args = dict(self._task.args)
+        options = {key: module_args.pop(key) for key in RESERVED_ARGS if key in module_args}
+        timeout = task_timeout(options)
+        deadline = task_deadline(options)
+        shape = projection.Projection.from_args(options)
 
         params = {}
         for key, value in module_args.items():
@@ -34,5 +73,77 @@ class ActionModule(ActionBase):
         method = "GET"
 
         params["include"] = "name,status,type"
+        if shape is not None and shape.include:
+            # The server only returns the included fields, include every field that is kept
+            params["include"] = shape.include
+
+        if "snapshot" in options and "dest" in options:
+            raise AnsibleError("'snapshot' and 'dest' are mutually exclusive.")
+
+        if "dest" in options:
+            paginator = pagination.Paginator(
+                task_vars,
+                endpoint,
+                params=params,
+                page_size=parallel.positive_int("page_size", options.get("page_size", pagination.DEFAULT_PAGE_SIZE)),
+                concurrency=parallel.validate_concurrency(options.get("concurrency", 1)),
+                timeout=timeout,
+                deadline=deadline,
+            )
+            pages = paginator if shape is None else shape.pages(paginator)
+            written = pagination.write_ndjson(options["dest"], pages)
+            written.update({"dest": options["dest"], "total": paginator.total, "pages": paginator.pages, "timing": paginator.timing()})
+            return written
+
+        if "snapshot" not in options:
+            if shape is None:
+                return make_request(task_vars, method, endpoint, params=params, timeout=timeout, deadline=deadline)
+            if shape.max_items:
+                params["limit"] = shape.max_items
+            return projection.projected_request(task_vars, method, endpoint, shape, params=params, timeout=timeout, deadline=deadline)
+
+        field = options.get("checkpoint_field", "last_updated")
+        if field not in params["include"].split(","):
+            params["include"] = f"{params['include']},{field}"
+
+        state = snapshot.load(options["snapshot"], field, scope=params)
+        previous_checkpoint = state.checkpoint
+
+        # Request only the tasks changed since the checkpoint.  The comparison is
+        # inclusive so tasks sharing the checkpoint value are not missed, the merge
+        # discards the ones that have not changed.
+        query = dict(params)
+        if previous_checkpoint is not None:
+            query[f"gte[{field}]"] = previous_checkpoint
+
+        paginator = pagination.Paginator(
+            task_vars,
+            endpoint,
+            params=query,
+            page_size=parallel.positive_int("page_size", options.get("page_size", pagination.DEFAULT_PAGE_SIZE)),
+            concurrency=parallel.validate_concurrency(options.get("concurrency", 1)),
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+        changed_tasks = []
+        for page in paginator:
+            for task in page:
+                if state.records.get(task.get("_id")) != task:
+                    changed_tasks.append(task)
+
+        state.merge(changed_tasks)
+        state.save()
 
-        return make_request(task_vars, method, endpoint, params=params)
+        result = {
+            "changed": bool(changed_tasks),
+            "json": {"data": changed_tasks, "metadata": {"total": len(changed_tasks)}},
+            "snapshot": options["snapshot"],
+            "snapshot_total": len(state.records),
+            "previous_checkpoint": previous_checkpoint,
+            "checkpoint": state.checkpoint,
+            "pages": paginator.pages,
+            "timing": paginator.timing(),
+        }
+        # The snapshot keeps the full tasks, only the returned ones are projected
+        return result if shape is None else shape.apply(result)
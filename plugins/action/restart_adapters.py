@@ -6,6 +6,13 @@
 # Restarts one or more Itential Platform adapters.
 # Parameters:
 #   adapter_names: A single adapter name (str) or a list of adapter names (list).
+#   concurrency: The maximum number of adapters restarted at the same time (int, default 1).
+#   timeout: Seconds to wait for each response, overriding the read_timeout host option (float).
+#   deadline: Seconds all restarts together may take.  Adapters not restarted by then are
+#             reported as failed (float).
+#
+# Every adapter is restarted even if another restart fails.  Results are returned in the
+# same order as adapter_names, each with the adapter name, its duration and any error.
 #
 # Examples:
 #   - name: Restart a single adapter (string input)
@@ -22,10 +29,26 @@
 #       adapter_names:
 #         - network-adapter
 #         - security-adapter
+#
+#   - name: Restart multiple adapters, four at a time
+#     itential.platform.restart_adapter:
+#       adapter_names: "{{ adapters }}"
+#       concurrency: 4
+#
+#   - name: Restart every adapter, giving up after five minutes
+#     itential.platform.restart_adapter:
+#       adapter_names: "{{ adapters }}"
+#       concurrency: 4
+#       deadline: 300
 
 from ansible.plugins.action import ActionBase
 from ansible_collections.itential.platform.plugins.module_utils.request import make_request
+from ansible_collections.itential.platform.plugins.module_utils import parallel
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import task_timeout, task_deadline
 from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils.profiling import profile_action
+from ansible_collections.itential.platform.plugins.module_utils.tracing import trace_action
+from ansible_collections.itential.platform.plugins.module_utils.metrics import batch_action
 
 class ActionModule(ActionBase):
 
@@ -33,6 +56,9 @@ class ActionModule(ActionBase):
     _supports_async = False
     _requires_connection = False
 
+    @profile_action
+    @trace_action
+    @batch_action
     def run(self, tmp=None, task_vars=None):
         """Restart one or more Itential Platform adapters by making API requests."""
 
@@ -46,11 +72,31 @@ class ActionModule(ActionBase):
         elif not isinstance(adapter_names, list):
             raise AnsibleError("'adapter_names' must be a string or a list of strings.")
 
-        results = []
-        for adapter in adapter_names:
+        concurrency = parallel.validate_concurrency(self._task.args.get("concurrency", 1))
+        timeout = task_timeout(self._task.args)
+        deadline = task_deadline(self._task.args)
+
+        def restart(adapter):
             endpoint = f"/adapters/{adapter}/restart"
             method = "PUT"
-            response = make_request(task_vars, method, endpoint)
+            return make_request(task_vars, method, endpoint, timeout=timeout, deadline=deadline, idempotent=False)
+
+        results = []
+        failed = []
+        for outcome in parallel.run_ordered(restart, adapter_names, concurrency):
+            if outcome.failed:
+                failed.append(outcome.item)
+                response = {"failed": True, "msg": str(outcome.error)}
+            else:
+                response = outcome.result
+            response.update({"adapter": outcome.item, "duration": outcome.duration})
             results.append(response)
 
+        if failed:
+            return {
+                "failed": True,
+                "msg": f"Failed to restart {len(failed)} adapter(s): {', '.join(failed)}",
+                "results": results,
+            }
+
         return {"results": results}
@@ -6,6 +6,16 @@
 # Restarts one or more Itential Platform applications.
 # Parameters:
 #   application_names: A single application name (str) or a list of application names (list).
+#   rolling: Restart the applications in batches, waiting for each batch to report RUNNING
+#            before starting the next one (bool, default false).  An application only
+#            counts as restarted once a health check shows it was down or its uptime is
+#            shorter than the time since the restart was requested.
+#   batch_size: The number of applications restarted together in rolling mode (int, default 1).
+#   pause: Seconds to wait between batches in rolling mode (int, default 0).
+#   wait_timeout: Seconds to wait for each batch to report RUNNING (int, default 300).
+#   timeout: Seconds to wait for each response, overriding the read_timeout host option (float).
+#   deadline: Seconds all restarts together may take, including health checks and pauses.
+#             Applications not restarted by then are reported as failed (float).
 #
 # Examples:
 #   - name: Restart a single application (string input)
@@ -22,10 +32,47 @@
 #       application_names:
 #         - OperationsManager
 #         - ag-manager
+#
+#   - name: Rolling restart, two applications at a time
+#     itential.platform.restart_applications:
+#       application_names: "{{ applications }}"
+#       rolling: true
+#       batch_size: 2
+#       pause: 10
 
+import time
 from ansible.plugins.action import ActionBase
+from ansible.module_utils.parsing.convert_bool import boolean
 from ansible_collections.itential.platform.plugins.module_utils.request import make_request
+from ansible_collections.itential.platform.plugins.module_utils import parallel
+from ansible_collections.itential.platform.plugins.module_utils.polling import poll_until
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import task_timeout, task_deadline
 from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils.profiling import profile_action
+from ansible_collections.itential.platform.plugins.module_utils.tracing import trace_action
+from ansible_collections.itential.platform.plugins.module_utils.metrics import batch_action
+
+RUNNING_STATE = "RUNNING"
+
+# Seconds to wait after a restart before the first health check
+HEALTH_CHECK_DELAY = 1.0
+
+
+def _non_negative_seconds(name, value):
+    """Return value as a number of seconds or raise AnsibleError naming the option name."""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        raise AnsibleError(f"'{name}' must be a non-negative number, got {value!r}")
+    if seconds < 0:
+        raise AnsibleError(f"'{name}' must be a non-negative number, got {value!r}")
+    return seconds
+
+
+def _uptime_reset(health, seconds):
+    """Return True if health reports an uptime of at most seconds."""
+    uptime = health.get("uptime")
+    return isinstance(uptime, (int, float)) and not isinstance(uptime, bool) and uptime <= seconds
 
 class ActionModule(ActionBase):
 
@@ -33,6 +80,9 @@ class ActionModule(ActionBase):
     _supports_async = False
     _requires_connection = False
 
+    @profile_action
+    @trace_action
+    @batch_action
     def run(self, tmp=None, task_vars=None):
         """Restart one or more Itential Platform applications by making API requests."""
 
@@ -46,11 +96,95 @@ class ActionModule(ActionBase):
         elif not isinstance(application_names, list):
             raise AnsibleError("'application_names' must be a string or a list of strings.")
 
+        timeout = task_timeout(self._task.args)
+        deadline = task_deadline(self._task.args)
+
+        if boolean(self._task.args.get("rolling", False)):
+            return self._rolling_restart(task_vars, application_names, timeout, deadline)
+
         results = []
         for app in application_names:
             endpoint = f"/applications/{app}/restart"
             method = "PUT"
-            response = make_request(task_vars, method, endpoint)
+            response = make_request(task_vars, method, endpoint, timeout=timeout, deadline=deadline, idempotent=False)
             results.append(response)
 
         return {"results": results}
+
+    def _rolling_restart(self, task_vars, application_names, timeout=None, deadline=None):
+        """Restart applications in batches, gating each batch on application health."""
+
+        args = self._task.args
+        batch_size = parallel.positive_int("batch_size", args.get("batch_size", 1))
+        pause = _non_negative_seconds("pause", args.get("pause", 0))
+        wait_timeout = _non_negative_seconds("wait_timeout", args.get("wait_timeout", 300))
+
+        def restart(app):
+            sent_at = time.monotonic()
+            response = make_request(task_vars, "PUT", f"/applications/{app}/restart", timeout=timeout, deadline=deadline, idempotent=False)
+            # Never wait for the application past the task deadline
+            wait = wait_timeout if deadline is None else min(wait_timeout, deadline.remaining())
+
+            # The instance running before the restart may still answer the first health
+            # checks, so RUNNING only counts once the application was seen down or its
+            # uptime shows it started after the restart was requested
+            restarted = []
+
+            def check():
+                health = self._application_health(task_vars, app, timeout, deadline)
+                if health is None or health.get("state") != RUNNING_STATE:
+                    restarted.append(True)
+                    return None
+                if restarted or _uptime_reset(health, time.monotonic() - sent_at):
+                    return RUNNING_STATE
+                return None
+
+            state, attempts = poll_until(check, wait, delay=HEALTH_CHECK_DELAY)
+            if not state:
+                raise AnsibleError(f"Application '{app}' did not report {RUNNING_STATE} after restarting within {wait:g} seconds")
+            response.update({"state": state, "health_checks": attempts})
+            return response
+
+        results = []
+        batches = [application_names[i:i + batch_size] for i in range(0, len(application_names), batch_size)]
+
+        for index, batch in enumerate(batches):
+            if index and pause:
+                time.sleep(pause if deadline is None else min(pause, deadline.remaining()))
+
+            failed = []
+            for outcome in parallel.run_ordered(restart, batch, batch_size):
+                if outcome.failed:
+                    failed.append(outcome.item)
+                    response = {"failed": True, "msg": str(outcome.error)}
+                else:
+                    response = outcome.result
+                response.update({"application": outcome.item, "duration": outcome.duration})
+                results.append(response)
+
+            # Stop before touching the next batch so the Platform is never left with
+            # more applications down than a single batch
+            if failed:
+                return {
+                    "failed": True,
+                    "msg": f"Rolling restart stopped, failed to restart: {', '.join(failed)}",
+                    "results": results,
+                    "skipped_applications": [app for later in batches[index + 1:] for app in later],
+                }
+
+        return {"results": results}
+
+    def _application_health(self, task_vars, app, timeout=None, deadline=None):
+        """Return the health of app, or None if it did not answer."""
+
+        try:
+            response = make_request(task_vars, "GET", f"/health/applications/{app}", timeout=timeout, deadline=deadline)
+        except AnsibleError:
+            # The application may not answer health checks while it is restarting
+            return None
+
+        health = response.get("json") or {}
+        if isinstance(health.get("results"), list):
+            health = next((r for r in health["results"] if r.get("id") == app), {})
+
+        return health
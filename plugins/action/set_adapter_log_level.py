@@ -9,6 +9,7 @@
 #   adapter_name: Name of the adapter (e.g., "network-adapter")
 #   log_level: Desired log level ("debug", "info", "warn", "error")
 #   transport: Logging transport ("file" or "console")
+#   timeout: Seconds to wait for the response, overriding the read_timeout host option (float)
 #
 # Example usage:
 #   - name: Set adapter logging to debug using file transport
@@ -19,7 +20,11 @@
 
 from ansible.plugins.action import ActionBase
 from ansible_collections.itential.platform.plugins.module_utils.request import make_request
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import task_timeout
 from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils.profiling import profile_action
+from ansible_collections.itential.platform.plugins.module_utils.tracing import trace_action
+from ansible_collections.itential.platform.plugins.module_utils.metrics import batch_action
 
 class ActionModule(ActionBase):
 
@@ -27,6 +32,9 @@ class ActionModule(ActionBase):
     _supports_async = False
     _requires_connection = False
 
+    @profile_action
+    @trace_action
+    @batch_action
     def run(self, tmp=None, task_vars=None):
         adapter_name = self._task.args.get("adapter_name")
         log_level = self._task.args.get("log_level")
@@ -45,5 +53,5 @@ class ActionModule(ActionBase):
             }
         }
 
-        return make_request(task_vars, method, endpoint, data=data)
+        return make_request(task_vars, method, endpoint, data=data, timeout=task_timeout(self._task.args))
 
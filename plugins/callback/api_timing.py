@@ -0,0 +1,212 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+name: api_timing
+author: Itential
+type: aggregate
+short_description: Aggregate Itential Platform API latency per endpoint across a run.
+description:
+  - Collects the C(timing) block returned by the requests sent by the modules of this
+    collection and, at the end of the run, displays one row per method and endpoint with
+    the number of requests, the p50, p95 and p99 latency, the bytes received, the number of
+    errors and the number of logins performed.
+  - Failed tasks of this collection that returned no timing are counted as an error of
+    their C(endpoint) argument, or of the module when it has none.
+  - The same data can also be written to a JSON file for tracking trends across runs.
+requirements:
+  - Enable the callback with C(callbacks_enabled = itential.platform.api_timing) in the
+    C([defaults]) section of C(ansible.cfg).
+options:
+  output_file:
+    description:
+      - The path of a file on the controller to write the aggregated data to as JSON.
+      - The file is replaced at the end of every run.
+    type: path
+    env:
+      - name: ITENTIAL_API_TIMING_OUTPUT_FILE
+    ini:
+      - section: callback_api_timing
+        key: output_file
+  display:
+    description:
+      - Display the table at the end of the run.
+    type: bool
+    default: true
+    env:
+      - name: ITENTIAL_API_TIMING_DISPLAY
+    ini:
+      - section: callback_api_timing
+        key: display
+"""
+
+import datetime
+import json
+import math
+from ansible.plugins.callback import CallbackBase
+from ansible_collections.itential.platform.plugins.module_utils import download
+
+# Prefix of the fully qualified names of the modules in this collection
+COLLECTION_PREFIX = "itential.platform."
+
+# Percentiles reported for every endpoint
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, pct):
+    """Return the pct percentile of values using linear interpolation, or None if empty."""
+    if not values:
+        return None
+    values = sorted(values)
+    rank = (len(values) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def find_timings(result):
+    """Yield every request timing in a task result, including those of loop items and results lists."""
+    if not isinstance(result, dict):
+        return
+    timing = result.get("timing")
+    if isinstance(timing, dict) and "ttfb" in timing:
+        yield timing
+    for item in result.get("results") or ():
+        yield from find_timings(item)
+
+
+class EndpointStats(object):
+    """Requests sent to one method and endpoint."""
+
+    def __init__(self, method, endpoint):
+        self.method = method
+        self.endpoint = endpoint
+        self.latencies = []
+        self.bytes = 0
+        self.errors = 0
+        self.logins = 0
+
+    def add(self, timing):
+        # Combined timings, such as those of paginated results, keep the latency of every request
+        self.latencies.extend(timing.get("latencies") or [timing["total"]])
+        self.bytes += timing.get("bytes") or 0
+        self.errors += timing.get("errors") or 0
+        if "logins" in timing:
+            self.logins += timing["logins"]
+        elif timing.get("token_source") == "login":
+            self.logins += 1
+
+    def as_dict(self):
+        summary = {
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "count": len(self.latencies),
+        }
+        for pct in PERCENTILES:
+            summary[f"p{pct}"] = percentile(self.latencies, pct)
+        summary.update({
+            "total": sum(self.latencies),
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "logins": self.logins,
+        })
+        return summary
+
+
+class CallbackModule(CallbackBase):
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "itential.platform.api_timing"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, *args, **kwargs):
+        super(CallbackModule, self).__init__(*args, **kwargs)
+        self.endpoints = {}
+        self.playbook = None
+        self.started = datetime.datetime.now(datetime.timezone.utc)
+
+    def _stats(self, method, endpoint):
+        key = (method or "", endpoint or "")
+        if key not in self.endpoints:
+            self.endpoints[key] = EndpointStats(method, endpoint)
+        return self.endpoints[key]
+
+    def _record(self, result, failed=False):
+        found = False
+        for timing in find_timings(result._result):
+            self._stats(timing.get("method"), timing.get("endpoint")).add(timing)
+            found = True
+
+        if failed and not found:
+            task = result._task
+            action = getattr(task, "resolved_action", None) or task.action
+            if action.startswith(COLLECTION_PREFIX):
+                args = task.args or {}
+                self._stats(args.get("method", "GET") if "endpoint" in args else None, args.get("endpoint") or action).errors += 1
+
+    def v2_playbook_on_start(self, playbook):
+        self.playbook = getattr(playbook, "_file_name", None)
+
+    def v2_runner_on_ok(self, result):
+        self._record(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._record(result, failed=True)
+
+    def summary(self):
+        """Return the aggregated data, the slowest endpoints by total time first."""
+        endpoints = [stats.as_dict() for stats in self.endpoints.values()]
+        endpoints.sort(key=lambda summary: summary["total"], reverse=True)
+        return {
+            "playbook": self.playbook,
+            "started": self.started.isoformat(),
+            "finished": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "endpoints": endpoints,
+        }
+
+    def v2_playbook_on_stats(self, stats):
+        if not self.endpoints:
+            return
+
+        summary = self.summary()
+
+        if self.get_option("display"):
+            self._display.banner("ITENTIAL PLATFORM API TIMING")
+            for line in format_table(summary["endpoints"]):
+                self._display.display(line)
+
+        output_file = self.get_option("output_file")
+        if output_file:
+            data = json.dumps(summary, indent=2).encode("utf-8")
+            download.write_atomic(output_file, [data])
+
+
+def format_table(endpoints):
+    """Return the lines of a table with one row per endpoint summary."""
+    headers = ["METHOD", "ENDPOINT", "COUNT"] + [f"P{pct}" for pct in PERCENTILES] + ["BYTES", "ERRORS", "LOGINS"]
+    rows = []
+    for summary in endpoints:
+        rows.append(
+            [summary["method"] or "-", summary["endpoint"] or "-", str(summary["count"])]
+            + [_seconds(summary[f"p{pct}"]) for pct in PERCENTILES]
+            + [str(summary["bytes"]), str(summary["errors"]), str(summary["logins"])]
+        )
+
+    widths = [max(len(row[i]) for row in [headers] + rows) for i in range(len(headers))]
+    lines = []
+    for row in [headers] + rows:
+        cells = [cell.ljust(width) if i < 2 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths))]
+        lines.append("  ".join(cells).rstrip())
+    return lines
+
+
+def _seconds(value):
+    return "-" if value is None else f"{value:.3f}s"
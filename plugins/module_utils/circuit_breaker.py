@@ -0,0 +1,114 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides a per-host circuit breaker for Itential Platform requests.
+# It handles:
+# - Counting consecutive failures (connection errors, timeouts and 502, 503 and 504
+# responses) for each host and port.
+# - Opening the circuit after `circuit_breaker_threshold` consecutive failures, after
+# which requests to the host fail immediately instead of waiting out a timeout.
+# - Allowing a single half-open probe request once `circuit_breaker_reset_timeout`
+# seconds have passed; the circuit closes if the probe succeeds and opens again if not.
+# - Sharing breaker state between every task and thread in the process.
+
+import threading
+import time
+from ansible.errors import AnsibleError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_STATUS_CODES = frozenset((502, 503, 504))
+
+# Breakers keyed by (host, port)
+_BREAKERS = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+class CircuitOpenError(AnsibleError):
+    """Raised when a request is rejected because the host's circuit is open."""
+
+
+class CircuitBreaker(object):
+    """Tracks the health of a single host."""
+
+    def __init__(self, name, threshold=5, reset_timeout=30.0):
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.opened_count = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """Raise CircuitOpenError if a request to the host must not be sent."""
+        if not self.threshold:
+            return
+
+        with self._lock:
+            if self.state == CLOSED:
+                return
+
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if self.state == OPEN and remaining <= 0:
+                self.state = HALF_OPEN
+
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+
+            raise CircuitOpenError(
+                f"Circuit breaker open for {self.name} after {self.failures} consecutive failures, "
+                f"retrying in {max(0.0, remaining):.1f}s"
+            )
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        if not self.threshold:
+            return
+
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.threshold:
+                if self.state != OPEN:
+                    self.opened_count += 1
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self._probing = False
+
+    def record(self, resp=None, error=None):
+        """Record the outcome of a request that was sent."""
+        if error is not None or resp.status_code in FAILURE_STATUS_CODES:
+            self.record_failure()
+        else:
+            self.record_success()
+
+
+def get_breaker(host):
+    """Return the circuit breaker shared by every request to host."""
+    key = (host.host, host.port)
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(key)
+        if breaker is None:
+            name = f"{host.host}:{host.port}" if host.port else host.host
+            breaker = CircuitBreaker(name, host.circuit_breaker_threshold, host.circuit_breaker_reset_timeout)
+            _BREAKERS[key] = breaker
+        return breaker
+
+
+def reset_breakers():
+    """Discard the state of every circuit breaker."""
+    with _BREAKERS_LOCK:
+        _BREAKERS.clear()
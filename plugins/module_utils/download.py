@@ -0,0 +1,133 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides helpers for writing response bodies to files on the controller.
+# It handles:
+# - Writing a body chunk by chunk to a temporary file next to the destination and moving
+# it into place atomically, so a failed download never leaves a partial file behind.  The
+# file keeps the mode of the file it replaces, or gets the mode a newly created file would
+# have under the current umask.
+# - Checksumming the body while it is written and leaving the destination untouched when
+# its content has not changed.
+# - Verifying the destination against an expected `<algorithm>:<hex digest>` checksum.
+# - Remembering the `ETag` of a downloaded body in a hidden file next to the destination
+# so the next download can be made conditional with `If-None-Match`.
+
+import hashlib
+import os
+import stat
+import tempfile
+from ansible.errors import AnsibleError
+
+# Number of bytes read from a response and written to disk at a time
+CHUNK_SIZE = 64 * 1024
+
+DEFAULT_CHECKSUM_ALGORITHM = "sha256"
+
+
+def _abspath(dest):
+    return os.path.abspath(os.path.expanduser(dest))
+
+
+def parse_checksum(checksum):
+    """Split an `<algorithm>:<hex digest>` checksum, raising AnsibleError if it is malformed."""
+    algorithm, sep, digest = (checksum or "").partition(":")
+    algorithm = algorithm.strip().lower()
+    if not sep or not digest.strip() or algorithm not in hashlib.algorithms_available:
+        raise AnsibleError(f"'checksum' must be given as <algorithm>:<hex digest>, got {checksum!r}")
+    return algorithm, digest.strip().lower()
+
+
+def file_checksum(path, algorithm=DEFAULT_CHECKSUM_ALGORITHM):
+    """Return the hex digest of the file at path, or None if it does not exist."""
+    digest = hashlib.new(algorithm)
+    try:
+        with open(_abspath(path), "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def _file_mode(path):
+    """Return the permission bits to give the file written to path."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_atomic(dest, chunks, algorithm=DEFAULT_CHECKSUM_ALGORITHM, expected=None):
+    """Atomically write the byte strings in chunks to dest.
+
+    Returns a dict with the size and checksum of the content and whether
+    dest changed.  When dest already holds the same content it is left
+    untouched.  When expected is given and the content's hex digest differs
+    dest is left untouched and AnsibleError is raised.
+    """
+    dest = _abspath(dest)
+    digest = hashlib.new(algorithm)
+    size = 0
+
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), prefix=".tmp-")
+    try:
+        # mkstemp() creates the file readable by its owner only
+        os.fchmod(fd, _file_mode(dest))
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                if chunk:
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+
+        checksum = digest.hexdigest()
+        if expected is not None and checksum != expected:
+            raise AnsibleError(f"Checksum mismatch for {dest}: expected {algorithm}:{expected}, got {algorithm}:{checksum}")
+
+        changed = file_checksum(dest, algorithm) != checksum
+        if changed:
+            os.replace(tmp, dest)
+        else:
+            os.remove(tmp)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return {"size": size, "checksum": f"{algorithm}:{checksum}", "changed": changed}
+
+
+def _etag_path(dest):
+    dest = _abspath(dest)
+    return os.path.join(os.path.dirname(dest), f".{os.path.basename(dest)}.etag")
+
+
+def load_etag(dest):
+    """Return the ETag remembered for dest, or None if there is none or dest is gone."""
+    if not os.path.exists(_abspath(dest)):
+        return None
+    try:
+        with open(_etag_path(dest), "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def save_etag(dest, etag):
+    """Remember etag for dest, or forget the previous one when etag is empty."""
+    path = _etag_path(dest)
+    if not etag:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(etag)
@@ -60,6 +60,34 @@ options:
     vars:
       - platform_auth_token
 
+  token_cache_ttl:
+    description:
+      - The number of seconds an authentication token obtained by logging in
+        is reused for subsequent requests to the same host, port and username
+      - Set to 0 to disable token caching and log in on every request
+    type: int
+    default: 600
+    vars:
+      - platform_token_cache_ttl
+
+  token_cache_shared:
+    description:
+      - Enable or disable sharing cached authentication tokens between Ansible
+        worker processes on the controller through an on-disk token store
+    type: bool
+    default: true
+    vars:
+      - platform_token_cache_shared
+
+  token_cache_dir:
+    description:
+      - The controller directory used by the on-disk token store.  Defaults
+        to C(~/.ansible/itential_platform/tokens).  If the directory cannot be
+        used, tokens are only cached within each worker process
+    type: str
+    vars:
+      - platform_token_cache_dir
+
   use_tls:
     description:
       - Enable or disable the use of TLS for the connection
@@ -98,6 +126,149 @@ options:
     vars:
       - platform_http_verify
 
+  connect_timeout:
+    description:
+      - The number of seconds to wait for a connection to the host to be
+        established.  Set to 0 to wait indefinitely
+    type: float
+    default: 10
+    vars:
+      - platform_http_connect_timeout
+
+  read_timeout:
+    description:
+      - The number of seconds to wait for the host to send a response once
+        the connection is established.  Set to 0 to wait indefinitely
+    type: float
+    default: 120
+    vars:
+      - platform_http_read_timeout
+
+  pool_maxsize:
+    description:
+      - The maximum number of keep-alive connections kept open to the host by
+        each Ansible worker process
+    type: int
+    default: 10
+    vars:
+      - platform_http_pool_maxsize
+
+  pool_idle_timeout:
+    description:
+      - The number of seconds a pooled connection may sit idle before it is
+        discarded and a new connection is opened.  Set to 0 to never discard
+        idle connections
+    type: int
+    default: 60
+    vars:
+      - platform_http_pool_idle_timeout
+
+  retries:
+    description:
+      - The number of times a request is retried after a transient failure
+        (a connection error, a timeout or a 429, 502, 503 or 504 response)
+    type: int
+    default: 2
+    vars:
+      - platform_http_retries
+
+  retry_backoff:
+    description:
+      - The base delay in seconds between retries.  The delay doubles after
+        every attempt and a random jitter is applied.  A C(Retry-After)
+        header sent by the server takes precedence
+    type: float
+    default: 0.5
+    vars:
+      - platform_http_retry_backoff
+
+  retry_max_backoff:
+    description:
+      - The maximum delay in seconds between retries
+    type: float
+    default: 30
+    vars:
+      - platform_http_retry_max_backoff
+
+  retry_methods:
+    description:
+      - The HTTP methods that are retried.  Only idempotent methods are
+        retried by default.  Requests that are not idempotent, such as
+        adapter and application restarts, are only retried when the
+        connection could not be opened or the response was 429, so a restart
+        the server accepted is never sent again.  Generic and batch requests
+        are only treated as idempotent for C(GET) unless their C(idempotent)
+        option is set
+    type: list
+    elements: str
+    default: [ "GET", "PUT", "DELETE" ]
+    vars:
+      - platform_http_retry_methods
+
+  circuit_breaker_threshold:
+    description:
+      - The number of consecutive failed requests (connection errors,
+        timeouts and 502, 503 or 504 responses) after which requests to the
+        host fail immediately.  Set to 0 to disable the circuit breaker
+    type: int
+    default: 5
+    vars:
+      - platform_http_circuit_breaker_threshold
+
+  circuit_breaker_reset_timeout:
+    description:
+      - The number of seconds the circuit stays open before a single probe
+        request is allowed through to test whether the host has recovered
+    type: float
+    default: 30
+    vars:
+      - platform_http_circuit_breaker_reset_timeout
+
+  metrics_file:
+    description:
+      - The controller file to export client-side request metrics to, for the
+        node_exporter textfile collector.  The file holds request duration
+        histograms by endpoint, method and status along with login, retry and
+        circuit breaker counters, accumulated across every worker process and
+        run and written once per task.  Endpoints are labelled by template,
+        with adapter and application names and ID-like path segments replaced
+        by placeholders.  Metrics are not recorded when unset
+    type: str
+    vars:
+      - platform_metrics_file
+
+  trace_file:
+    description:
+      - The controller file to append tracing spans to, one JSON document per
+        line in the shape of the OpenTelemetry span data model.  A span is
+        recorded for every action, API request and login, linked to its
+        parent so serial and concurrent requests can be told apart.  Tracing
+        is off when unset
+    type: str
+    vars:
+      - platform_trace_file
+
+  profile_dir:
+    description:
+      - The controller directory to write a cProfile C(.pstats) file to for
+        every task run against the host.  The ITENTIAL_PLATFORM_PROFILE_DIR
+        environment variable sets it for every host.  Profiling is off when
+        unset
+    type: str
+    vars:
+      - platform_profile_dir
+
+  profile_memory:
+    description:
+      - Also trace memory allocations with tracemalloc while profiling and
+        write the peak usage and top allocating source lines of every task
+        next to its C(.pstats) file.  The ITENTIAL_PLATFORM_PROFILE_MEMORY
+        environment variable sets it for every host
+    type: bool
+    default: false
+    vars:
+      - platform_profile_memory
+
   disable_warnings:
     description:
       - Enable or disable warning messages
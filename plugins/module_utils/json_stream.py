@@ -0,0 +1,173 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides incremental parsing of large JSON responses.
+# It handles:
+# - Decoding a JSON document from a stream of byte chunks without holding the whole
+# document, or the structure built from it, in memory.
+# - Locating the array found at a path of object keys (for example `data` in the
+# `{"data": [...], "metadata": {...}}` responses of Itential Platform list endpoints) and
+# yielding its items one at a time.
+# - Collecting the other members of the objects along the path, such as `metadata`, so
+# they are available once iteration is done.
+#
+# Only the items of the array are parsed one at a time.  Every other value is decoded in
+# full, so the array should be the only large value in the document.
+
+import codecs
+import json
+from ansible.errors import AnsibleError
+
+_WHITESPACE = " \t\n\r"
+
+# Characters that can continue a number that raw_decode() stopped short of
+_NUMBER_CHARS = "0123456789.eE+-"
+
+# Consumed characters are dropped from the buffer once there are at least this many
+_COMPACT_SIZE = 64 * 1024
+
+_DECODER = json.JSONDecoder()
+
+
+class ArrayStream(object):
+    """Iterate over the items of the JSON array found at path in a streamed document.
+
+    chunks is an iterable of byte strings.  path is a sequence of object keys
+    leading to the array; an empty path means the document itself is an array.
+    After iteration, found tells whether the array was present and siblings
+    holds every other member of the objects along path, nested the same way
+    as in the document.
+    """
+
+    def __init__(self, chunks, path=("data",), encoding="utf-8"):
+        self.path = tuple(path)
+        self.found = False
+        self.siblings = {}
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        yield from self._walk(0, self.siblings)
+        self._skip_ws()
+        if self._pos < len(self._buf):
+            self._error("Extra data after the JSON document")
+
+    def close(self):
+        """Stop reading, closing chunks if it supports it."""
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+    def _fill(self):
+        """Read the next chunk into the buffer, returning False at the end of the stream."""
+        if self._eof:
+            return False
+        if self._pos >= _COMPACT_SIZE:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buf += text
+                return True
+        self._buf += self._decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _error(self, msg):
+        raise AnsibleError(f"Failed to parse JSON response: {msg}")
+
+    def _skip_ws(self):
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf) or not self._fill():
+                return
+
+    def _peek(self):
+        self._skip_ws()
+        if self._pos >= len(self._buf):
+            self._error("Unexpected end of document")
+        return self._buf[self._pos]
+
+    def _expect(self, char):
+        if self._peek() != char:
+            self._error(f"Expected {char!r} at {self._buf[self._pos:self._pos + 20]!r}")
+        self._pos += 1
+
+    def _value(self):
+        """Decode the complete JSON value at the current position."""
+        self._skip_ws()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                self._error(str(exc))
+            # A number that runs up to the end of the buffer, possibly followed by
+            # an incomplete fraction or exponent such as `1.` or `2e-`, may
+            # continue in the next chunk
+            if isinstance(value, (int, float)) and self._number_may_continue(end) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _number_may_continue(self, end):
+        return all(char in _NUMBER_CHARS for char in self._buf[end:])
+
+    def _walk(self, depth, siblings):
+        if depth == len(self.path):
+            self.found = True
+            yield from self._items()
+            return
+
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                self._error(f"Expected an object key, got {key!r}")
+            self._expect(":")
+
+            if key == self.path[depth] and not self.found:
+                if self._peek() == ("[" if depth + 1 == len(self.path) else "{"):
+                    child = siblings.setdefault(key, {}) if depth + 1 < len(self.path) else siblings
+                    yield from self._walk(depth + 1, child)
+                else:
+                    siblings[key] = self._value()
+            else:
+                siblings[key] = self._value()
+
+            if self._peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("}")
+            return
+
+    def _items(self):
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self._value()
+            if self._peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("]")
+            return
+
+
+def iter_array(chunks, path=("data",), encoding="utf-8"):
+    """Yield the items of the JSON array found at path in the streamed document chunks."""
+    return iter(ArrayStream(chunks, path, encoding))
@@ -8,21 +8,48 @@
 # - Constructing a login request with the proper URL, headers, and JSON-encoded credentials.
 # - Validating required properties (username and password) before sending the request.
 # - Sending a POST request to the Itential Platform's `/login` endpoint using TLS or non-TLS 
-# based on the host object.
+# based on the host object, reusing the host's pooled keep-alive session and honoring the
+# host's connect and read timeouts.
 # - Handling exceptions, including missing credentials, connection issues, and unexpected 
 # HTTP responses.
 # - Returning the authentication token or response text if the login is successful.
 # - Logging request details (URL and payload type) for debugging purposes.
+# - Recording a `login` span when the request or action that needs the token is traced.
 #
 # The function `login()` is used by Ansible modules and utilities to retrieve authentication 
 # tokens for subsequent API requests.
+#
+# The function `get_token()` wraps `login()` with a per-process token cache keyed by host,
+# port and username so repeated requests to the same Itential Platform reuse a valid token
+# instead of logging in again.  When `token_cache_shared` is enabled the cache is backed by
+# the on-disk `token_store` so other Ansible worker processes reuse the token as well.
+# Concurrent callers are collapsed into a single login per host, port and username.
+# Cached tokens expire after `token_cache_ttl` seconds and can be dropped explicitly with
+# `invalidate_token()` or `clear_token_cache()`.  Callers can ask `get_token()` where the
+# token came from to report it in their results.  A token store that cannot be used, for
+# example because `token_cache_dir` is not writable, never fails a request; the token is
+# then only cached in this process.
 
 import json
+import threading
+import time
+from contextlib import ExitStack, contextmanager
 from ansible.errors import AnsibleError
 from ansible_collections.itential.core.plugins.module_utils import display
 from ansible_collections.itential.core.plugins.module_utils import http
+from ansible_collections.itential.platform.plugins.module_utils import session
+from ansible_collections.itential.platform.plugins.module_utils import metrics
+from ansible_collections.itential.platform.plugins.module_utils import tracing
+from ansible_collections.itential.platform.plugins.module_utils import token_store
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import request_timeout
+
+def login(host, timeout=None):
+    # Only traced as part of the request or action that needed the token
+    with tracing.span("login", kind=tracing.CLIENT, attributes={"server.address": host.host, "server.port": host.port}):
+        return _login(host, timeout)
+
 
-def login(host):
+def _login(host, timeout=None):
     if not host.username or not host.password:
         raise AnsibleError("missing required property: username or password")
 
@@ -31,7 +58,7 @@ def login(host):
         "password": host.password,
     }
 
-    headers = host.headers or {}
+    headers = dict(host.headers or {})
     headers.update({
         "content-type": "application/json",
         "accept": "application/json"
@@ -44,17 +71,155 @@ def login(host):
     display.v(type(data))
 
     try:
-        resp = http.send_request(
+        resp = session.send_request(
+            host,
             method="POST",
             url=url,
             headers=headers,
             data=data,
             verify=host.verify,
             disable_warnings=host.disable_warnings,
+            timeout=request_timeout(host, timeout),
         )
         if resp.status_code != 200:
             raise AnsibleError(f"Unexpected HTTP status code in response: {resp.status_code} {resp.text}")
     except Exception as exc:
         raise AnsibleError(f"HTTP request failed: {str(exc)}")
 
+    metrics.record_login(host)
     return resp.text
+
+
+# Cached authentication tokens keyed by (host, port, username).  Each value is
+# a (token, expires_at) tuple where expires_at is a time.monotonic() timestamp.
+_TOKEN_CACHE = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+# Per-key locks used to elect a single thread to log in for each host, port
+# and username.
+_LOGIN_LOCKS = {}
+
+
+def _cache_key(host):
+    return (host.host, host.port, host.username)
+
+
+def get_token(host, timeout=None, info=None):
+    """Return a valid auth token for host, logging in only when needed.
+
+    Concurrent callers for the same host, port and username are collapsed
+    into a single login.  Threads in this process wait on a per-key lock and
+    other worker processes wait on a lock file in the token store, then reuse
+    the token obtained by whichever caller logged in first.  timeout
+    overrides the host's read timeout for the login request.  When info is a
+    dict its `token_source` is set to `login`, `cache` or `shared_cache`.
+    """
+    if info is None:
+        info = {}
+    info["token_source"] = "login"
+
+    ttl = host.token_cache_ttl
+    if not ttl or ttl <= 0:
+        display.vvv("Generating new Itential Platform Auth Token")
+        return login(host, timeout)
+
+    key = _cache_key(host)
+
+    token = _lookup(key)
+    if token is not None:
+        display.vvv("Using cached Itential Platform Auth Token")
+        info["token_source"] = "cache"
+        return token
+
+    with _login_lock(key):
+        # Another thread may have logged in while this one was waiting
+        token = _lookup(key)
+        if token is not None:
+            display.vvv("Using cached Itential Platform Auth Token")
+            info["token_source"] = "cache"
+            return token
+
+        if not host.token_cache_shared:
+            return _login_and_remember(host, key, ttl, timeout)
+
+        with _store_login_lock(host):
+            # Another process may have logged in while this one was waiting
+            stored = _store_call(token_store.load, host)
+            if stored is not None:
+                display.vvv("Using shared cached Itential Platform Auth Token")
+                info["token_source"] = "shared_cache"
+                token, expires_at = stored
+                _remember(key, token, min(ttl, expires_at - time.time()))
+                return token
+
+            token = _login_and_remember(host, key, ttl, timeout)
+            _store_call(token_store.save, host, token, ttl)
+
+    return token
+
+
+def _store_call(func, *args):
+    """Call a token_store function, returning None if the store cannot be used."""
+    try:
+        return func(*args)
+    except OSError as exc:
+        display.vvv(f"Itential Platform token store unavailable, using the process cache only: {exc}")
+        return None
+
+
+@contextmanager
+def _store_login_lock(host):
+    """Hold the token store login lock for host, or proceed without it if the store cannot be used."""
+    with ExitStack() as stack:
+        _store_call(stack.enter_context, token_store.login_lock(host))
+        yield
+
+
+def _lookup(key):
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+    return None
+
+
+def _login_lock(key):
+    with _TOKEN_CACHE_LOCK:
+        return _LOGIN_LOCKS.setdefault(key, threading.Lock())
+
+
+def _login_and_remember(host, key, ttl, timeout=None):
+    display.vvv("Generating new Itential Platform Auth Token")
+    token = login(host, timeout)
+    _remember(key, token, ttl)
+    return token
+
+
+def _remember(key, token, ttl):
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = (token, time.monotonic() + ttl)
+
+
+def invalidate_token(host, token=None):
+    """Remove the cached token for host.
+
+    If token is given, the entry is only removed when it still holds that
+    token so a token refreshed by another caller is not thrown away.
+    """
+    key = _cache_key(host)
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+        if entry is not None and (token is None or entry[0] == token):
+            del _TOKEN_CACHE[key]
+
+    if host.token_cache_shared:
+        _store_call(token_store.evict, host, token)
+
+
+def clear_token_cache():
+    """Remove all tokens cached in this process.
+
+    Tokens in the on-disk store are left in place for other processes.
+    """
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE.clear()
@@ -0,0 +1,270 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides client-side metrics for Itential Platform requests, exported to a
+# textfile that the node_exporter textfile collector can pick up.
+# It handles:
+# - Recording a histogram of request durations by host, method, endpoint and status.
+# - Counting retries by host, method and endpoint, logins by host and the number of times
+# a host's circuit breaker opened.
+# - Labelling requests by endpoint template rather than raw path, replacing adapter and
+# application names and ID-like path segments with placeholders and folding endpoints
+# beyond `MAX_ENDPOINTS` into `other`, so the number of series stays bounded.
+# - Accumulating the metrics of every Ansible worker process (fork) and every run in a
+# JSON state file next to the textfile, updated under an `fcntl.flock()` lock.
+# - Batching the updates made while an action plugin runs into a single update when it
+# finishes, and rewriting the textfile atomically so a scrape never reads a partial file.
+#
+# Metrics are only recorded when the host's `metrics_file` option is set.  Each update
+# rewrites two small files, so the cost grows with the number of series rather than the
+# number of requests.  The textfile uses the Prometheus text exposition format read by
+# node_exporter.  A metrics file that cannot be written never fails a request.
+
+import contextvars
+import fcntl
+import functools
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from ansible_collections.itential.core.plugins.module_utils import display
+from ansible_collections.itential.platform.plugins.module_utils import download
+
+PREFIX = "itential_platform"
+
+# Upper bounds, in seconds, of the request duration histogram buckets
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Number of distinct endpoint labels kept per metrics file, others are labelled `other`
+MAX_ENDPOINTS = 200
+
+# Paths whose next segment names an adapter or application
+_NAMED_ROUTES = (
+    re.compile(r"^(/adapters/)[^/]+"),
+    re.compile(r"^(/applications/)[^/]+"),
+    re.compile(r"^(/health/adapters/)[^/]+"),
+    re.compile(r"^(/health/applications/)[^/]+"),
+)
+
+# Path segments that look like identifiers: numbers, hex ids such as MongoDB ObjectIds
+# and UUIDs
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{16,}|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$")
+
+HELP = {
+    "request_duration_seconds": "Duration of Itential Platform API requests, including retries.",
+    "request_retries_total": "Retries of Itential Platform API requests.",
+    "logins_total": "Logins performed against Itential Platform.",
+    "circuit_breaker_opens_total": "Times the circuit breaker of an Itential Platform host opened.",
+}
+
+
+def _metrics_file(host):
+    path = getattr(host, "metrics_file", None)
+    return os.path.abspath(os.path.expanduser(path)) if isinstance(path, str) and path else None
+
+
+def _host_label(host):
+    return f"{host.host}:{host.port}" if host.port else host.host
+
+
+def _state_path(path):
+    return os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.state")
+
+
+@contextmanager
+def _locked(path):
+    fd = os.open(f"{_state_path(path)}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _load(path):
+    try:
+        with open(_state_path(path), "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {}
+    state.setdefault("histograms", {})
+    state.setdefault("counters", {})
+    return state
+
+
+def _key(name, labels):
+    return json.dumps([name, sorted(labels.items())], separators=(",", ":"))
+
+
+def endpoint_label(endpoint):
+    """Return the endpoint label of a request path.
+
+    The query string is dropped, adapter and application names are replaced
+    with `{name}` and ID-like segments with `{id}`.
+    """
+    path = endpoint.split("?", 1)[0]
+    for route in _NAMED_ROUTES:
+        path = route.sub(r"\1{name}", path)
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+class _Batch(object):
+    """Changes to the metrics files recorded while an action runs."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.changes = {}
+
+    def add(self, path, apply):
+        with self.lock:
+            self.changes.setdefault(path, []).append(apply)
+
+
+_BATCH = contextvars.ContextVar("itential_platform_metrics_batch", default=None)
+
+
+def _write(path, changes):
+    """Apply changes to the metrics in path and rewrite the textfile."""
+    try:
+        with _locked(path):
+            state = _load(path)
+            for apply in changes:
+                apply(state)
+            data = json.dumps(state, separators=(",", ":")).encode("utf-8")
+            download.write_atomic(_state_path(path), [data])
+            download.write_atomic(path, [render(state).encode("utf-8")])
+    except OSError as exc:
+        display.vvv(f"Failed to write Itential Platform metrics to {path}: {exc}")
+
+
+def _update(host, apply):
+    """Apply a change to the metrics of host, now or when the current batch ends."""
+    path = _metrics_file(host)
+    if path is None:
+        return
+
+    batch = _BATCH.get()
+    if batch is not None:
+        batch.add(path, apply)
+    else:
+        _write(path, [apply])
+
+
+@contextmanager
+def batch():
+    """Collect the metrics recorded in the body of the with statement and write them once.
+
+    The batch is carried into the threads `parallel.run_ordered()` runs
+    calls on.  Nested batches are part of the outermost one.
+    """
+    if _BATCH.get() is not None:
+        yield
+        return
+
+    current = _BATCH.set(_Batch())
+    try:
+        yield
+    finally:
+        changes = _BATCH.get().changes
+        _BATCH.reset(current)
+        for path, applied in changes.items():
+            _write(path, applied)
+
+
+def batch_action(run):
+    """Decorate an action plugin's run() method to write the metrics it records once."""
+
+    @functools.wraps(run)
+    def wrapper(self, tmp=None, task_vars=None):
+        with batch():
+            return run(self, tmp=tmp, task_vars=task_vars)
+
+    return wrapper
+
+
+def _increment(state, name, labels, value=1):
+    key = _key(name, labels)
+    state["counters"][key] = state["counters"].get(key, 0) + value
+
+
+def record_request(host, method, endpoint, status, seconds, retries=0):
+    """Record a request that finished with status after seconds.
+
+    status is the final HTTP status code, or `error` when no response was
+    received.  endpoint is labelled with `endpoint_label()`.
+    """
+    label = endpoint_label(endpoint)
+
+    def apply(state):
+        endpoints = state.setdefault("endpoints", [])
+        if label not in endpoints and len(endpoints) < MAX_ENDPOINTS:
+            endpoints.append(label)
+        labels = {
+            "host": _host_label(host),
+            "method": method,
+            "endpoint": label if label in endpoints else "other",
+        }
+        key = _key("request_duration_seconds", dict(labels, status=str(status)))
+        histogram = state["histograms"].setdefault(key, {"buckets": [0] * len(DURATION_BUCKETS), "sum": 0.0, "count": 0})
+        for index, bound in enumerate(DURATION_BUCKETS):
+            if seconds <= bound:
+                histogram["buckets"][index] += 1
+        histogram["sum"] += seconds
+        histogram["count"] += 1
+        if retries:
+            _increment(state, "request_retries_total", labels, retries)
+
+    _update(host, apply)
+
+
+def record_login(host):
+    """Record a login performed against host."""
+    _update(host, lambda state: _increment(state, "logins_total", {"host": _host_label(host)}))
+
+
+def record_circuit_open(host):
+    """Record that the circuit breaker of host opened."""
+    _update(host, lambda state: _increment(state, "circuit_breaker_opens_total", {"host": _host_label(host)}))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _bound(value):
+    return "+Inf" if value is None else repr(float(value))
+
+
+def render(state):
+    """Return the metrics in state in the Prometheus text exposition format."""
+    families = {}
+    for kind in ("histograms", "counters"):
+        for key, value in state[kind].items():
+            name, labels = json.loads(key)
+            families.setdefault(name, []).append(([tuple(label) for label in labels], value))
+
+    lines = []
+    for name in sorted(families):
+        metric = f"{PREFIX}_{name}"
+        lines.append(f"# HELP {metric} {HELP.get(name, name)}")
+        if name == "request_duration_seconds":
+            lines.append(f"# TYPE {metric} histogram")
+            for labels, histogram in sorted(families[name], key=lambda item: item[0]):
+                for bound, count in zip(DURATION_BUCKETS + (None,), histogram["buckets"] + [histogram["count"]]):
+                    lines.append(f"{metric}_bucket{_labels(labels + [('le', _bound(bound))])} {count}")
+                lines.append(f"{metric}_sum{_labels(labels)} {histogram['sum']!r}")
+                lines.append(f"{metric}_count{_labels(labels)} {histogram['count']}")
+        else:
+            lines.append(f"# TYPE {metric} counter")
+            for labels, value in sorted(families[name], key=lambda item: item[0]):
+                lines.append(f"{metric}{_labels(labels)} {value}")
+
+    return "\n".join(lines) + "\n"
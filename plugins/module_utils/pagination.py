@@ -0,0 +1,145 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides limit/skip pagination for Itential Platform list endpoints such as
+# `/operations-manager/jobs` and `/operations-manager/tasks`.
+# It handles:
+# - Sorting every page by `_id`, unless the caller sorts by another field, so the
+# limit/skip windows of concurrent requests line up with each other.
+# - Fetching the first page to learn the total number of matching records, then fetching
+# the remaining pages with at most `concurrency` requests in flight.
+# - Yielding pages strictly in order while holding no more than `concurrency` pages in
+# memory at once.
+# - Falling back to sequential fetching, skipping the records received so far, when the
+# endpoint does not report a total or a page other than the last comes back short, for
+# example because the server caps the page size.  Without a total, fetching stops at
+# the first empty page.
+# - Streaming records to an NDJSON file on the controller, written atomically, so memory
+# stays flat regardless of how many records match.  An existing file with the same
+# content is left untouched.
+
+import json
+from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils import download
+from ansible_collections.itential.platform.plugins.module_utils.request import make_request
+from ansible_collections.itential.platform.plugins.module_utils import parallel
+from ansible_collections.itential.platform.plugins.module_utils.timing import combine
+
+DEFAULT_PAGE_SIZE = 100
+
+# Field and order pages are sorted by so every page sees the records in the same order
+DEFAULT_SORT = "_id"
+DEFAULT_ORDER = 1
+
+
+class Paginator(object):
+    """Iterate over the pages of a list endpoint.
+
+    Iterating yields one list of records per page, in order.  After iteration
+    the total, pages and count attributes describe what was retrieved and
+    timing() combines the timing of every page request.  timeout and
+    deadline are passed to make_request() for every page.
+    """
+
+    def __init__(self, task_vars, endpoint, params=None, page_size=DEFAULT_PAGE_SIZE, concurrency=1, timeout=None, deadline=None):
+        if page_size < 1:
+            raise AnsibleError(f"'page_size' must be a positive integer, got {page_size!r}")
+        self.task_vars = task_vars
+        self.endpoint = endpoint
+        self.params = dict(params or {})
+        if "sort" not in self.params:
+            self.params.update({"sort": DEFAULT_SORT, "order": DEFAULT_ORDER})
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.deadline = deadline
+        self.total = None
+        self.pages = 0
+        self.count = 0
+        self._timings = []
+
+    def timing(self):
+        """Return the combined timing of the page requests sent so far."""
+        return combine(self._timings)
+
+    def _fetch(self, skip):
+        params = dict(self.params, limit=self.page_size, skip=skip)
+        response = make_request(self.task_vars, "GET", self.endpoint, params=params, timeout=self.timeout, deadline=self.deadline)
+        self._timings.append(response["timing"])
+        body = response.get("json") or {}
+        return body.get("data") or [], (body.get("metadata") or {}).get("total")
+
+    def _page(self, records):
+        self.pages += 1
+        self.count += len(records)
+        return records
+
+    def _concurrent_pages(self, skip):
+        """Yield the pages from skip on, fetching up to concurrency pages at once.
+
+        Returns the number of records received when a page other than the
+        last came back short, which leaves the pages fetched after it at the
+        wrong skip, or the total once every page was received.
+        """
+        window = max(1, self.concurrency) * self.page_size
+        while skip < self.total:
+            skips = range(skip, min(self.total, skip + window), self.page_size)
+            for outcome in parallel.run_ordered(self._fetch, skips, self.concurrency):
+                if outcome.failed:
+                    raise outcome.error
+                records = outcome.result[0]
+                yield self._page(records)
+                skip += len(records)
+                if len(records) < min(self.page_size, self.total - outcome.item):
+                    return skip
+        return skip
+
+    def __iter__(self):
+        records, self.total = self._fetch(0)
+        yield self._page(records)
+        skip = len(records)
+
+        if self.total is None:
+            # The endpoint does not report a total.  A short page may only mean the
+            # server caps the page size, so keep going until an empty page
+            while records:
+                records, _ = self._fetch(skip)
+                if not records:
+                    return
+                skip += len(records)
+                yield self._page(records)
+            return
+
+        if len(records) == self.page_size:
+            skip = yield from self._concurrent_pages(skip)
+
+        # A page came back short before the end, fetch the rest one page at a time
+        # from the number of records received so far
+        while skip < self.total:
+            records, _ = self._fetch(skip)
+            if not records:
+                return
+            skip += len(records)
+            yield self._page(records)
+
+
+def write_ndjson(dest, pages):
+    """Atomically write every record in pages to dest, one JSON document per line.
+
+    Returns a dict with the number of records written, the size and checksum
+    of the file and whether its content changed.
+    """
+    count = 0
+
+    def lines():
+        nonlocal count
+        for records in pages:
+            for record in records:
+                count += 1
+                yield json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    written = download.write_atomic(dest, lines())
+    written["count"] = count
+    return written
@@ -0,0 +1,75 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides bounded parallel execution for action plugins that send many
+# independent requests to the Itential Platform.
+# It handles:
+# - Running a function over a list of items on a thread pool with at most `concurrency`
+# calls in flight.
+# - Returning one outcome per item in input order, regardless of completion order.
+# - Capturing the exception and wall-clock duration of every call so a single failure
+# does not abort the remaining calls.
+# - Running every call in a copy of the caller's context so the spans of concurrent calls
+# are linked to the span of the action that made them.
+
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ansible.errors import AnsibleError
+
+
+class Outcome(object):
+    """The result of calling a function for a single item."""
+
+    def __init__(self, item, result=None, error=None, duration=0.0):
+        self.item = item
+        self.result = result
+        self.error = error
+        self.duration = duration
+
+    @property
+    def failed(self):
+        return self.error is not None
+
+
+def positive_int(name, value):
+    """Return value as a positive int or raise AnsibleError naming the option name."""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise AnsibleError(f"'{name}' must be a positive integer, got {value!r}")
+    if number < 1:
+        raise AnsibleError(f"'{name}' must be a positive integer, got {value!r}")
+    return number
+
+
+def validate_concurrency(value):
+    """Return value as a positive int or raise AnsibleError."""
+    return positive_int("concurrency", value)
+
+
+def _call(func, item):
+    start_time = time.perf_counter()
+    try:
+        result = func(item)
+    except Exception as exc:
+        return Outcome(item, error=exc, duration=time.perf_counter() - start_time)
+    return Outcome(item, result=result, duration=time.perf_counter() - start_time)
+
+
+def run_ordered(func, items, concurrency=1):
+    """Call func(item) for every item with at most concurrency calls in flight.
+
+    Returns a list of Outcome objects in the same order as items.
+    """
+    items = list(items)
+
+    if concurrency <= 1 or len(items) <= 1:
+        return [_call(func, item) for item in items]
+
+    # Each call needs its own copy, a context cannot be entered by two threads at once
+    contexts = [contextvars.copy_context() for _ in items]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        return list(executor.map(lambda context, item: context.run(_call, func, item), contexts, items))
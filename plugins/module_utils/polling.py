@@ -0,0 +1,41 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides a helper for polling the Itential Platform until a condition holds.
+# It handles:
+# - Calling a check function repeatedly until it reports success or a deadline passes.
+# - Backing off exponentially between attempts, starting at `interval` seconds and
+# capped at `max_interval` seconds, so short waits finish quickly while long waits
+# do not hammer the API.
+# - Never sleeping past the deadline.
+
+import time
+
+
+def poll_until(check, timeout, interval=1.0, max_interval=10.0, factor=2.0, delay=0.0):
+    """Call check() until it returns a truthy value or timeout seconds pass.
+
+    The first call is made after delay seconds.  Returns a (value, attempts)
+    tuple where value is the last value returned by check().  A falsy value
+    means the deadline passed first.
+    """
+    deadline = time.monotonic() + timeout
+    attempts = 0
+
+    if delay:
+        time.sleep(min(delay, timeout))
+
+    while True:
+        attempts += 1
+        value = check()
+        if value:
+            return value, attempts
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return value, attempts
+
+        time.sleep(min(interval, remaining))
+        interval = min(interval * factor, max_interval)
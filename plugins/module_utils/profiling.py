@@ -0,0 +1,122 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides an opt-in profiling hook for action plugins.
+# It handles:
+# - Running an action plugin's `run()` under cProfile and writing the statistics to a
+# `.pstats` file per task, or per loop item, in the profile directory, for
+# `python -m pstats` or snakeviz.
+# - Optionally tracing memory allocations with tracemalloc and writing the peak usage and
+# the top allocating source lines per task to a `.memory.txt` file next to it.
+# - Adding the paths of the files written to the task result as `profile`.
+#
+# Profiling is enabled by setting the `platform_profile_dir` host variable or the
+# ITENTIAL_PLATFORM_PROFILE_DIR environment variable to a directory on the controller, and
+# memory tracing by setting `platform_profile_memory` or ITENTIAL_PLATFORM_PROFILE_MEMORY
+# to true.  When it is not enabled `run()` is called directly, with nothing but the lookup
+# of those variables added.  cProfile only profiles the thread running `run()`, so
+# requests sent concurrently on worker threads show up as time spent waiting for them.
+
+import cProfile
+import itertools
+import os
+import re
+import time
+import tracemalloc
+from functools import wraps
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.itential.core.plugins.module_utils import display
+
+PROFILE_DIR_ENV = "ITENTIAL_PLATFORM_PROFILE_DIR"
+PROFILE_MEMORY_ENV = "ITENTIAL_PLATFORM_PROFILE_MEMORY"
+
+# Number of allocating source lines listed in a memory report
+MEMORY_TOP = 25
+
+# Number of frames tracemalloc keeps for each allocation
+MEMORY_FRAMES = 10
+
+# Numbers the profiles written by this process.  Ansible runs every loop item of a
+# task in the same worker, so the time and pid alone do not tell their files apart.
+_SEQUENCE = itertools.count(1)
+
+
+def _setting(task_vars, var, env):
+    hostvars = {}
+    if task_vars:
+        hostvars = task_vars["hostvars"].get(task_vars["inventory_hostname"]) or {}
+    value = hostvars.get(var)
+    return value if value is not None else os.environ.get(env)
+
+
+def _safe(name):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", str(name))
+
+
+def _write_memory(path, snapshot, current, peak):
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"Current: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB\n\n")
+        f.write(f"Top {MEMORY_TOP} allocating lines:\n")
+        for index, stat in enumerate(snapshot.statistics("lineno")[:MEMORY_TOP], 1):
+            frame = stat.traceback[0]
+            f.write(f"#{index}: {frame.filename}:{frame.lineno}: {stat.size / 1024:.1f} KiB in {stat.count} blocks\n")
+
+
+def _profiled(run, action, tmp, task_vars, directory, memory):
+    inventory_hostname = (task_vars or {}).get("inventory_hostname", "localhost")
+    name = f"{time.strftime('%Y%m%dT%H%M%S')}-{_safe(inventory_hostname)}-{_safe(action._task.action)}-{os.getpid()}-{next(_SEQUENCE)}"
+    base = os.path.join(os.path.abspath(os.path.expanduser(directory)), name)
+
+    # Leave tracemalloc alone if something else already started it
+    start_tracing = memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start(MEMORY_FRAMES)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = run(action, tmp=tmp, task_vars=task_vars)
+    finally:
+        profiler.disable()
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+        if start_tracing:
+            tracemalloc.stop()
+
+        written = {}
+        try:
+            os.makedirs(os.path.dirname(base), exist_ok=True)
+            profiler.dump_stats(f"{base}.pstats")
+            written["pstats"] = f"{base}.pstats"
+            if memory:
+                _write_memory(f"{base}.memory.txt", snapshot, current, peak)
+                written["memory"] = f"{base}.memory.txt"
+        except OSError as exc:
+            # Profiling never fails the task
+            display.vvv(f"Failed to write profile to {directory}: {exc}")
+
+    if isinstance(result, dict) and written:
+        result["profile"] = written
+    return result
+
+
+def profile_action(run):
+    """Decorate an action plugin's run() method to profile it when profiling is enabled."""
+
+    @wraps(run)
+    def wrapper(self, tmp=None, task_vars=None):
+        directory = _setting(task_vars, "platform_profile_dir", PROFILE_DIR_ENV)
+        if not directory:
+            return run(self, tmp=tmp, task_vars=task_vars)
+        memory = boolean(_setting(task_vars, "platform_profile_memory", PROFILE_MEMORY_ENV) or False, strict=False)
+        return _profiled(run, self, tmp, task_vars, directory, memory)
+
+    return wrapper
@@ -0,0 +1,179 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides client-side projection of API responses so action plugins return
+# only what the playbook needs instead of pushing whole responses through Ansible's result
+# pipeline.
+# It handles:
+# - Keeping only the `fields` (also accepted as `select`) given as dotted paths, for
+# example `name` or `metrics.start_time`.  Paths are applied to every item of a list.
+# - Naming the top-level keys of those paths, for endpoints that take an `include`
+# parameter so the server only returns the fields that are kept.
+# - Keeping at most `max_items` items of a list response, or of the `data` list of a
+# list endpoint response.
+# - Dropping the response body altogether with `return_body: false`, leaving the status
+# and timings.
+# - Projecting list responses while they are parsed with `stream_request()`, so at most
+# `max_items` projected records are ever held in memory.
+#
+# Action plugins call `Projection.from_args()` with their task arguments and pass the
+# result of `make_request()` through `Projection.apply()` before returning it, or use
+# `projected_request()` for list endpoints.
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.itential.platform.plugins.module_utils.request import make_request, stream_request
+
+# Task arguments that control projection rather than the request
+RESERVED_ARGS = ("fields", "select", "max_items", "return_body")
+
+
+def _compile(fields):
+    """Return the tree of keys to keep for a list of dotted paths.
+
+    A key mapped to None is kept whole, a key mapped to a dict is projected
+    further with that tree.
+    """
+    tree = {}
+    for path in fields:
+        parts = [part for part in str(path).split(".") if part]
+        if not parts:
+            raise AnsibleError(f"Invalid field {path!r} in 'fields'")
+        node = tree
+        for part in parts[:-1]:
+            child = node.get(part, {})
+            if child is None:
+                # The parent is already kept whole
+                break
+            node = node.setdefault(part, child)
+        else:
+            node[parts[-1]] = None
+    return tree
+
+
+def project(value, tree):
+    """Return value with only the keys in tree, applied to every item of a list."""
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected = {}
+    for key, subtree in tree.items():
+        if key in value:
+            projected[key] = value[key] if subtree is None else project(value[key], subtree)
+    return projected
+
+
+class Projection(object):
+    """The projection requested by a task."""
+
+    def __init__(self, fields=None, max_items=None, return_body=True):
+        self.tree = _compile(fields) if fields else None
+        self.max_items = max_items
+        self.return_body = return_body
+
+    @classmethod
+    def from_args(cls, args):
+        """Return the Projection requested by task args, or None if there is none."""
+        fields = args.get("fields", args.get("select"))
+        max_items = args.get("max_items")
+        return_body = boolean(args.get("return_body", True))
+
+        if fields is None and max_items is None and return_body:
+            return None
+
+        if isinstance(fields, str):
+            fields = [field.strip() for field in fields.split(",") if field.strip()]
+        elif fields is not None and not isinstance(fields, list):
+            raise AnsibleError("'fields' must be a list of dotted paths or a comma-separated string.")
+
+        if max_items is not None:
+            try:
+                max_items = int(max_items)
+            except (TypeError, ValueError):
+                raise AnsibleError(f"'max_items' must be a non-negative integer, got {max_items!r}")
+            if max_items < 0:
+                raise AnsibleError(f"'max_items' must be a non-negative integer, got {max_items!r}")
+
+        return cls(fields, max_items, return_body)
+
+    @property
+    def include(self):
+        """Return the top-level keys of fields as a comma-separated string, or None."""
+        return ",".join(self.tree) if self.tree else None
+
+    def item(self, record):
+        """Return a single list item projected to the requested fields."""
+        return record if self.tree is None else project(record, self.tree)
+
+    def items(self, records):
+        """Return up to max_items records projected to the requested fields.
+
+        records may be any iterable, it is not consumed past max_items.
+        """
+        projected = []
+        if self.max_items == 0:
+            return projected
+        for record in records:
+            projected.append(self.item(record))
+            if len(projected) == self.max_items:
+                break
+        return projected
+
+    def pages(self, pages):
+        """Yield pages of records projected to the requested fields.
+
+        Stops, without consuming further pages, once max_items records have
+        been yielded.
+        """
+        remaining = self.max_items
+        for records in pages:
+            if remaining is not None:
+                records = records[:remaining]
+                remaining -= len(records)
+            yield [self.item(record) for record in records]
+            if remaining == 0:
+                return
+
+    def body(self, body):
+        """Return the projected response body."""
+        if isinstance(body, list):
+            return self.items(body)
+        if isinstance(body, dict) and isinstance(body.get("data"), list):
+            return dict(body, data=self.items(body["data"]))
+        return self.item(body)
+
+    def apply(self, result):
+        """Project the body of a make_request() result in place and return the result."""
+        if not self.return_body:
+            result.pop("json", None)
+        elif "json" in result:
+            result["json"] = self.body(result["json"])
+        return result
+
+
+def projected_request(task_vars, method, endpoint, projection, params=None, timeout=None, deadline=None):
+    """Send a request to a list endpoint and return its result with projection applied.
+
+    The `data` list of the response is parsed one record at a time and
+    reading stops once max_items records have been kept, so the full
+    response is never held in memory.
+    """
+    if not projection.return_body:
+        return make_request(task_vars, method, endpoint, params=params, timeout=timeout, deadline=deadline, return_body=False)
+
+    stream = stream_request(task_vars, method, endpoint, params=params, timeout=timeout, deadline=deadline)
+    try:
+        records = projection.items(stream)
+    finally:
+        stream.close()
+
+    result = stream.result
+    result["timing"] = stream.timing.as_dict()
+    if stream.found:
+        result["json"] = dict(stream.siblings, data=records)
+    else:
+        result["json"] = projection.body(stream.siblings)
+    return result
@@ -7,28 +7,297 @@
 # It handles:
 # - Constructing the API request with proper authentication.
 # - Validating request parameters such as HTTP method, JSON data, and URL format.
-# - Sending the request and handling various exceptions, including connection errors, timeouts, and 
+# - Sending the request over the host's pooled keep-alive session and handling various exceptions, including connection errors, timeouts, and 
 # HTTP failures.
 # - Processing the API response, ensuring it contains valid JSON when applicable.
-# - Logging request and response details for debugging.
+# - Negotiating gzip or deflate compressed responses, which are decompressed as they are
+# read, and optionally gzip compressing request bodies of at least `COMPRESS_MIN_SIZE` bytes.
+# - Logging request and response details for debugging.  The details are only formatted
+# when Ansible runs at verbosity 3 (-vvv) or above, bodies longer than `DEBUG_BODY_LIMIT`
+# characters are truncated and the auth token is redacted.
+# - Re-authenticating once and replaying the request when the auth token is rejected.
+# - Retrying transient failures of idempotent requests with exponential backoff and jitter,
+# honoring `Retry-After`, and reporting every attempt in the result.
+# - Applying the host's connect and read timeouts, an optional per-task read timeout and
+# an optional deadline shared by every request a task sends.
+# - Recording the duration, status and retries of each request in the host's metrics file.
+# - Recording a span for each request when the task is traced.
+# - Reporting where the time of each request was spent (login, connect, TLS, time to first
+# byte, transfer, parse and backoff) in the `timing` block of its result.
+# - Memoizing the parsed host schema and the host objects built from it so repeated
+# requests for the same inventory host skip the YAML parse and host construction.
 #
 # The function `make_request()` is used by Ansible modules to interact with Itential Platform.
+# The function `download_request()` sends the same request but streams the response body
+# to a file on the controller and returns only metadata about the file.
+# The function `stream_request()` parses the response body incrementally and yields the
+# items of a JSON array, such as the `data` array of list endpoints, one at a time.
+# The function `get_host()` returns the cached host object for a set of hostvars.
+# The function `is_idempotent()` resolves the `idempotent` option of generic requests.
 
+import gzip
 import json
 import time
 import re
+import threading
+from functools import lru_cache, wraps
+from types import MappingProxyType
 from ansible.errors import AnsibleError
 from ansible.module_utils.common import yaml
-from ansible_collections.itential.platform.plugins.module_utils.login import login
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.utils.display import Display
+from ansible_collections.itential.platform.plugins.module_utils.login import get_token, invalidate_token
 from ansible_collections.itential.core.plugins.module_utils import hosts
 from ansible_collections.itential.core.plugins.module_utils import display
 from ansible_collections.itential.core.plugins.module_utils import http
+from ansible_collections.itential.platform.plugins.module_utils import session
+from ansible_collections.itential.platform.plugins.module_utils import download
+from ansible_collections.itential.platform.plugins.module_utils import json_stream
+from ansible_collections.itential.platform.plugins.module_utils import metrics
+from ansible_collections.itential.platform.plugins.module_utils import tracing
 from ansible_collections.itential.platform.plugins.module_utils import host as spec
+from ansible_collections.itential.platform.plugins.module_utils.retry import RetryPolicy
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import request_timeout
+from ansible_collections.itential.platform.plugins.module_utils.timing import RequestTiming
 
 VALID_HTTP_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
 
-def make_request(task_vars, method, endpoint, params=None, data=None):
-    """Send an authenticated API request to the specified endpoint."""
+# Methods of generic requests that may be resent by default.  Requests to arbitrary
+# endpoints can have side effects whatever their method, such as a PUT restart.
+IDEMPOTENT_METHODS = frozenset(("GET",))
+
+JSON_HEADERS = MappingProxyType({
+    "content-type": "application/json",
+    "accept": "application/json",
+    "accept-encoding": "gzip, deflate",
+})
+
+# Request bodies smaller than this many bytes are sent uncompressed even when
+# compression is requested, the saving does not pay for the gzip header.
+COMPRESS_MIN_SIZE = 1024
+
+# Verbosity at which request and response details are logged
+DEBUG_VERBOSITY = 3
+
+# Maximum number of characters of a request or response body included in debug output
+DEBUG_BODY_LIMIT = 2048
+
+REDACTED = "********"
+
+# Maximum number of host objects kept in the host cache before it is reset.
+HOST_CACHE_SIZE = 256
+
+# Host objects keyed by the host variables they were built from.  Each value
+# is a (host, headers) tuple where headers is the read-only set of headers
+# sent with every request to the host.
+_HOST_CACHE = {}
+_HOST_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _schema():
+    return yaml.yaml_load(spec.DOCUMENTATION)
+
+
+@lru_cache(maxsize=None)
+def _schema_vars():
+    """Return every host variable name referenced by the host schema."""
+    names = []
+    for option in _schema()["options"].values():
+        names.extend(option.get("vars", []))
+    return tuple(names)
+
+
+def _hostvars_key(hostvars):
+    key = []
+    for name in _schema_vars():
+        if name in hostvars:
+            value = hostvars.get(name)
+            if not isinstance(value, (str, int, float, bool, type(None))):
+                value = json.dumps(value, sort_keys=True, default=str)
+            key.append((name, value))
+    return tuple(key)
+
+
+def _load_host(hostvars):
+    key = _hostvars_key(hostvars)
+
+    with _HOST_CACHE_LOCK:
+        entry = _HOST_CACHE.get(key)
+    if entry is not None:
+        return entry
+
+    host = hosts.new(_schema(), hostvars)
+    headers = MappingProxyType({**(host.headers or {}), **JSON_HEADERS})
+    entry = (host, headers)
+
+    with _HOST_CACHE_LOCK:
+        if len(_HOST_CACHE) >= HOST_CACHE_SIZE:
+            _HOST_CACHE.clear()
+        _HOST_CACHE[key] = entry
+
+    return entry
+
+
+def get_host(hostvars):
+    """Return the host object for hostvars, building it only once per process."""
+    return _load_host(hostvars)[0]
+
+
+def clear_host_cache():
+    """Remove all cached host objects."""
+    with _HOST_CACHE_LOCK:
+        _HOST_CACHE.clear()
+
+
+def is_idempotent(method, idempotent=None):
+    """Return whether a request may be resent once the server may have acted on it.
+
+    idempotent is the value of an `idempotent` option, when it is not set only
+    methods in IDEMPOTENT_METHODS are idempotent.
+    """
+    if idempotent is None:
+        return method.upper() in IDEMPOTENT_METHODS
+    return boolean(idempotent)
+
+
+def _is_auth_failure(resp):
+    """Return True if resp indicates the auth token was rejected."""
+    if resp.status_code == 401:
+        return True
+    return resp.status_code == 403 and "expired" in (resp.text or "").lower()
+
+
+def _debug_enabled():
+    """Return True if request and response details should be logged."""
+    return Display().verbosity >= DEBUG_VERBOSITY
+
+
+def _truncate(text, size=None):
+    """Return text cut to DEBUG_BODY_LIMIT characters, noting the full size if it was cut."""
+    size = len(text) if size is None else size
+    if size <= DEBUG_BODY_LIMIT:
+        return text
+    return f"{text[:DEBUG_BODY_LIMIT]}... [truncated, {size} characters in total]"
+
+
+def _response_body(resp):
+    """Return the start of the response body without decoding all of it."""
+    content = resp.content or b""
+    text = content[:DEBUG_BODY_LIMIT].decode(resp.encoding or "utf-8", errors="replace")
+    return _truncate(text, len(content))
+
+
+def _request_body(data):
+    """Return a description of the request body for debug output."""
+    if isinstance(data, bytes):
+        return f"<{len(data)} bytes, gzip compressed>"
+    return _truncate(data)
+
+
+def _send(host, method, url, headers, params, data_json, inventory_hostname, timeout, stream=False, timing=None):
+    debug = _debug_enabled()
+
+    if debug:
+        redacted = dict(params, token=REDACTED) if "token" in params else params
+        display.vvv(
+            f"API Request:\n"
+            f"  Method: {method}\n"
+            f"  URL: {url}\n"
+            f"  Headers: {json.dumps(dict(headers), indent=2)}\n"
+            f"  Params: {json.dumps(redacted, indent=2)}\n"
+            f"  Data: {_request_body(data_json) if data_json else 'None'}",
+            host=inventory_hostname
+        )
+
+    start_time = time.perf_counter()
+    resp = session.send_request(
+        host,
+        method=method,
+        url=url,
+        params=params,
+        headers=headers,
+        data=data_json,
+        verify=host.verify,
+        disable_warnings=host.disable_warnings,
+        timeout=timeout,
+        stream=stream,
+    )
+    if timing is not None:
+        timing.add_send(resp, time.perf_counter() - start_time, session.connection_timing(), stream)
+
+    if debug:
+        display.vvv(
+            f"API Response:\n"
+            f"  Status Code: {resp.status_code}\n"
+            f"  Headers: {json.dumps(dict(resp.headers), indent=2)}\n"
+            f"  Body: {'<streamed>' if stream else _response_body(resp)}",
+            host=inventory_hostname
+        )
+
+    return resp
+
+
+def _send_with_retries(host, policy, timing, method, url, headers, params, data_json, inventory_hostname, timeout=None, deadline=None, stream=False, idempotent=True):
+    """Send the request, retrying transient failures according to policy.
+
+    Every attempt is appended to timing.attempts with its status, error,
+    elapsed time and the delay that preceded the next attempt.  No attempt is
+    started, and no retry is scheduled, past deadline.  idempotent is passed
+    to policy.should_retry().
+    """
+    attempts = timing.attempts
+    attempt = 0
+    while True:
+        attempt += 1
+        if deadline is not None:
+            deadline.check()
+
+        record = {"status": None, "error": None, "elapsed": 0.0, "delay": None}
+        attempts.append(record)
+
+        start_time = time.perf_counter()
+        try:
+            resp = _send(host, method, url, headers, params, data_json, inventory_hostname, request_timeout(host, timeout, deadline), stream, timing)
+        except Exception as exc:
+            record.update({"error": str(exc), "elapsed": time.perf_counter() - start_time})
+            if not policy.should_retry(method, attempt, error=exc, idempotent=idempotent):
+                raise
+            error, resp = exc, None
+        else:
+            record.update({"status": resp.status_code, "elapsed": time.perf_counter() - start_time})
+            if not policy.should_retry(method, attempt, resp=resp, idempotent=idempotent):
+                return resp
+
+        delay = policy.delay(attempt, resp)
+        if deadline is not None and delay >= deadline.remaining():
+            # Waiting would run past the deadline, give up with this attempt's outcome
+            if resp is None:
+                raise error
+            return resp
+
+        if resp is not None:
+            # Release the connection of a streamed response that will not be read
+            resp.close()
+
+        record["delay"] = delay
+        reason = record["error"] or f"status {record['status']}"
+        display.vvv(
+            f"Retrying {method} {url} in {record['delay']:.2f}s after {reason} "
+            f"(attempt {attempt} of {policy.retries + 1})",
+            host=inventory_hostname
+        )
+        time.sleep(record["delay"])
+
+
+def _perform(task_vars, method, endpoint, params=None, data=None, timeout=None, deadline=None, compress=False, extra_headers=None, stream=False, idempotent=True):
+    """Validate, authenticate and send a request.
+
+    Returns the final response along with the RequestTiming of the request,
+    which also holds the list of attempts.  The response status is not
+    checked.
+    """
+    timing = RequestTiming(method, endpoint)
 
     inventory_hostname = task_vars["inventory_hostname"]
     hostvars = task_vars["hostvars"].get(inventory_hostname)
@@ -50,15 +319,15 @@ def make_request(task_vars, method, endpoint, params=None, data=None):
     if method not in VALID_HTTP_METHODS:
         raise AnsibleError(f"Invalid HTTP method: {method}. Must be one of {VALID_HTTP_METHODS}")
 
-    # Load schema and construct the host object
-    schema = yaml.yaml_load(spec.DOCUMENTATION)
-    host = hosts.new(schema, hostvars)
+    # Load the cached host object and its precomputed request headers
+    host, headers = _load_host(hostvars)
+
+    if extra_headers:
+        headers = MappingProxyType({**headers, **extra_headers})
 
-    headers = host.headers or {}
-    headers.update({
-        "content-type": "application/json",
-        "accept": "application/json"
-    })
+    if compress and data_json and len(data_json) >= COMPRESS_MIN_SIZE:
+        data_json = gzip.compress(data_json.encode("utf-8"), compresslevel=6)
+        headers = MappingProxyType({**headers, "content-encoding": "gzip"})
 
     # Construct and validate the request URL
     url = http.make_url(host.host, endpoint, port=host.port, use_tls=host.use_tls)
@@ -68,56 +337,212 @@ def make_request(task_vars, method, endpoint, params=None, data=None):
     # Check if platform_auth_token is provided in task vars
     auth_token = hostvars.get("platform_auth_token")
 
-    # If auth_token is already provided, add it to params. Otherwise, call the login function
+    # If auth_token is already provided, send it with the request. Otherwise, reuse a cached
+    # token or log in to generate a new one
     if auth_token:
         display.vvv("Using Provided Itential Platform Auth Token")
-        params["token"] = auth_token
+        token = auth_token
+        timing.token_source = "provided"
     else:
-        display.vvv("Generating new Itential Platform Auth Token")
-        params["token"] = login(host)
-
-    display.vvv(
-        f"API Request:\n"
-        f"  Method: {method}\n"
-        f"  URL: {url}\n"
-        f"  Headers: {json.dumps(headers, indent=2)}\n"
-        f"  Params: {json.dumps(params, indent=2)}\n"
-        f"  Data: {data_json or 'None'}",
-        host=task_vars["inventory_hostname"]
-    )
+        token = _get_token(host, timeout, timing)
+
+    policy = RetryPolicy.for_host(host)
+
+    timing.sent_at = time.perf_counter()
+
+    try:
+        resp = _send_with_retries(host, policy, timing, method, url, headers, dict(params, token=token), data_json, inventory_hostname, timeout, deadline, stream, idempotent)
+
+        # The token has expired or was revoked.  Drop it, log in again and replay the
+        # request once.  This requires credentials to be available for the host.
+        if _is_auth_failure(resp) and host.username and host.password:
+            display.vvv("Itential Platform Auth Token rejected, re-authenticating", host=inventory_hostname)
+            resp.close()
+            if not auth_token:
+                invalidate_token(host, token)
+            token = _get_token(host, timeout, timing)
+            resp = _send_with_retries(host, policy, timing, method, url, headers, dict(params, token=token), data_json, inventory_hostname, timeout, deadline, stream, idempotent)
+    except Exception:
+        _record_metrics(host, method, endpoint, "error", timing)
+        raise
+
+    _record_metrics(host, method, endpoint, resp.status_code, timing)
+
+    current = tracing.current()
+    current.set_attribute("server.address", host.host)
+    current.set_attribute("server.port", host.port)
+    current.set_attribute("http.response.status_code", resp.status_code)
+    current.set_attribute("itential.attempts", len(timing.attempts))
+    current.set_attribute("itential.token_source", timing.token_source)
+
+    return resp, timing
+
+
+def _record_metrics(host, method, endpoint, status, timing):
+    retries = sum(1 for a in timing.attempts if a["delay"] is not None)
+    metrics.record_request(host, method, endpoint, status, time.perf_counter() - timing.sent_at, retries)
 
+
+def _get_token(host, timeout, timing):
+    """Return the auth token for host, recording the time it took in timing."""
+    info = {}
     start_time = time.perf_counter()
+    token = get_token(host, timeout, info=info)
+    timing.add_login(time.perf_counter() - start_time, info.get("token_source"))
+    return token
 
-    # Send the request
-    resp = http.send_request(
-        method=method,
-        url=url,
-        params=params,
-        headers=headers,
-        data=data_json,
-        verify=host.verify,
-        disable_warnings=host.disable_warnings,
-    )
 
-    display.vvv(
-        f"API Response:\n"
-        f"  Status Code: {resp.status_code}\n"
-        f"  Headers: {json.dumps(dict(resp.headers), indent=2)}\n"
-        f"  Body: {resp.text}",
-        host=task_vars["inventory_hostname"]
-    )
+def _result(resp, timing):
+    attempts = timing.attempts
+    return {
+        "changed": False,
+        "status": resp.status_code,
+        "elapsed_time": time.perf_counter() - timing.sent_at,
+        "retries": sum(1 for a in attempts if a["delay"] is not None),
+        "attempts": attempts,
+        "timing": timing.as_dict(),
+    }
+
+
+def _traced(func):
+    """Record a span around a request function taking task_vars, method and endpoint."""
+
+    @wraps(func)
+    def wrapper(task_vars, method, endpoint, *args, **kwargs):
+        attributes = {"http.request.method": method, "url.path": endpoint}
+        with tracing.span(f"{method} {endpoint}", tracing.trace_file_for(task_vars), tracing.CLIENT, attributes):
+            return func(task_vars, method, endpoint, *args, **kwargs)
+
+    return wrapper
+
+
+@_traced
+def make_request(task_vars, method, endpoint, params=None, data=None, timeout=None, deadline=None, compress=False, return_body=True, idempotent=True):
+    """Send an authenticated API request to the specified endpoint.
+
+    timeout overrides the host's read timeout in seconds.  deadline is a
+    timeouts.Deadline shared by every request sent for the task.  When
+    compress is True a body of at least COMPRESS_MIN_SIZE bytes is sent gzip
+    compressed.  When return_body is False the response body is not parsed
+    and the result only holds the status and timings.  Set idempotent to
+    False for requests that must not be repeated once the server may have
+    acted on them, such as restarts; they are then only retried when the
+    connection could not be opened or the response was 429.
+    """
+
+    resp, timing = _perform(task_vars, method, endpoint, params, data, timeout, deadline, compress, idempotent=idempotent)
 
     # Raise an error for any non-200 response
     if resp.status_code != 200:
         raise AnsibleError(f"API request failed with status {resp.status_code}: {resp.text}")
 
-    result = {"changed": False, "elapsed_time": time.perf_counter() - start_time}
+    body = None
 
     # Attempt to parse JSON response if applicable
-    if resp.headers.get("Content-Type", "").startswith("application/json"):
+    if return_body and resp.headers.get("Content-Type", "").startswith("application/json"):
+        start_time = time.perf_counter()
         try:
-            result["json"] = resp.json()
+            body = resp.json()
         except ValueError:
             raise AnsibleError(f"Failed to parse JSON response: {resp.text}")
+        timing.add_parse(time.perf_counter() - start_time)
+
+    result = _result(resp, timing)
+    if body is not None:
+        result["json"] = body
+
+    return result
+
+
+def _chunks(resp, deadline=None, timing=None):
+    """Yield the body of a streamed response, closing it once the body is consumed.
+
+    The time spent waiting for each chunk is added to timing as transfer time.
+    """
+    try:
+        chunks = iter(resp.iter_content(chunk_size=download.CHUNK_SIZE))
+        while True:
+            start_time = time.perf_counter()
+            chunk = next(chunks, None)
+            if timing is not None:
+                timing.add_transfer(time.perf_counter() - start_time, len(chunk or b""))
+            if chunk is None:
+                return
+            if deadline is not None:
+                deadline.check()
+            yield chunk
+    finally:
+        resp.close()
+
+
+@_traced
+def stream_request(task_vars, method, endpoint, path=("data",), params=None, data=None, timeout=None, deadline=None):
+    """Send an authenticated API request and parse the response body incrementally.
+
+    Returns a json_stream.ArrayStream that yields the items of the JSON array
+    found at path one at a time, so only one item is held in memory at once.
+    The other members of the response, such as `metadata`, are available in
+    its siblings attribute once iteration is done.  Its result attribute holds
+    the status and timing of the request, as returned by make_request()
+    without the body, and its timing attribute the RequestTiming that keeps
+    counting transfer time while the body is read.  Call its close() method
+    to stop reading early.
+    """
+
+    resp, timing = _perform(task_vars, method, endpoint, params, data, timeout, deadline, stream=True)
+
+    if resp.status_code != 200:
+        try:
+            raise AnsibleError(f"API request failed with status {resp.status_code}: {resp.text}")
+        finally:
+            resp.close()
+
+    stream = json_stream.ArrayStream(_chunks(resp, deadline, timing), path)
+    stream.result = _result(resp, timing)
+    stream.timing = timing
+    return stream
+
+
+@_traced
+def download_request(task_vars, method, endpoint, dest, params=None, data=None, checksum=None, timeout=None, deadline=None, compress=False, idempotent=True):
+    """Send an authenticated API request and stream the response body to dest.
+
+    The body is written in chunks and never held in memory.  The returned
+    result describes the file instead of holding the body.  When dest was
+    downloaded before, the request is sent with the remembered ETag and a 304
+    response leaves dest in place.  checksum is an optional
+    `<algorithm>:<hex digest>`; when dest already matches it no request is
+    sent at all, otherwise the downloaded body must match it.  idempotent is
+    handled as by make_request.
+    """
+
+    algorithm, expected = download.parse_checksum(checksum) if checksum else (download.DEFAULT_CHECKSUM_ALGORITHM, None)
+
+    if expected is not None and download.file_checksum(dest, algorithm) == expected:
+        display.vvv(f"{dest} already matches {checksum}, skipping download")
+        return {"changed": False, "dest": dest, "checksum": f"{algorithm}:{expected}", "skipped": True}
+
+    etag = download.load_etag(dest)
+    extra_headers = {"if-none-match": etag} if etag else None
+
+    resp, timing = _perform(task_vars, method, endpoint, params, data, timeout, deadline, compress, extra_headers, stream=True, idempotent=idempotent)
+
+    try:
+        if resp.status_code == 304 and etag:
+            result = _result(resp, timing)
+            result.update({"dest": dest, "etag": etag, "checksum": f"{algorithm}:{download.file_checksum(dest, algorithm)}"})
+            return result
+
+        if resp.status_code != 200:
+            raise AnsibleError(f"API request failed with status {resp.status_code}: {resp.text}")
+
+        written = download.write_atomic(dest, _chunks(resp, deadline, timing), algorithm, expected)
+    finally:
+        resp.close()
+
+    download.save_etag(dest, resp.headers.get("ETag"))
 
+    result = _result(resp, timing)
+    result.update(written)
+    result.update({"dest": dest, "etag": resp.headers.get("ETag")})
     return result
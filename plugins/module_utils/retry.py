@@ -0,0 +1,78 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides the retry policy applied to Itential Platform requests.
+# It handles:
+# - Deciding whether a failed attempt may be retried: only transient failures (connection
+# errors, timeouts and 429, 502, 503 and 504 responses) and, by default, only idempotent
+# methods are retried.  A request the caller marks as not idempotent, such as a restart,
+# is only retried when the server cannot have acted on it: the connection could not be
+# opened or the response was 429.
+# - Computing the delay before the next attempt using exponential backoff with full
+# jitter, capped at `retry_max_backoff` seconds.
+# - Honoring `Retry-After` headers, given either in seconds or as an HTTP date.
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+import requests
+
+RETRY_STATUS_CODES = frozenset((429, 502, 503, 504))
+
+# Status codes that show the server did not act on the request
+NOT_PROCESSED_STATUS_CODES = frozenset((429,))
+
+DEFAULT_RETRY_METHODS = ("GET", "PUT", "DELETE")
+
+
+class RetryPolicy(object):
+    """Retry settings for a host."""
+
+    def __init__(self, retries=0, backoff=0.5, max_backoff=30.0, methods=DEFAULT_RETRY_METHODS):
+        self.retries = max(0, int(retries or 0))
+        self.backoff = float(backoff if backoff is not None else 0.5)
+        self.max_backoff = float(max_backoff if max_backoff is not None else 30.0)
+        self.methods = frozenset(m.upper() for m in (methods if methods is not None else DEFAULT_RETRY_METHODS))
+
+    @classmethod
+    def for_host(cls, host):
+        return cls(host.retries, host.retry_backoff, host.retry_max_backoff, host.retry_methods)
+
+    def should_retry(self, method, attempt, resp=None, error=None, idempotent=True):
+        """Return True if attempt (starting at 1) may be followed by another.
+
+        When idempotent is False only failures that show the server did not
+        act on the request are retried.
+        """
+        if attempt > self.retries or method.upper() not in self.methods:
+            return False
+        if error is not None:
+            if not idempotent:
+                return isinstance(error, requests.exceptions.ConnectTimeout)
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        if resp is None:
+            return False
+        return resp.status_code in (RETRY_STATUS_CODES if idempotent else NOT_PROCESSED_STATUS_CODES)
+
+    def delay(self, attempt, resp=None):
+        """Return the number of seconds to wait before the attempt after attempt."""
+        retry_after = parse_retry_after(resp.headers.get("Retry-After")) if resp is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** (attempt - 1))))
+
+
+def parse_retry_after(value):
+    """Return the number of seconds requested by a Retry-After header, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
@@ -0,0 +1,186 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides pooled, keep-alive HTTP sessions for Itential Platform requests.
+# It handles:
+# - Keeping one `requests.Session` per host, port, TLS and verification setting for the
+# lifetime of the process so connections (and their TLS sessions) are reused across
+# requests instead of opening a new connection and handshake for every call.
+# - Sizing the connection pool with `pool_maxsize` so concurrent callers in the same
+# process each get a connection.
+# - Discarding sessions that have been idle for longer than `pool_idle_timeout` seconds,
+# since the server has most likely closed their connections by then.
+# - Measuring the time spent opening new connections (DNS resolution and TCP connect) and
+# completing TLS handshakes for the last request sent by the current thread, reported by
+# `connection_timing()`.  Requests sent over a reused connection report no connect time.
+#
+# The function `send_request()` is used by `login()` and `make_request()` in place of
+# `http.send_request()`.  Every request passes through the host's circuit breaker.
+
+import threading
+import time
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from ansible_collections.itential.platform.plugins.module_utils import circuit_breaker
+from ansible_collections.itential.platform.plugins.module_utils import metrics
+
+# Pooled sessions keyed by (host, port, use_tls, verify).  Each value is a
+# [session, last_used] list where last_used is a time.monotonic() timestamp.
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+class _ConnectionTiming(threading.local):
+    """Connection setup time spent by the current thread since the last reset."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.connect = 0.0
+        self.tls = 0.0
+        self.new_connections = 0
+
+
+_TIMING = _ConnectionTiming()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+
+    def _new_conn(self):
+        start_time = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            _TIMING.connect += time.perf_counter() - start_time
+            _TIMING.new_connections += 1
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+
+    def _new_conn(self):
+        start_time = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            _TIMING.connect += time.perf_counter() - start_time
+            _TIMING.new_connections += 1
+
+    def connect(self):
+        start_time = time.perf_counter()
+        connect = _TIMING.connect
+        try:
+            super().connect()
+        finally:
+            # Everything but opening the socket is the TLS handshake
+            _TIMING.tls += time.perf_counter() - start_time - (_TIMING.connect - connect)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """An HTTPAdapter whose connections record their setup time in _TIMING."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def _new_session(host):
+    session = requests.Session()
+    adapter = _TimedHTTPAdapter(pool_connections=1, pool_maxsize=host.pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session(host):
+    """Return the pooled session for host, creating it if needed."""
+    key = (host.host, host.port, host.use_tls, host.verify)
+    now = time.monotonic()
+
+    with _SESSIONS_LOCK:
+        entry = _SESSIONS.get(key)
+        if entry is not None and host.pool_idle_timeout and now - entry[1] > host.pool_idle_timeout:
+            entry[0].close()
+            entry = None
+
+        if entry is None:
+            entry = [_new_session(host), now]
+            _SESSIONS[key] = entry
+        else:
+            entry[1] = now
+
+        return entry[0]
+
+
+def send_request(host, method, url, headers=None, params=None, data=None, verify=True, disable_warnings=False, timeout=None, stream=False):
+    """Send an HTTP request to host using its pooled session.
+
+    timeout is passed to requests as is, either a number of seconds or a
+    (connect, read) tuple.  With stream the body is left unread until the
+    caller iterates over it.  Raises CircuitOpenError without sending
+    anything while the host's circuit breaker is open.
+    """
+    if disable_warnings:
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    breaker = circuit_breaker.get_breaker(host)
+    breaker.before_request()
+
+    _TIMING.reset()
+
+    opened_count = breaker.opened_count
+    try:
+        resp = get_session(host).request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            data=data,
+            verify=verify,
+            timeout=timeout,
+            stream=stream,
+        )
+    except Exception as exc:
+        breaker.record(error=exc)
+        if breaker.opened_count != opened_count:
+            metrics.record_circuit_open(host)
+        raise
+
+    breaker.record(resp=resp)
+    if breaker.opened_count != opened_count:
+        metrics.record_circuit_open(host)
+    return resp
+
+
+def connection_timing():
+    """Return the connection setup time of the last request sent by this thread.
+
+    The dict holds the seconds spent in `connect` (DNS resolution and TCP
+    connect) and `tls` handshakes, and the number of `new_connections`
+    opened.  All are zero when a pooled connection was reused.
+    """
+    return {"connect": _TIMING.connect, "tls": _TIMING.tls, "new_connections": _TIMING.new_connections}
+
+
+def close_sessions():
+    """Close and discard all pooled sessions."""
+    with _SESSIONS_LOCK:
+        for session, _ in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
@@ -0,0 +1,77 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides a controller-side snapshot of records retrieved from the Itential
+# Platform, used for incremental synchronization.
+# It handles:
+# - Loading a JSON snapshot file holding the records keyed by `_id` together with a
+# checkpoint, the highest value of a field such as `last_updated` seen so far, and the
+# scope (query filters) the records were retrieved with.
+# - Merging newly retrieved records into the snapshot and advancing the checkpoint.
+# - Saving the snapshot atomically with `download.write_atomic()` so an interrupted run
+# never leaves a corrupt snapshot behind.
+
+import json
+import os
+from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils import download
+
+
+class Snapshot(object):
+    """Records keyed by `_id` plus the checkpoint reached so far."""
+
+    def __init__(self, path, field, scope=None, checkpoint=None, records=None):
+        self.path = path
+        self.field = field
+        self.scope = scope
+        self.checkpoint = checkpoint
+        self.records = records or {}
+
+    def merge(self, records):
+        """Add or replace records and advance the checkpoint.
+
+        Returns the number of records that were added or changed.
+        """
+        changed = 0
+        for record in records:
+            key = record.get("_id")
+            if key is None:
+                raise AnsibleError(f"Cannot merge record without an '_id' into snapshot {self.path}")
+            if self.records.get(key) != record:
+                self.records[key] = record
+                changed += 1
+
+            value = record.get(self.field)
+            if value is not None and (self.checkpoint is None or value > self.checkpoint):
+                self.checkpoint = value
+
+        return changed
+
+    def save(self):
+        """Atomically write the snapshot to its path."""
+        data = {"field": self.field, "scope": self.scope, "checkpoint": self.checkpoint, "records": self.records}
+        download.write_atomic(self.path, [json.dumps(data, separators=(",", ":")).encode("utf-8")])
+
+
+def load(path, field, scope=None):
+    """Return the Snapshot stored at path, or an empty one if it does not exist.
+
+    The scope describes which records the snapshot holds, such as the query
+    filters used to retrieve them.  A snapshot tracked by a different field or
+    taken with a different scope is discarded so the next synchronization
+    starts from scratch.
+    """
+    try:
+        with open(os.path.expanduser(path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return Snapshot(path, field, scope)
+    except ValueError as exc:
+        raise AnsibleError(f"Failed to read snapshot {path}: {exc}")
+
+    if data.get("field") != field or data.get("scope") != scope:
+        return Snapshot(path, field, scope)
+
+    return Snapshot(path, field, scope, data.get("checkpoint"), data.get("records"))
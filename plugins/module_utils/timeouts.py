@@ -0,0 +1,75 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides the timeouts applied to Itential Platform requests.
+# It handles:
+# - Building the (connect, read) timeout passed to `requests` from the host's
+# `connect_timeout` and `read_timeout` options, where 0 means wait indefinitely.
+# - Overriding the read timeout for a single task with the `timeout` task argument.
+# - Enforcing an overall `deadline` across every request sent by a multi-call action,
+# shortening the timeout of each request to the time that is left and failing with
+# DeadlineExceeded once it has passed.
+
+import time
+from ansible.errors import AnsibleError
+
+
+class DeadlineExceeded(AnsibleError):
+    """Raised when a task runs past its deadline."""
+
+
+class Deadline(object):
+    """A point in time after which no further requests may be sent."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def check(self):
+        """Raise DeadlineExceeded if the deadline has passed."""
+        if self.remaining() <= 0:
+            raise DeadlineExceeded(f"Task deadline of {self.seconds} seconds exceeded")
+
+
+def _seconds(name, value):
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        raise AnsibleError(f"'{name}' must be a positive number, got {value!r}")
+    if seconds <= 0:
+        raise AnsibleError(f"'{name}' must be a positive number, got {value!r}")
+    return seconds
+
+
+def task_timeout(args):
+    """Return the `timeout` task argument in seconds, or None when it is not set."""
+    value = args.get("timeout")
+    return None if value is None else _seconds("timeout", value)
+
+
+def task_deadline(args):
+    """Return a Deadline for the `deadline` task argument, or None when it is not set."""
+    value = args.get("deadline")
+    return None if value is None else Deadline(_seconds("deadline", value))
+
+
+def request_timeout(host, timeout=None, deadline=None):
+    """Return the (connect, read) timeout for a request to host.
+
+    timeout overrides the host's read timeout.  When deadline is given
+    neither phase may wait past it.
+    """
+    connect = host.connect_timeout or None
+    read = timeout or host.read_timeout or None
+
+    if deadline is not None:
+        remaining = deadline.remaining()
+        connect = remaining if connect is None else min(connect, remaining)
+        read = remaining if read is None else min(read, remaining)
+
+    return (connect, read)
@@ -0,0 +1,143 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides the breakdown of where the time of an Itential Platform request was
+# spent, returned as the `timing` block of every request result.
+# It handles:
+# - Recording the time spent obtaining the auth token and where the token came from.
+# - Recording, across every attempt, the time spent opening connections (including DNS
+# resolution), in TLS handshakes, waiting for the response headers (time to first byte),
+# reading the body and waiting between retries.
+# - Recording the time spent parsing the JSON body, the number of body bytes received and
+# the number of attempts that failed.
+# - Combining the timings of several requests, such as the pages of a list, into one while
+# keeping the latency of each request.
+#
+# Each timing names the method and endpoint of its request so the `api_timing` callback
+# plugin can aggregate latency per endpoint across a run.
+#
+# All durations are in seconds.  `parse` is None when the body was not parsed separately
+# from reading it, for example when it was streamed.
+
+import datetime
+import time
+
+# Durations added up when timings are combined
+DURATIONS = ("total", "login", "connect", "tls", "ttfb", "transfer", "parse", "backoff")
+
+# Counters added up when timings are combined
+COUNTERS = ("attempts", "retries", "errors", "new_connections", "bytes")
+
+
+class RequestTiming(object):
+    """Where the time of a single request, including its retries, was spent.
+
+    attempts is the list of attempt records kept by the request layer, it is
+    read when the timing is reported.
+    """
+
+    def __init__(self, method=None, endpoint=None, attempts=None):
+        self.method = method
+        self.endpoint = endpoint
+        self.attempts = attempts if attempts is not None else []
+        self.start_time = time.perf_counter()
+        self.sent_at = None
+        self.login = 0.0
+        self.token_source = None
+        self.connect = 0.0
+        self.tls = 0.0
+        self.new_connections = 0
+        self.ttfb = 0.0
+        self.transfer = 0.0
+        self.parse = None
+        self.bytes = 0
+
+    def add_login(self, seconds, token_source):
+        self.login += seconds
+        self.token_source = token_source
+
+    def add_send(self, resp, seconds, connection, stream=False):
+        """Record an attempt that received resp after seconds.
+
+        connection is the session.connection_timing() of the attempt.  Unless
+        stream is True the body was read by the time the attempt returned.
+        """
+        self.connect += connection["connect"]
+        self.tls += connection["tls"]
+        self.new_connections += connection["new_connections"]
+
+        # requests measures the time until the response headers were parsed,
+        # which includes setting up the connection
+        elapsed = getattr(resp, "elapsed", None)
+        if isinstance(elapsed, datetime.timedelta):
+            headers = elapsed.total_seconds()
+        else:
+            headers = seconds
+        self.ttfb += max(0.0, headers - connection["connect"] - connection["tls"])
+        if not stream:
+            self.transfer += max(0.0, seconds - headers)
+            content = getattr(resp, "_content", None)
+            if isinstance(content, bytes):
+                self.bytes += len(content)
+
+    def add_transfer(self, seconds, size=0):
+        self.transfer += seconds
+        self.bytes += size
+
+    def add_parse(self, seconds):
+        self.parse = (self.parse or 0.0) + seconds
+
+    def as_dict(self):
+        return {
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "total": time.perf_counter() - self.start_time,
+            "login": self.login,
+            "connect": self.connect,
+            "tls": self.tls,
+            "ttfb": self.ttfb,
+            "transfer": self.transfer,
+            "parse": self.parse,
+            "backoff": sum(a["delay"] or 0.0 for a in self.attempts),
+            "attempts": len(self.attempts),
+            "retries": sum(1 for a in self.attempts if a["delay"] is not None),
+            "errors": sum(1 for a in self.attempts if a["error"] or (a["status"] or 0) >= 400),
+            "new_connections": self.new_connections,
+            "bytes": self.bytes,
+            "token_source": self.token_source,
+        }
+
+
+def combine(timings):
+    """Return the sum of a list of timing dicts.
+
+    `total` adds up the time of every request, so it exceeds the wall-clock
+    time when requests ran concurrently.  `requests` counts the timings,
+    `latencies` holds the total of each one, `logins` counts the ones that
+    logged in and `token_source` lists each source that was used.  The
+    method and endpoint are kept when every timing shares them.
+    """
+    combined = dict.fromkeys(DURATIONS, 0.0)
+    combined.update(dict.fromkeys(COUNTERS, 0))
+    combined["parse"] = None
+    sources = []
+
+    timings = list(timings)
+    for timing in timings:
+        for key in DURATIONS + COUNTERS:
+            if timing.get(key) is not None:
+                combined[key] = (combined[key] or 0) + timing[key]
+        if timing.get("token_source") and timing["token_source"] not in sources:
+            sources.append(timing["token_source"])
+
+    for key in ("method", "endpoint"):
+        values = {timing.get(key) for timing in timings}
+        combined[key] = values.pop() if len(values) == 1 else None
+
+    combined["requests"] = len(timings)
+    combined["latencies"] = [timing["total"] for timing in timings]
+    combined["logins"] = sum(1 for timing in timings if timing.get("token_source") == "login")
+    combined["token_source"] = sources
+    return combined
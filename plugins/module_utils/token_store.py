@@ -0,0 +1,159 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides a file-backed store for Itential Platform authentication tokens.
+# It handles:
+# - Persisting tokens on the controller so separate Ansible worker processes (forks) can
+# reuse a token obtained by another fork instead of logging in again.
+# - Keeping one JSON file per host, port and username, guarded by a sidecar lock file
+# using `fcntl.flock()` so concurrent readers and writers never see a partial entry.
+# - Writing entries atomically through a temporary file and `os.replace()`.
+# - Evicting entries that have expired or that the Itential Platform has rejected.
+# - Providing a per-entry login lock so only one worker process logs in at a time while
+# the others wait and reuse its token.
+#
+# Tokens are stored with owner-only permissions in `token_cache_dir`, which defaults
+# to `~/.ansible/itential_platform/tokens`.
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+DEFAULT_DIR = os.path.join("~", ".ansible", "itential_platform", "tokens")
+
+# Maximum number of seconds to wait for another process to finish logging in
+# before logging in regardless.  Protects against a stuck or killed process.
+LOGIN_LOCK_TIMEOUT = 60
+
+
+def _store_dir(host):
+    path = os.path.expanduser(host.token_cache_dir or DEFAULT_DIR)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+def _entry_path(host):
+    key = f"{host.host}|{host.port}|{host.username}".encode("utf-8")
+    return os.path.join(_store_dir(host), hashlib.sha256(key).hexdigest())
+
+
+@contextmanager
+def _locked(path, operation):
+    fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, operation)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _read(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def load(host):
+    """Return the stored (token, expires_at) tuple for host.
+
+    The expires_at value is a time.time() timestamp.  Returns None if there
+    is no entry for host or the entry has expired.
+    """
+    path = _entry_path(host)
+
+    with _locked(path, fcntl.LOCK_SH):
+        entry = _read(path)
+
+    if entry is None:
+        return None
+
+    if entry.get("expires_at", 0) > time.time():
+        return entry.get("token"), entry["expires_at"]
+
+    # The entry has expired, remove it unless another process replaced it
+    with _locked(path, fcntl.LOCK_EX):
+        entry = _read(path)
+        if entry is not None and entry.get("expires_at", 0) <= time.time():
+            _remove(path)
+
+    return None
+
+
+def save(host, token, ttl):
+    """Atomically store token for host, valid for ttl seconds."""
+    path = _entry_path(host)
+    entry = {"token": token, "expires_at": time.time() + ttl}
+
+    with _locked(path, fcntl.LOCK_EX):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except BaseException:
+            _remove(tmp)
+            raise
+
+
+def evict(host, token=None):
+    """Remove the stored token for host.
+
+    If token is given, the entry is only removed when it still holds that
+    token so a token refreshed by another process is not thrown away.
+    """
+    path = _entry_path(host)
+
+    with _locked(path, fcntl.LOCK_EX):
+        if token is not None:
+            entry = _read(path)
+            if entry is None or entry.get("token") != token:
+                return
+        _remove(path)
+
+
+@contextmanager
+def login_lock(host, timeout=None):
+    """Hold the cross-process login lock for host.
+
+    Waits up to timeout seconds (LOGIN_LOCK_TIMEOUT by default) for another
+    process to release the lock, then proceeds without it.
+    """
+    if timeout is None:
+        timeout = LOGIN_LOCK_TIMEOUT
+
+    fd = os.open(f"{_entry_path(host)}.login", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        deadline = time.monotonic() + timeout
+        locked = False
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                locked = True
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(0.05)
+        try:
+            yield locked
+        finally:
+            if locked:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
@@ -0,0 +1,182 @@
+# Copyright 2024, Itential Inc. All Rights Reserved
+
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module provides local span tracing of action plugins and Itential Platform requests.
+# It handles:
+# - Recording a span for every action plugin `run()`, API request and login, linked to its
+# parent through the trace and span ids so serial and concurrent fan-out can be told apart.
+# - Carrying the current span in a context variable, which `parallel.run_ordered()` copies
+# into the threads it runs calls on.
+# - Appending each finished span as one JSON line to the `trace_file` on the controller,
+# guarded by an `fcntl.flock()` lock so spans written by concurrent worker processes never
+# interleave.
+#
+# Spans use the field names of the OpenTelemetry span data model (trace_id, span_id,
+# parent_span_id, kind, start_time_unix_nano, attributes, events and status) so they can be
+# loaded by OpenTelemetry tooling without a collector.  Tracing is off unless the
+# `platform_trace_file` host variable is set, in which case an action and everything it
+# sends share a trace.
+
+import contextvars
+import fcntl
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+SERVICE_NAME = "itential.platform"
+
+INTERNAL = "SPAN_KIND_INTERNAL"
+CLIENT = "SPAN_KIND_CLIENT"
+
+STATUS_UNSET = "STATUS_CODE_UNSET"
+STATUS_ERROR = "STATUS_CODE_ERROR"
+
+_CURRENT = contextvars.ContextVar("itential_platform_span", default=None)
+
+
+def _new_id(size):
+    return os.urandom(size).hex()
+
+
+class Span(object):
+    """A timed operation within a trace."""
+
+    def __init__(self, name, trace_file, kind=INTERNAL, parent=None, attributes=None):
+        self.name = name
+        self.trace_file = trace_file
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent is not None else _new_id(16)
+        self.span_id = _new_id(8)
+        self.parent_span_id = parent.span_id if parent is not None else None
+        self.attributes = dict(attributes or {})
+        self.attributes["thread.name"] = threading.current_thread().name
+        self.events = []
+        self.status = {"code": STATUS_UNSET}
+        self.start_time = time.time_ns()
+        self.end_time = None
+
+    def set_attribute(self, key, value):
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, message):
+        self.status = {"code": STATUS_ERROR, "message": message}
+
+    def record_exception(self, exc):
+        self.events.append({
+            "name": "exception",
+            "time_unix_nano": time.time_ns(),
+            "attributes": {"exception.type": type(exc).__name__, "exception.message": str(exc)},
+        })
+        self.set_error(str(exc))
+
+    def as_dict(self):
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_time,
+            "end_time_unix_nano": self.end_time,
+            "attributes": self.attributes,
+            "events": self.events,
+            "status": self.status,
+            "resource": {"attributes": {"service.name": SERVICE_NAME, "process.pid": os.getpid()}},
+        }
+
+
+class _NoSpan(object):
+    """Stands in for a span when tracing is off."""
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_error(self, message):
+        pass
+
+    def record_exception(self, exc):
+        pass
+
+
+NO_SPAN = _NoSpan()
+
+
+def _write(span):
+    path = os.path.abspath(os.path.expanduser(span.trace_file))
+    line = json.dumps(span.as_dict(), separators=(",", ":"), default=str) + "\n"
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+    except OSError:
+        # Tracing never fails the traced operation
+        pass
+
+
+@contextmanager
+def span(name, trace_file=None, kind=INTERNAL, attributes=None):
+    """Record a span around the body of the with statement.
+
+    The span is a child of the current span, if any, and is written to the
+    current span's trace file.  Without a current span it starts a new trace
+    written to trace_file.  When neither is available tracing is off and a
+    stand-in that ignores everything is yielded.  An exception raised by the
+    body is recorded on the span and re-raised.
+    """
+    parent = _CURRENT.get()
+    trace_file = parent.trace_file if parent is not None else trace_file
+    if not trace_file:
+        yield NO_SPAN
+        return
+
+    current = Span(name, trace_file, kind, parent, attributes)
+    token = _CURRENT.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.record_exception(exc)
+        raise
+    finally:
+        _CURRENT.reset(token)
+        current.end_time = time.time_ns()
+        _write(current)
+
+
+def current():
+    """Return the current span, or a stand-in when tracing is off."""
+    return _CURRENT.get() or NO_SPAN
+
+
+def trace_file_for(task_vars):
+    """Return the trace file configured for the task's host, or None."""
+    hostvars = task_vars["hostvars"].get(task_vars["inventory_hostname"]) or {}
+    return hostvars.get("platform_trace_file")
+
+
+def trace_action(run):
+    """Decorate an action plugin's run() method to record a span around it."""
+
+    @functools.wraps(run)
+    def wrapper(self, tmp=None, task_vars=None):
+        attributes = {
+            "ansible.action": self._task.action,
+            "ansible.task.name": self._task.get_name() if hasattr(self._task, "get_name") else None,
+            "ansible.host": (task_vars or {}).get("inventory_hostname"),
+        }
+        path = trace_file_for(task_vars) if task_vars else None
+        with span(f"action {self._task.action}", path, attributes=attributes) as current:
+            result = run(self, tmp=tmp, task_vars=task_vars)
+            if isinstance(result, dict) and result.get("failed"):
+                current.set_error(str(result.get("msg", "failed")))
+            return result
+
+    return wrapper
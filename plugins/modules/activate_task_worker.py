@@ -18,6 +18,14 @@ short_description: Activate the task worker for an Itential Platform system
 description:
   - The M(itential.platform.activate_task_worker) module activates a
    task worker for an Itential Platform system.
+
+options:
+  timeout:
+    description:
+      - The number of seconds to wait for the response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
 """
 
 
@@ -19,9 +19,14 @@ description:
   - The M(itential.platform.auth_token) module generates an authentication token for an 
     Itential Platform system.
   - This token can be used to authenticate API requests within the platform.
-  - The module does not require any input parameters.
 
-options: {}
+options:
+  timeout:
+    description:
+      - The number of seconds to wait for the login response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
 
 """
 
@@ -0,0 +1,148 @@
+#!/usr/bin/python
+
+# Copyright 2024, Itential Inc. All Rights Reserved
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: itential.platform.batch_request
+author: Itential
+
+short_description: Send many API requests to an Itential Platform system from a single task.
+
+description:
+  - The M(itential.platform.batch_request) module sends a list of API requests to an
+    Itential Platform system from a single task, avoiding the per-item overhead of C(loop).
+  - Requests are sent over the host's pooled keep-alive session with up to C(concurrency)
+    requests in flight at the same time.
+  - Every request is sent even if another request fails.  Results are returned in the same
+    order as C(requests) and include the HTTP status, the JSON response body, the timing and
+    the error message for any request that failed.
+
+options:
+  requests:
+    description:
+      - The list of requests to send.
+    required: true
+    type: list
+    elements: dict
+    suboptions:
+      method:
+        description:
+          - The HTTP method to use for the request.
+        type: str
+        choices: [GET, PUT, POST, PATCH, DELETE]
+        default: GET
+      endpoint:
+        description:
+          - The API endpoint to send the request to (e.g., "/applications/list").
+        required: true
+        type: str
+      params:
+        description:
+          - Query parameters to include in the request.
+        type: dict
+      data:
+        description:
+          - The JSON-serializable request body.
+        type: dict
+      idempotent:
+        description:
+          - Whether this request may be sent again after the server may have acted on it.
+            Overrides the task's C(idempotent) option.
+        type: bool
+
+  concurrency:
+    description:
+      - The maximum number of requests in flight at the same time.
+    required: false
+    type: int
+    default: 4
+
+  fail_on_error:
+    description:
+      - Fail the task if any request fails.  The results of every request are returned
+        either way.
+    required: false
+    type: bool
+    default: true
+
+  fields:
+    description:
+      - Only return these fields of each JSON body, given as dotted paths such as
+        C(name) or C(metrics.start_time), either as a list or as a comma-separated string.
+      - Paths are applied to every item of a list, so the result holds only what the playbook needs.
+    required: false
+    type: list
+    elements: str
+    aliases: [select]
+
+  max_items:
+    description:
+      - Return at most this many items of each list body.
+    required: false
+    type: int
+
+  return_body:
+    description:
+      - Set to C(false) to leave the response body of each request out of the result, returning only
+        the status and timings.  The body is not parsed at all.
+    required: false
+    type: bool
+    default: true
+
+  timeout:
+    description:
+      - The number of seconds to wait for each response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
+
+  deadline:
+    description:
+      - The number of seconds sending every request may take in total.  Once the deadline passes
+        no further requests are sent and the
+        requests that were not sent are reported as failed.
+    required: false
+    type: float
+
+  idempotent:
+    description:
+      - Whether requests may be sent again after the server may have acted on them, for
+        example after a read timeout or a 502, 503 or 504 response.
+      - Defaults to C(true) for C(GET) requests and to C(false) for any other method, which
+        is then only retried when the connection could not be opened or the response was 429,
+        so a restart is never sent twice.
+    required: false
+    type: bool
+"""
+
+EXAMPLES = """
+  - name: Fetch several adapters, eight at a time
+    itential.platform.batch_request:
+      concurrency: 8
+      requests:
+        - endpoint: /adapters/network-adapter
+        - endpoint: /adapters/security-adapter
+        - method: PUT
+          endpoint: /adapters/email-adapter/restart
+
+  - name: Create users, continuing past failures
+    itential.platform.batch_request:
+      fail_on_error: false
+      requests:
+        - method: POST
+          endpoint: /users
+          data:
+            username: alice
+        - method: POST
+          endpoint: /users
+          data:
+            username: bob
+    register: created_users
+"""
@@ -51,6 +51,74 @@ options:
     required: false
     type: dict
 
+  fields:
+    description:
+      - Only return these fields of the JSON body, given as dotted paths such as
+        C(name) or C(metrics.start_time), either as a list or as a comma-separated string.
+      - Paths are applied to every item of a list, so the result holds only what the playbook needs.
+      - Ignored when C(dest) is given.
+    required: false
+    type: list
+    elements: str
+    aliases: [select]
+
+  max_items:
+    description:
+      - Return at most this many items of a list body, or of the C(data) list of a list response.
+    required: false
+    type: int
+
+  return_body:
+    description:
+      - Set to C(false) to leave the response body out of the result, returning only
+        the status and timings.  The body is not parsed at all.
+    required: false
+    type: bool
+    default: true
+
+  timeout:
+    description:
+      - The number of seconds to wait for the response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
+
+  compress:
+    description:
+      - Send the request body gzip compressed.  Bodies smaller than 1 KiB are
+        always sent uncompressed.
+    required: false
+    type: bool
+    default: false
+
+  idempotent:
+    description:
+      - Whether the request may be sent again after the server may have acted on it,
+        for example after a read timeout or a 502, 503 or 504 response.
+      - Defaults to C(true) for C(GET) and to C(false) for any other method, which is then
+        only retried when the connection could not be opened or the response was 429.
+    required: false
+    type: bool
+
+  dest:
+    description:
+      - The path of a file on the controller to stream the response body to instead of
+        returning it.  The body is written in chunks and the result only describes the
+        file (C(dest), C(size), C(checksum) and C(etag)).
+      - When the server returned an ETag for the previous download, the request is made
+        conditional and a C(304 Not Modified) response leaves the file in place.  The file
+        is also left in place, and no change is reported, when the body is unchanged.
+    required: false
+    type: path
+
+  checksum:
+    description:
+      - The expected checksum of the response body as C(<algorithm>:<hex digest>), for
+        example C(sha256:9f86d0...).  Requires C(dest).
+      - When C(dest) already matches the checksum no request is sent.  Otherwise the
+        downloaded body must match it or the task fails.
+    required: false
+    type: str
 """
 
 EXAMPLES = """
@@ -80,4 +148,17 @@ EXAMPLES = """
         status: running
         owner: "admin"
 
+  - name: Upload a large workflow with a compressed body
+    itential.platform.api_request:
+      method: POST
+      endpoint: "/automation-studio/automations"
+      data: "{{ lookup('file', 'workflow.json') | from_json }}"
+      compress: true
+
+  - name: Export every workflow to a file on the controller
+    itential.platform.api_request:
+      method: GET
+      endpoint: "/automation-studio/workflows"
+      dest: /var/backups/itential/workflows.json
+
 """
@@ -21,15 +21,87 @@ description:
   - Users can provide key-value pairs as arguments to filter the results based on job attributes.
   - Filters are dynamically converted to query parameters, allowing for flexible job retrieval.
   - The response includes the job name and status by default.
+  - When C(page_size) or C(dest) is given, every matching job is retrieved using limit/skip
+    pagination.  Pages after the first are fetched with up to C(concurrency) requests in flight.
+    Jobs are sorted by C(_id) so every page sees them in the same order.  When a page comes back
+    with fewer jobs than requested before the end, the rest are fetched one page at a time.
+    When the server does not report the total, pages are fetched until one comes back empty.
 
 options:
   <key>:
     description:
       - Any key-value pair can be provided as an argument to filter the job list.
       - The key corresponds to a job attribute, and the value restricts results to matching entries.
+      - The names of the options below, and C(select), are reserved.
     required: false
     type: str
 
+  page_size:
+    description:
+      - Retrieve every matching job, requesting this many jobs per page.
+      - Defaults to 100 when only C(dest) is given.
+    required: false
+    type: int
+
+  concurrency:
+    description:
+      - The maximum number of pages fetched at the same time.
+    required: false
+    type: int
+    default: 1
+
+  dest:
+    description:
+      - The path of a file on the controller to stream the matching jobs to, one JSON
+        document per line (NDJSON).
+      - The jobs are written as each page arrives and are not included in the result, so
+        memory use does not grow with the number of jobs.  The result reports the number of
+        jobs written in C(count) along with the C(size) and C(checksum) of the file.
+      - The file is only replaced, and the task only reports a change, when its content
+        differs.
+    required: false
+    type: path
+
+  fields:
+    description:
+      - Only return these fields of each job, given as dotted paths such as
+        C(name) or C(metrics.start_time), either as a list or as a comma-separated string.
+      - Paths are applied to every item of a list, so the result holds only what the playbook needs.
+      - The top-level fields of the paths are requested from the server instead of C(name) and C(status).
+    required: false
+    type: list
+    elements: str
+    aliases: [select]
+
+  max_items:
+    description:
+      - Return at most this many jobs.
+      - Without pagination the list is parsed as it is received and reading stops once
+        this many items have been kept, so large responses are never held in memory.
+    required: false
+    type: int
+
+  return_body:
+    description:
+      - Set to C(false) to leave the response body out of the result, returning only
+        the status and timings.  Without pagination the body is not parsed at all.
+    required: false
+    type: bool
+    default: true
+
+  timeout:
+    description:
+      - The number of seconds to wait for each response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
+
+  deadline:
+    description:
+      - The number of seconds retrieving the jobs may take in total.  Once the deadline passes
+        no further requests are sent and the task fails.
+    required: false
+    type: float
 """
 
 EXAMPLES = """
@@ -44,5 +116,22 @@ EXAMPLES = """
     itential.platform.get_jobs:
       name: "Example Job"
       status: completed
-"""
 
+  - name: Get every running job, 500 per page
+    itential.platform.get_jobs:
+      status: running
+      page_size: 500
+
+  - name: Export every completed job to a file, four pages at a time
+    itential.platform.get_jobs:
+      status: complete
+      page_size: 500
+      concurrency: 4
+      dest: /tmp/jobs.ndjson
+
+  - name: Get the name and status of at most ten running jobs
+    itential.platform.get_jobs:
+      status: running
+      fields: name,status
+      max_items: 10
+"""
@@ -18,6 +18,14 @@ short_description: Get the health of an Itential Platform system
 description:
   - The M(itential.platform.get_system_health) module returns the health of the
     Itential Platform system.
+
+options:
+  timeout:
+    description:
+      - The number of seconds to wait for the response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
 """
 
 
@@ -22,15 +22,102 @@ description:
   - Users can provide key-value pairs as arguments to filter the results based on task attributes.
   - Filters are dynamically converted to query parameters, allowing for flexible task retrieval.
   - The response includes the task name and status by default.
+  - When C(snapshot) is given, tasks are synchronized incrementally.  The snapshot file on the
+    controller stores every task retrieved so far and a checkpoint, the highest
+    C(checkpoint_field) value seen.  Later runs request only tasks whose C(checkpoint_field) is
+    at or after the checkpoint, merge them into the snapshot and return only the tasks that changed.
+  - Changing the filters or C(checkpoint_field) starts a new snapshot.
 
 options:
   <key>:
     description:
       - Any key-value pair can be provided as an argument to filter the task list.
       - The key corresponds to a task attribute, and the value restricts results to matching entries.
+      - The names of the options below, and C(select), are reserved.
     required: false
     type: str
 
+  snapshot:
+    description:
+      - The path of the snapshot file on the controller used for incremental synchronization.
+    required: false
+    type: path
+
+  checkpoint_field:
+    description:
+      - The task field compared against the checkpoint in incremental mode.
+    required: false
+    type: str
+    default: last_updated
+
+  dest:
+    description:
+      - The path of a file on the controller to stream the matching tasks to, one JSON
+        document per line (NDJSON), instead of returning them.
+      - The result reports the number of tasks written in C(count) along with the C(size)
+        and C(checksum) of the file.  The file is only replaced, and the task only reports
+        a change, when its content differs.
+      - Mutually exclusive with C(snapshot).
+    required: false
+    type: path
+
+  page_size:
+    description:
+      - The number of tasks requested per page in incremental mode or with C(dest).
+    required: false
+    type: int
+    default: 100
+
+  concurrency:
+    description:
+      - The maximum number of pages fetched at the same time in incremental mode or with
+        C(dest).
+    required: false
+    type: int
+    default: 1
+
+  fields:
+    description:
+      - Only return these fields of each task, given as dotted paths such as
+        C(name) or C(metrics.start_time), either as a list or as a comma-separated string.
+      - Paths are applied to every item of a list, so the result holds only what the playbook needs.
+      - The top-level fields of the paths are requested from the server instead of C(name), C(status)
+        and C(type).
+      - The snapshot file stores those top-level fields whole, only the returned tasks are projected.
+    required: false
+    type: list
+    elements: str
+    aliases: [select]
+
+  max_items:
+    description:
+      - Return at most this many tasks.
+      - Without pagination the list is parsed as it is received and reading stops once
+        this many items have been kept, so large responses are never held in memory.
+    required: false
+    type: int
+
+  return_body:
+    description:
+      - Set to C(false) to leave the response body out of the result, returning only
+        the status and timings.  Without pagination the body is not parsed at all.
+    required: false
+    type: bool
+    default: true
+
+  timeout:
+    description:
+      - The number of seconds to wait for each response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
+
+  deadline:
+    description:
+      - The number of seconds retrieving the tasks may take in total.  Once the deadline passes
+        no further requests are sent and the task fails.
+    required: false
+    type: float
 """
 
 EXAMPLES = """
@@ -41,5 +128,10 @@ EXAMPLES = """
     itential.platform.get_tasks:
       name: "Example Task"
       status: active
+
+  - name: Poll for tasks changed since the previous run
+    itential.platform.get_tasks:
+      snapshot: /var/lib/itential/tasks.json
+    register: changed_tasks
 """
 
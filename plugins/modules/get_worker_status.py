@@ -18,6 +18,14 @@ short_description: Get the worker status from an Itential Platform system
 description:
   - The M(itential.platform.get_worker_status) module returns the status of job
    and task workers from an Itential Platform system.
+
+options:
+  timeout:
+    description:
+      - The number of seconds to wait for the response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
 """
 
 
@@ -21,6 +21,9 @@ description:
   - This module communicates with the Itential Platform API to perform the restart operation.
   - The C(adapter_names) parameter supports both a single adapter name (as a string) and 
     multiple adapter names (as a list).
+  - Every adapter is restarted even if another restart fails.  Results are returned in the
+    same order as C(adapter_names) and include the adapter name, the duration of the restart
+    and the error message for any restart that failed.
 
 options:
   adapter_names:
@@ -29,6 +32,28 @@ options:
     required: true
     type: list
     elements: str
+
+  concurrency:
+    description:
+      - The maximum number of adapters restarted at the same time.
+    required: false
+    type: int
+    default: 1
+
+  timeout:
+    description:
+      - The number of seconds to wait for each response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
+
+  deadline:
+    description:
+      - The number of seconds restarting every adapter may take in total.  Once the deadline passes
+        no further requests are sent and the
+        adapters that were not restarted are reported as failed.
+    required: false
+    type: float
 """
 
 EXAMPLES = """
@@ -49,4 +74,17 @@ EXAMPLES = """
         - network-adapter
         - security-adapter
     delegate_to: localhost
+
+  - name: Restart all adapters, four at a time
+    itential.platform.restart_adapters:
+      adapter_names: "{{ adapter_list }}"
+      concurrency: 4
+    delegate_to: localhost
+
+  - name: Restart all adapters, giving up after five minutes
+    itential.platform.restart_adapters:
+      adapter_names: "{{ adapter_list }}"
+      concurrency: 4
+      deadline: 300
+    delegate_to: localhost
 """
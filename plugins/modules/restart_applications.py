@@ -21,6 +21,14 @@ description:
   - This module communicates with the Itential Platform API to perform the restart operation.
   - The C(application_names) parameter supports both a single application name (as a string) and 
     multiple application names (as a list).
+  - When C(rolling) is enabled the applications are restarted in batches of C(batch_size).
+    Each batch must report C(RUNNING) through the C(/health/applications) endpoint before the
+    next batch starts.  Health checks back off exponentially until C(wait_timeout) expires.
+  - An application only counts as restarted once a health check shows it was not running
+    or reports an C(uptime) shorter than the time since the restart was requested, so the
+    instance running before the restart is never mistaken for the restarted one.
+  - A rolling restart stops at the first batch that fails and reports the applications
+    that were not restarted in C(skipped_applications).
 
 options:
   application_names:
@@ -29,6 +37,51 @@ options:
     required: true
     type: list
     elements: str
+
+  rolling:
+    description:
+      - Restart the applications in batches, waiting for each batch to report running
+        before the next batch starts.
+    required: false
+    type: bool
+    default: false
+
+  batch_size:
+    description:
+      - The number of applications restarted together in rolling mode.
+    required: false
+    type: int
+    default: 1
+
+  pause:
+    description:
+      - The number of seconds to wait between batches in rolling mode.
+    required: false
+    type: int
+    default: 0
+
+  wait_timeout:
+    description:
+      - The number of seconds to wait for each batch to report running in rolling mode.
+    required: false
+    type: int
+    default: 300
+
+  timeout:
+    description:
+      - The number of seconds to wait for each response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
+
+  deadline:
+    description:
+      - The number of seconds restarting every application, including
+        health checks and pauses, may take in total.  Once the deadline passes
+        no further requests are sent and the applications that were not
+        restarted are reported as failed.
+    required: false
+    type: float
 """
 
 EXAMPLES = """
@@ -49,4 +102,15 @@ EXAMPLES = """
         - OperationsManager
         - ag-manager
     delegate_to: localhost
+
+  - name: Rolling restart, two applications at a time
+    itential.platform.restart_applications:
+      application_names:
+        - OperationsManager
+        - ag-manager
+        - AutomationStudio
+      rolling: true
+      batch_size: 2
+      pause: 10
+    delegate_to: localhost
 """
@@ -38,6 +38,13 @@ options:
       - Valid values are C(file) and C(console).
     required: true
     type: str
+
+  timeout:
+    description:
+      - The number of seconds to wait for the response, overriding the
+        C(read_timeout) connection option for this task.
+    required: false
+    type: float
 """
 
 EXAMPLES = """
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+"""bench_host_overhead
+This script measures the per-call overhead of building the host object used by
+`make_request()`, comparing the original path (parse the host schema and build a
+new host for every call) against the memoized `get_host()` path.
+
+The collection and `itential.core` must be importable, for example by running
+the script from a directory containing `ansible_collections/itential/`.
+"""
+
+import sys
+import timeit
+
+from ansible.module_utils.common import yaml
+from ansible_collections.itential.core.plugins.module_utils import hosts
+from ansible_collections.itential.platform.plugins.module_utils import host as spec
+from ansible_collections.itential.platform.plugins.module_utils import request
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+hostvars = {
+    "ansible_host": "example.com",
+    "platform_port": 3000,
+    "platform_username": "admin",
+    "platform_password": "admin",
+    "platform_http_headers": {"x-custom": "value"},
+}
+
+
+def uncached():
+    schema = yaml.yaml_load(spec.DOCUMENTATION)
+    host = hosts.new(schema, hostvars)
+    headers = host.headers or {}
+    headers.update({
+        "content-type": "application/json",
+        "accept": "application/json"
+    })
+
+
+def cached():
+    request._load_host(hostvars)
+
+
+for name, func in (("uncached", uncached), ("cached", cached)):
+    seconds = timeit.timeit(func, number=ITERATIONS)
+    print(f"{name:>10}: {seconds / ITERATIONS * 1e6:10.1f} us/call ({ITERATIONS} calls)")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+"""bench_json_stream
+This script compares the peak memory and time needed to count the records of a
+large list response, parsed either in full with `json.loads()` (what
+`resp.json()` does) or one record at a time with `json_stream.ArrayStream`.
+
+Usage: bench_json_stream.py [RECORDS]
+
+The collection must be importable, for example by running the script from a
+directory containing `ansible_collections/itential/`.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+from ansible_collections.itential.platform.plugins.module_utils.json_stream import ArrayStream
+
+RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+CHUNK_SIZE = 64 * 1024
+
+
+def document():
+    jobs = [
+        {"_id": f"{i:024x}", "name": f"job-{i}", "status": "complete", "variables": {"device": f"router-{i % 50}"}}
+        for i in range(RECORDS)
+    ]
+    return json.dumps({"data": jobs, "metadata": {"total": RECORDS}}).encode("utf-8")
+
+
+def chunks(body):
+    for i in range(0, len(body), CHUNK_SIZE):
+        yield body[i:i + CHUNK_SIZE]
+
+
+def full(body):
+    # Joining the chunks mirrors requests reading the whole body before resp.json()
+    return len(json.loads(b"".join(chunks(body)))["data"])
+
+
+def streamed(body):
+    return sum(1 for _ in ArrayStream(chunks(body)))
+
+
+def measure(func, body):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = func(body)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    body = document()
+    print(f"{RECORDS} records, {len(body) / 1e6:.1f} MB response body")
+
+    for name, func in (("json.loads", full), ("ArrayStream", streamed)):
+        count, elapsed, peak = measure(func, body)
+        print(f"{name:>12}: {count} records, {elapsed:6.2f} s, peak {peak / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
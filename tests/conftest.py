@@ -31,6 +31,28 @@ def cleanup():
         except Exception as e:
             print(f"Could not remove {collections_path}: {e}")
 
+@pytest.fixture(autouse=True)
+def reset_token_cache(tmp_path, monkeypatch):
+    """Ensure every test starts with an empty auth token cache and token store."""
+    from ansible_collections.itential.platform.plugins.module_utils import login as login_utils
+    from ansible_collections.itential.platform.plugins.module_utils import token_store
+    monkeypatch.setattr(token_store, "DEFAULT_DIR", str(tmp_path / "tokens"))
+    login_utils.clear_token_cache()
+    yield
+    login_utils.clear_token_cache()
+
+@pytest.fixture(autouse=True)
+def reset_sessions():
+    """Ensure pooled HTTP sessions, circuit breakers and cached host objects do not leak between tests."""
+    from ansible_collections.itential.platform.plugins.module_utils import request
+    request.clear_host_cache()
+    yield
+    from ansible_collections.itential.platform.plugins.module_utils import session
+    from ansible_collections.itential.platform.plugins.module_utils import circuit_breaker
+    session.close_sessions()
+    circuit_breaker.reset_breakers()
+    request.clear_host_cache()
+
 # Mock the inventory
 @pytest.fixture
 def mock_task_vars():
@@ -61,8 +83,54 @@ def mock_http_login_response():
     login_response.text = json.dumps({"token": "mocked_token"})
     return login_response
 
+@pytest.fixture
+def make_action():
+    """Fixture returning a factory that builds an action plugin for a mocked task.
+
+    The task's action is named after the plugin's module, as Ansible would
+    resolve it, and its args default to an empty dict.
+    """
+    def factory(action_class, args=None):
+        mock_task = MagicMock()
+        mock_task.action = f"itential.platform.{action_class.__module__.rsplit('.', 1)[-1]}"
+        mock_task.args = args if args is not None else {}
+        return action_class(
+            task=mock_task,
+            connection=MagicMock(),
+            play_context=MagicMock(),
+            loader=MagicMock(),
+            templar=MagicMock(),
+            shared_loader_obj=MagicMock()
+        )
+
+    return factory
+
+@pytest.fixture
+def fake_send_request():
+    """Fixture returning a factory for `send_request` side effects that answer by URL.
+
+    Logins are answered with a token.  Every other request is passed to
+    handler(method, url, params), which returns either the JSON body of a 200
+    response or a mocked response to send back as is.
+    """
+    def factory(handler):
+        def send_request(host, method, url, params=None, **kwargs):
+            if url.endswith("/login"):
+                return MagicMock(status_code=200, text="mocked_token")
+            body = handler(method, url, params)
+            if isinstance(body, MagicMock):
+                return body
+            resp = MagicMock(status_code=200, text=json.dumps(body))
+            resp.headers = {"Content-Type": "application/json"}
+            resp.json.return_value = body
+            return resp
+
+        return send_request
+
+    return factory
+
 @pytest.fixture
 def mock_http_request():
     """Fixture to mock HTTP requests."""
-    with pytest.patch("ansible_collections.itential.core.plugins.module_utils.http.send_request") as mock_request:
+    with pytest.patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request") as mock_request:
         yield mock_request
\ No newline at end of file
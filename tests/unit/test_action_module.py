@@ -17,7 +17,7 @@ from ansible_collections.itential.platform.plugins.action.get_worker_status impo
     (GetSystemHealth, "/health/system", "GET"),
     (GetWorkerStatus, "/workflow_engine/workers/status", "GET")
 ])
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_action_module_success(mock_http_request, mock_http_login_response, mock_task_vars, action_module_class, expected_endpoint, expected_method):
     """Test that each action module makes the correct API request and handles the response properly."""
 
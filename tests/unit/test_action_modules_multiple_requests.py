@@ -12,15 +12,15 @@ from ansible_collections.itential.platform.plugins.action.restart_applications i
     (RestartApplication, {"application_names": "AGManager"}, ["/applications/AGManager/restart"]),
     (RestartApplication, {"application_names": ["AGManager", "ConfigManager"]}, ["/applications/AGManager/restart", "/applications/ConfigManager/restart"]),
 ])
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_action_module_multiple_requests(mock_http_request, mock_http_login_response, mock_task_vars, action_module_class, input_args, expected_endpoints):
     """Test action modules that make multiple API requests based on input arguments."""
 
     api_response = MagicMock(status_code=200, text=json.dumps({"status": "success"}))
     api_response.json.return_value = {"status": "success"}
 
-    # Since login is executed for each request, we expect (2 * len(expected_endpoints)) calls
-    mock_http_request.side_effect = [mock_http_login_response, api_response] * len(expected_endpoints)
+    # The auth token is cached after the first login, so we expect one login followed by one call per request
+    mock_http_request.side_effect = [mock_http_login_response] + [api_response] * len(expected_endpoints)
 
     # Mock task arguments
     mock_task = MagicMock()
@@ -47,16 +47,16 @@ def test_action_module_multiple_requests(mock_http_request, mock_http_login_resp
         assert "json" in res
         assert res["json"].get("status") == "success"
 
-    # Verify that the number of calls matches the expected count (login + request per adapter/app)
-    expected_call_count = len(expected_endpoints) * 2
+    # Verify that the number of calls matches the expected count (single login + request per adapter/app)
+    expected_call_count = len(expected_endpoints) + 1
     actual_call_count = len(mock_http_request.call_args_list)
 
     assert actual_call_count == expected_call_count, f"Expected {expected_call_count} calls but got {actual_call_count}"
 
     # Verify that the API requests match expected endpoints
     for i, expected_endpoint in enumerate(expected_endpoints):
-        second_call_index = (i * 2) + 1  # The second call for each adapter/application is the actual request
-        actual_call = mock_http_request.call_args_list[second_call_index]
+        request_call_index = i + 1  # The first call is the login, the rest are the actual requests
+        actual_call = mock_http_request.call_args_list[request_call_index]
         assert actual_call[1]["method"] == "PUT"
         assert actual_call[1]["url"].endswith(expected_endpoint)
 
@@ -72,7 +72,7 @@ def test_action_module_multiple_requests(mock_http_request, mock_http_login_resp
     (RestartApplication, {}, pytest.raises(AnsibleError, match="'application_names' must be provided.")),
     (RestartApplication, {"application_names": {"invalid": "dict"}}, pytest.raises(AnsibleError, match="'application_names' must be a string or a list of strings.")),
 ])
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_action_module_invalid_args(mock_http_request, mock_http_login_response, mock_task_vars, action_module_class, input_args, expected_exception):
     """Test action modules with missing or invalid required arguments."""
 
@@ -95,3 +95,136 @@ def test_action_module_invalid_args(mock_http_request, mock_http_login_response,
 
     with expected_exception:
         action_module.run(task_vars=mock_task_vars)
+
+
+def application_api(states):
+    """Return a fake_send_request handler that simulates restarts and health checks by URL."""
+    states = {app: list(health) for app, health in states.items()}
+
+    def handler(method, url, params):
+        if method == "PUT":
+            return {"status": "success"}
+        app = url.split("/")[-1]
+        health = states[app].pop(0) if len(states[app]) > 1 else states[app][0]
+        return dict({"id": app}, **(health if isinstance(health, dict) else {"state": health}))
+
+    return handler
+
+
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_applications_rolling(mock_http_request, mock_sleep, mock_task_vars, make_action, fake_send_request):
+    """Test that a rolling restart waits for each batch to report RUNNING before the next batch."""
+
+    mock_http_request.side_effect = fake_send_request(application_api({
+        "A": ["STOPPED", "RUNNING"],
+        "B": [{"state": "RUNNING", "uptime": 0}],
+        "C": [{"state": "RUNNING", "uptime": 0}],
+    }))
+
+    action_module = make_action(RestartApplication, {"application_names": ["A", "B", "C"], "rolling": True, "batch_size": 2, "pause": 5})
+
+    result = action_module.run(task_vars=mock_task_vars)
+
+    assert "failed" not in result
+    assert [r["application"] for r in result["results"]] == ["A", "B", "C"]
+    assert result["results"][0]["health_checks"] == 2
+    assert all(r["state"] == "RUNNING" for r in result["results"])
+
+    # C is only restarted after both A and B reported RUNNING
+    urls = [c[1]["url"] for c in mock_http_request.call_args_list]
+    c_restart = urls.index(next(u for u in urls if u.endswith("/applications/C/restart")))
+    assert urls.count(next(u for u in urls if u.endswith("/health/applications/A"))) == 2
+    assert max(i for i, u in enumerate(urls) if "/health/applications/" in u and not u.endswith("/C")) < c_restart
+
+    # The pause between batches was honored
+    assert 5 in [c[0][0] for c in mock_sleep.call_args_list]
+
+
+@pytest.mark.parametrize("states, health_checks", [
+    ([{"state": "RUNNING", "uptime": 86400}, "STOPPED", "RUNNING"], 3),
+    ([{"state": "RUNNING", "uptime": 86400}, {"state": "RUNNING", "uptime": 0}], 2),
+])
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_applications_rolling_ignores_previous_instance(mock_http_request, mock_sleep, mock_task_vars, states, health_checks, make_action, fake_send_request):
+    """Test that RUNNING reported by the instance from before the restart does not pass the health gate."""
+
+    mock_http_request.side_effect = fake_send_request(application_api({"A": states}))
+
+    action_module = make_action(RestartApplication, {"application_names": ["A"], "rolling": True})
+
+    result = action_module.run(task_vars=mock_task_vars)
+
+    assert "failed" not in result
+    assert result["results"][0]["health_checks"] == health_checks
+
+
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_applications_rolling_never_restarted(mock_http_request, mock_sleep, mock_task_vars, make_action, fake_send_request):
+    """Test that an application that keeps running without restarting fails the batch."""
+
+    mock_http_request.side_effect = fake_send_request(application_api({"A": [{"state": "RUNNING", "uptime": 86400}]}))
+
+    action_module = make_action(RestartApplication, {"application_names": ["A"], "rolling": True, "wait_timeout": 0})
+
+    result = action_module.run(task_vars=mock_task_vars)
+
+    assert result["failed"] is True
+    assert "did not report RUNNING after restarting" in result["results"][0]["msg"]
+
+
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_applications_rolling_wait_shortened_by_deadline(mock_http_request, mock_sleep, mock_task_vars, make_action, fake_send_request):
+    """Test that the failure reports the wait actually used when the deadline shortened it."""
+
+    mock_http_request.side_effect = fake_send_request(application_api({"A": [{"state": "RUNNING", "uptime": 86400}]}))
+
+    action_module = make_action(RestartApplication, {"application_names": ["A"], "rolling": True, "deadline": 0.05})
+
+    result = action_module.run(task_vars=mock_task_vars)
+
+    assert result["failed"] is True
+    assert "within 0.0" in result["results"][0]["msg"]
+    assert "300" not in result["results"][0]["msg"]
+
+
+@pytest.mark.parametrize("args, message", [
+    ({"batch_size": 0}, "'batch_size' must be a positive integer"),
+    ({"batch_size": "two"}, "'batch_size' must be a positive integer"),
+    ({"pause": "soon"}, "'pause' must be a non-negative number"),
+    ({"pause": -1}, "'pause' must be a non-negative number"),
+    ({"wait_timeout": "forever"}, "'wait_timeout' must be a non-negative number"),
+])
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_applications_rolling_invalid_args(mock_http_request, mock_task_vars, make_action, args, message):
+    """Test that invalid rolling options are rejected, naming the option, before anything is restarted."""
+
+    action_module = make_action(RestartApplication, dict({"application_names": ["A"], "rolling": True}, **args))
+
+    with pytest.raises(AnsibleError, match=message):
+        action_module.run(task_vars=mock_task_vars)
+
+    mock_http_request.assert_not_called()
+
+
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_applications_rolling_stops_on_failure(mock_http_request, mock_sleep, mock_task_vars, make_action, fake_send_request):
+    """Test that a rolling restart stops when a batch never reports RUNNING."""
+
+    mock_http_request.side_effect = fake_send_request(application_api({
+        "A": ["STOPPED"],
+        "B": ["RUNNING"],
+    }))
+
+    action_module = make_action(RestartApplication, {"application_names": ["A", "B"], "rolling": True, "wait_timeout": 0})
+
+    result = action_module.run(task_vars=mock_task_vars)
+
+    assert result["failed"] is True
+    assert result["skipped_applications"] == ["B"]
+    assert "did not report RUNNING" in result["results"][0]["msg"]
+    assert not any(c[1]["url"].endswith("/applications/B/restart") for c in mock_http_request.call_args_list)
@@ -0,0 +1,113 @@
+import pytest
+import json
+from unittest.mock import MagicMock
+from ansible_collections.itential.platform.plugins.callback import api_timing
+from ansible_collections.itential.platform.plugins.callback.api_timing import CallbackModule
+
+
+def timing(endpoint, total, method="GET", token_source="cache", **kwargs):
+    return dict({
+        "method": method,
+        "endpoint": endpoint,
+        "total": total,
+        "ttfb": total,
+        "bytes": 100,
+        "errors": 0,
+        "token_source": token_source,
+    }, **kwargs)
+
+
+def task_result(result, action="itential.platform.generic_request", args=None):
+    mock = MagicMock()
+    mock._result = result
+    mock._task.resolved_action = action
+    mock._task.args = args or {}
+    return mock
+
+
+@pytest.fixture
+def callback(tmp_path):
+    callback = CallbackModule()
+    options = {"display": True, "output_file": str(tmp_path / "timing.json")}
+    callback.get_option = options.get
+    callback._display = MagicMock()
+    return callback
+
+
+def test_percentile():
+    """Test that percentiles interpolate between the closest ranks."""
+
+    values = list(range(1, 101))
+
+    assert api_timing.percentile(values, 50) == pytest.approx(50.5)
+    assert api_timing.percentile(values, 99) == pytest.approx(99.01)
+    assert api_timing.percentile([3.0], 95) == 3.0
+    assert api_timing.percentile([], 50) is None
+
+
+def test_aggregates_per_endpoint(callback, tmp_path):
+    """Test that timings from single, loop and paginated results are aggregated per endpoint."""
+
+    callback.v2_runner_on_ok(task_result({"timing": timing("/health/status", 0.1, token_source="login")}))
+    callback.v2_runner_on_ok(task_result({"results": [
+        {"timing": timing("/health/status", 0.3)},
+        {"timing": timing("/adapters/a/restart", 2.0, method="PUT", errors=1)},
+    ]}))
+    callback.v2_runner_on_ok(task_result({"timing": timing("/operations-manager/jobs", 0.75, latencies=[0.25, 0.5], logins=1, bytes=400)}))
+    callback.v2_playbook_on_stats(MagicMock())
+
+    summary = json.loads((tmp_path / "timing.json").read_text())
+    endpoints = {(e["method"], e["endpoint"]): e for e in summary["endpoints"]}
+
+    health = endpoints[("GET", "/health/status")]
+    assert health["count"] == 2
+    assert health["p50"] == pytest.approx(0.2)
+    assert health["bytes"] == 200
+    assert health["logins"] == 1
+
+    assert endpoints[("PUT", "/adapters/a/restart")]["errors"] == 1
+
+    jobs = endpoints[("GET", "/operations-manager/jobs")]
+    assert jobs["count"] == 2
+    assert jobs["logins"] == 1
+    assert jobs["bytes"] == 400
+
+    # The slowest endpoint by total time comes first
+    assert summary["endpoints"][0]["endpoint"] == "/adapters/a/restart"
+
+    lines = [c[0][0] for c in callback._display.display.call_args_list]
+    assert lines[0].split() == ["METHOD", "ENDPOINT", "COUNT", "P50", "P95", "P99", "BYTES", "ERRORS", "LOGINS"]
+    assert len(lines) == 4
+
+
+def test_failed_task_counted_as_error(callback, tmp_path):
+    """Test that a failed task of this collection without timing counts as an error of its endpoint."""
+
+    callback.v2_runner_on_failed(task_result({"failed": True, "msg": "boom"}, args={"method": "POST", "endpoint": "/workflows"}))
+    callback.v2_runner_on_failed(task_result({"failed": True}, action="ansible.builtin.command"))
+    callback.v2_playbook_on_stats(MagicMock())
+
+    summary = json.loads((tmp_path / "timing.json").read_text())
+
+    assert summary["endpoints"] == [{
+        "method": "POST",
+        "endpoint": "/workflows",
+        "count": 0,
+        "p50": None,
+        "p95": None,
+        "p99": None,
+        "total": 0,
+        "bytes": 0,
+        "errors": 1,
+        "logins": 0,
+    }]
+
+
+def test_nothing_recorded(callback, tmp_path):
+    """Test that nothing is displayed or written when no Itential Platform requests were sent."""
+
+    callback.v2_runner_on_ok(task_result({"changed": False}, action="ansible.builtin.debug"))
+    callback.v2_playbook_on_stats(MagicMock())
+
+    callback._display.display.assert_not_called()
+    assert not (tmp_path / "timing.json").exists()
@@ -4,18 +4,17 @@ from ansible.errors import AnsibleError
 from ansible_collections.itential.platform.plugins.action.auth_token import ActionModule
 
 
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 @patch("ansible_collections.itential.core.plugins.module_utils.hosts.new")
-@patch("ansible.module_utils.common.yaml.yaml_load")
-def test_auth_token_success(mock_yaml_load, mock_host_new, mock_http_request, mock_task_vars):
+def test_auth_token_success(mock_host_new, mock_http_request, mock_task_vars):
     """Test successful authentication token retrieval."""
 
-    mock_yaml_load.return_value = {"mock_schema": True}
-
     # Mock host object
     mock_host_instance = MagicMock()
     mock_host_instance.username = "mock_user"
     mock_host_instance.password = "mock_pass"
+    mock_host_instance.token_cache_ttl = 600
+    mock_host_instance.token_cache_shared = False
     mock_host_new.return_value = mock_host_instance
 
     # Define a proper mock response for send_request()
@@ -43,17 +42,16 @@ def test_auth_token_success(mock_yaml_load, mock_host_new, mock_http_request, mo
     assert result == {"auth_token": "mocked_auth_token"}
 
 
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 @patch("ansible_collections.itential.core.plugins.module_utils.hosts.new")
-@patch("ansible.module_utils.common.yaml.yaml_load")
-def test_auth_token_login_failure(mock_yaml_load, mock_host_new, mock_http_request, mock_task_vars):
+def test_auth_token_login_failure(mock_host_new, mock_http_request, mock_task_vars):
     """Test failure when login function raises an AnsibleError."""
 
-    mock_yaml_load.return_value = {"mock_schema": True}
-
     mock_host_instance = MagicMock()
     mock_host_instance.username = "mock_user"
     mock_host_instance.password = "mock_pass"
+    mock_host_instance.token_cache_ttl = 600
+    mock_host_instance.token_cache_shared = False
     mock_host_new.return_value = mock_host_instance
 
     # Simulate login failure
@@ -0,0 +1,95 @@
+import pytest
+import requests
+from urllib.parse import urlparse
+from unittest.mock import MagicMock, patch
+from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.action.batch_request import ActionModule as BatchRequest
+
+
+def echo_api(method, url, params):
+    """Echo the method and path back, failing any request to a `/missing` endpoint."""
+    if url.endswith("/missing"):
+        return MagicMock(status_code=404, text="Not Found")
+    return {"method": method, "path": urlparse(url).path}
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_batch_request_success(mock_http_request, mock_task_vars, make_action, fake_send_request):
+    """Test that every request is sent and results are returned in input order."""
+
+    mock_http_request.side_effect = fake_send_request(echo_api)
+
+    requests = [
+        {"endpoint": "/adapters/a"},
+        {"method": "PUT", "endpoint": "/adapters/b/restart"},
+        {"method": "POST", "endpoint": "/users", "data": {"username": "alice"}},
+    ]
+
+    result = make_action(BatchRequest, {"requests": requests, "concurrency": 3}).run(task_vars=mock_task_vars)
+
+    assert "failed" not in result
+    assert result["failed_count"] == 0
+    assert [r["endpoint"] for r in result["results"]] == ["/adapters/a", "/adapters/b/restart", "/users"]
+    assert [r["json"]["method"] for r in result["results"]] == ["GET", "PUT", "POST"]
+    assert all(r["status"] == 200 and "duration" in r for r in result["results"])
+
+    # One login shared by every request
+    assert sum(1 for c in mock_http_request.call_args_list if c[1]["url"].endswith("/login")) == 1
+
+
+@pytest.mark.parametrize("fail_on_error", [True, False])
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_batch_request_partial_failure(mock_http_request, mock_task_vars, make_action, fake_send_request, fail_on_error):
+    """Test that a failed request is captured without stopping the others."""
+
+    mock_http_request.side_effect = fake_send_request(echo_api)
+
+    requests = [{"endpoint": "/adapters/a"}, {"endpoint": "/missing"}, {"endpoint": "/adapters/c"}]
+
+    result = make_action(BatchRequest, {"requests": requests, "fail_on_error": fail_on_error}).run(task_vars=mock_task_vars)
+
+    assert result["failed_count"] == 1
+    assert result["results"][1]["failed"] is True
+    assert "status 404" in result["results"][1]["msg"]
+    assert result["results"][2]["json"]["path"] == "/adapters/c"
+    assert result.get("failed", False) is fail_on_error
+
+
+@pytest.mark.parametrize("args, message", [
+    ({}, "'requests' must be a non-empty list."),
+    ({"requests": "not-a-list"}, "'requests' must be a non-empty list."),
+    ({"requests": ["/adapters"]}, r"'requests\[0\]' must be a dictionary."),
+    ({"requests": [{"method": "GET"}]}, r"'requests\[0\].endpoint' must be provided."),
+    ({"requests": [{"endpoint": "/a"}, {"method": "FETCH", "endpoint": "/b"}]}, r"Invalid HTTP method 'FETCH' in 'requests\[1\]'"),
+])
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_batch_request_invalid_args(mock_http_request, mock_task_vars, make_action, args, message):
+    """Test that invalid requests are rejected before anything is sent."""
+
+    with pytest.raises(AnsibleError, match=message):
+        make_action(BatchRequest, args).run(task_vars=mock_task_vars)
+
+    mock_http_request.assert_not_called()
+
+
+@pytest.mark.parametrize("entry, sent", [
+    ({"method": "PUT", "endpoint": "/adapters/email-adapter/restart"}, 1),
+    ({"method": "PUT", "endpoint": "/adapters/email-adapter/restart", "idempotent": True}, 3),
+    ({"endpoint": "/adapters/email-adapter"}, 3),
+])
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_batch_request_not_idempotent_not_resent(mock_http_request, mock_sleep, mock_task_vars, make_action, fake_send_request, entry, sent):
+    """Test that only idempotent requests are sent again after a read timeout."""
+
+    mock_task_vars["hostvars"]["platform"]["platform_http_retries"] = 2
+
+    def handler(method, url, params):
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    mock_http_request.side_effect = fake_send_request(handler)
+
+    result = make_action(BatchRequest, {"requests": [entry]}).run(task_vars=mock_task_vars)
+
+    assert result["failed_count"] == 1
+    assert sum(1 for c in mock_http_request.call_args_list if c.kwargs["url"].endswith(entry["endpoint"])) == sent
@@ -0,0 +1,95 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from ansible_collections.itential.platform.plugins.module_utils import circuit_breaker
+from ansible_collections.itential.platform.plugins.module_utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+def test_opens_after_threshold():
+    """Test that the circuit opens after `threshold` consecutive failures."""
+    breaker = CircuitBreaker("example.com", threshold=3, reset_timeout=30)
+
+    for _ in range(3):
+        breaker.before_request()
+        breaker.record_failure()
+
+    assert breaker.state == circuit_breaker.OPEN
+    assert breaker.opened_count == 1
+    with pytest.raises(CircuitOpenError, match="after 3 consecutive failures"):
+        breaker.before_request()
+
+
+def test_success_resets_failures():
+    """Test that a success in between failures keeps the circuit closed."""
+    breaker = CircuitBreaker("example.com", threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == circuit_breaker.CLOSED
+    breaker.before_request()
+
+
+def test_half_open_single_probe():
+    """Test that only one probe is allowed after the cooldown and that its success closes the circuit."""
+    breaker = CircuitBreaker("example.com", threshold=1, reset_timeout=30)
+
+    with patch("time.monotonic", return_value=0):
+        breaker.record_failure()
+
+    with patch("time.monotonic", return_value=31):
+        breaker.before_request()  # The probe
+        assert breaker.state == circuit_breaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()  # Concurrent callers still fail fast
+
+    breaker.record_success()
+    assert breaker.state == circuit_breaker.CLOSED
+    breaker.before_request()
+
+
+def test_half_open_probe_failure_reopens():
+    """Test that a failed probe opens the circuit again for another cooldown."""
+    breaker = CircuitBreaker("example.com", threshold=1, reset_timeout=30)
+
+    with patch("time.monotonic", return_value=0):
+        breaker.record_failure()
+
+    with patch("time.monotonic", return_value=31):
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.state == circuit_breaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    assert breaker.opened_count == 2
+
+
+@pytest.mark.parametrize("status_code, failed", [(200, False), (404, False), (500, False), (502, True), (503, True), (504, True)])
+def test_record_response(status_code, failed):
+    """Test which responses count as failures."""
+    breaker = CircuitBreaker("example.com", threshold=5, reset_timeout=30)
+
+    breaker.record(resp=MagicMock(status_code=status_code))
+
+    assert breaker.failures == (1 if failed else 0)
+
+
+def test_disabled_with_zero_threshold():
+    """Test that a threshold of 0 disables the circuit breaker."""
+    breaker = CircuitBreaker("example.com", threshold=0, reset_timeout=30)
+
+    for _ in range(10):
+        breaker.record_failure()
+        breaker.before_request()
+
+    assert breaker.state == circuit_breaker.CLOSED
+
+
+def test_get_breaker_shared_per_host():
+    """Test that every request to the same host shares one breaker."""
+    host = MagicMock(host="example.com", port=3000, circuit_breaker_threshold=5, circuit_breaker_reset_timeout=30)
+    other = MagicMock(host="other.example.com", port=3000, circuit_breaker_threshold=5, circuit_breaker_reset_timeout=30)
+
+    assert circuit_breaker.get_breaker(host) is circuit_breaker.get_breaker(host)
+    assert circuit_breaker.get_breaker(host) is not circuit_breaker.get_breaker(other)
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import pytest
+from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils import download
+
+
+def test_write_atomic(tmp_path):
+    """Test that chunks are written to the destination with their size and checksum."""
+    dest = tmp_path / "export.json"
+
+    result = download.write_atomic(str(dest), [b'{"data": ', b"[1, 2, 3]", b"}"])
+
+    assert dest.read_bytes() == b'{"data": [1, 2, 3]}'
+    assert result == {
+        "size": 19,
+        "checksum": "sha256:" + hashlib.sha256(b'{"data": [1, 2, 3]}').hexdigest(),
+        "changed": True,
+    }
+
+
+def test_write_atomic_unchanged(tmp_path):
+    """Test that a destination with the same content is left untouched."""
+    dest = tmp_path / "export.json"
+    dest.write_bytes(b"same")
+    mtime = dest.stat().st_mtime_ns
+
+    result = download.write_atomic(str(dest), [b"sa", b"me"])
+
+    assert result["changed"] is False
+    assert dest.stat().st_mtime_ns == mtime
+    assert list(tmp_path.iterdir()) == [dest]
+
+
+def test_write_atomic_leaves_no_partial_file(tmp_path):
+    """Test that a failure while writing keeps the previous file and removes the temporary file."""
+    dest = tmp_path / "export.json"
+    dest.write_bytes(b"previous")
+
+    def chunks():
+        yield b"partial"
+        raise RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        download.write_atomic(str(dest), chunks())
+
+    assert dest.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [dest]
+
+
+def test_write_atomic_mode(tmp_path):
+    """Test that a new file gets the umask mode and a replaced file keeps its mode."""
+    dest = tmp_path / "export.json"
+    umask = os.umask(0o022)
+    try:
+        download.write_atomic(str(dest), [b"first"])
+        assert dest.stat().st_mode & 0o777 == 0o644
+
+        dest.chmod(0o640)
+        download.write_atomic(str(dest), [b"second"])
+        assert dest.stat().st_mode & 0o777 == 0o640
+    finally:
+        os.umask(umask)
+
+
+def test_etag_round_trip(tmp_path):
+    """Test that an ETag is remembered for an existing destination and can be forgotten."""
+    dest = tmp_path / "export.json"
+
+    download.save_etag(str(dest), '"abc"')
+    assert download.load_etag(str(dest)) is None  # The destination itself does not exist
+
+    dest.write_bytes(b"{}")
+    assert download.load_etag(str(dest)) == '"abc"'
+
+    download.save_etag(str(dest), None)
+    assert download.load_etag(str(dest)) is None
+
+
+def test_file_checksum(tmp_path):
+    """Test checksumming an existing and a missing file."""
+    path = tmp_path / "export.json"
+    path.write_bytes(b"{}")
+
+    assert download.file_checksum(str(path), "md5") == hashlib.md5(b"{}").hexdigest()
+    assert download.file_checksum(str(tmp_path / "missing")) is None
+
+
+@pytest.mark.parametrize("checksum", ["abc", "sha256:", "nosuchalgo:abc"])
+def test_parse_checksum_invalid(checksum):
+    """Test that malformed checksums are rejected."""
+    with pytest.raises(AnsibleError, match="'checksum' must be given as <algorithm>:<hex digest>"):
+        download.parse_checksum(checksum)
+
+
+def test_parse_checksum():
+    """Test that the algorithm and digest are normalized."""
+    assert download.parse_checksum("SHA256:ABC") == ("sha256", "abc")
@@ -1,11 +1,12 @@
 import pytest
+import hashlib
 import json
 from unittest.mock import MagicMock, patch
 from ansible.errors import AnsibleError
 from ansible_collections.itential.platform.plugins.action.generic_request import ActionModule as GenericRequest
 
 # Test successful API request
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_generic_request_success(mock_http_request, mock_task_vars, mock_http_login_response):
     """Test a successful API request with required arguments."""
 
@@ -35,7 +36,7 @@ def test_generic_request_success(mock_http_request, mock_task_vars, mock_http_lo
     assert result["json"] == {"success": True}
 
 # Test API request with query parameters
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_generic_request_with_params(mock_http_request, mock_task_vars, mock_http_login_response):
     """Test an API request with query parameters."""
 
@@ -66,7 +67,7 @@ def test_generic_request_with_params(mock_http_request, mock_task_vars, mock_htt
     assert result["json"] == {"success": True}
 
 # Test API request with JSON payload (POST request)
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_generic_request_with_data(mock_http_request, mock_task_vars, mock_http_login_response):
     """Test an API request with a JSON payload (POST request)."""
 
@@ -97,7 +98,7 @@ def test_generic_request_with_data(mock_http_request, mock_task_vars, mock_http_
     assert result["json"] == {"created": True}
 
 # Test missing required arguments
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_generic_request_missing_args(mock_http_request, mock_task_vars, mock_http_login_response):
     """Test missing required arguments (method or endpoint)."""
 
@@ -119,7 +120,7 @@ def test_generic_request_missing_args(mock_http_request, mock_task_vars, mock_ht
 
 
 # Test unexpected errors
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_generic_request_unexpected_error(mock_http_request, mock_task_vars, mock_http_login_response):
     """Test handling of unexpected errors during request execution."""
 
@@ -144,7 +145,7 @@ def test_generic_request_unexpected_error(mock_http_request, mock_task_vars, moc
         action_module.run(task_vars=mock_task_vars)
 
 # Test defaulting to "GET" when method is not provided
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_generic_request_default_method(mock_http_request, mock_task_vars, mock_http_login_response):
     """Test that the method defaults to GET when not provided."""
 
@@ -177,7 +178,7 @@ def test_generic_request_default_method(mock_http_request, mock_task_vars, mock_
     assert called_method == "GET"
 
 # Test invalid method raises an error
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_generic_request_invalid_method(mock_http_request, mock_task_vars):
     """Test that an invalid HTTP method raises an error."""
 
@@ -201,3 +202,100 @@ def test_generic_request_invalid_method(mock_http_request, mock_task_vars):
         action_module.run(task_vars=mock_task_vars)
 
 
+
+# Test API request with a compressed body
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_generic_request_compress(mock_http_request, mock_task_vars, mock_http_login_response, make_action):
+    """Test that `compress` sends a large request body gzip compressed."""
+
+    mock_http_request.side_effect = [mock_http_login_response, MagicMock(status_code=200)]
+
+    action_module = make_action(GenericRequest, {
+        "method": "POST",
+        "endpoint": "/automation-studio/automations",
+        "data": {"tasks": ["task"] * 1000},
+        "compress": True
+    })
+
+    action_module.run(task_vars=mock_task_vars)
+
+    assert mock_http_request.call_args[1]["headers"]["content-encoding"] == "gzip"
+    assert isinstance(mock_http_request.call_args[1]["data"], bytes)
+
+
+def streamed_response(status_code=200, body=b"", etag=None):
+    resp = MagicMock(status_code=status_code, text=body.decode("utf-8"))
+    resp.headers = {"ETag": etag} if etag else {}
+    resp.iter_content.return_value = [body[i:i + 4] for i in range(0, len(body), 4)]
+    return resp
+
+
+# Test streaming the response body to a file
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_generic_request_dest(mock_http_request, mock_task_vars, mock_http_login_response, tmp_path, make_action):
+    """Test that `dest` streams the body to a file and returns only metadata."""
+
+    dest = tmp_path / "workflows.json"
+    body = json.dumps({"workflows": ["a", "b"]}).encode("utf-8")
+    mock_http_request.side_effect = [mock_http_login_response, streamed_response(body=body, etag='"v1"')]
+
+    result = make_action(GenericRequest, {"endpoint": "/automation-studio/workflows", "dest": str(dest)}).run(task_vars=mock_task_vars)
+
+    assert dest.read_bytes() == body
+    assert result["changed"] is True
+    assert result["size"] == len(body)
+    assert result["etag"] == '"v1"'
+    assert "json" not in result
+    assert mock_http_request.call_args[1]["stream"] is True
+
+
+# Test conditional download with the remembered ETag
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_generic_request_dest_not_modified(mock_http_request, mock_task_vars, mock_http_login_response, tmp_path, make_action):
+    """Test that the previous ETag is sent and a 304 response leaves the file in place."""
+
+    dest = tmp_path / "workflows.json"
+    mock_http_request.side_effect = [
+        mock_http_login_response,
+        streamed_response(body=b"[1, 2, 3]", etag='"v1"'),
+        streamed_response(status_code=304),
+    ]
+
+    make_action(GenericRequest, {"endpoint": "/automation-studio/workflows", "dest": str(dest)}).run(task_vars=mock_task_vars)
+    result = make_action(GenericRequest, {"endpoint": "/automation-studio/workflows", "dest": str(dest)}).run(task_vars=mock_task_vars)
+
+    assert mock_http_request.call_args[1]["headers"]["if-none-match"] == '"v1"'
+    assert result["changed"] is False
+    assert result["status"] == 304
+    assert dest.read_bytes() == b"[1, 2, 3]"
+
+
+# Test that a matching checksum skips the request
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_generic_request_dest_checksum(mock_http_request, mock_task_vars, tmp_path, make_action):
+    """Test that no request is sent when `dest` already matches `checksum`."""
+
+    dest = tmp_path / "workflows.json"
+    dest.write_bytes(b"[]")
+    checksum = "sha256:" + hashlib.sha256(b"[]").hexdigest()
+
+    result = make_action(GenericRequest, {"endpoint": "/automation-studio/workflows", "dest": str(dest), "checksum": checksum}).run(task_vars=mock_task_vars)
+
+    assert result["changed"] is False
+    assert result["skipped"] is True
+    mock_http_request.assert_not_called()
+
+
+# Test that a checksum mismatch fails the task
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_generic_request_dest_checksum_mismatch(mock_http_request, mock_task_vars, mock_http_login_response, tmp_path, make_action):
+    """Test that a downloaded body that does not match `checksum` is rejected."""
+
+    dest = tmp_path / "workflows.json"
+    mock_http_request.side_effect = [mock_http_login_response, streamed_response(body=b"[1]")]
+
+    with pytest.raises(AnsibleError, match="Checksum mismatch"):
+        make_action(GenericRequest, {"endpoint": "/automation-studio/workflows", "dest": str(dest), "checksum": "sha256:00"}).run(task_vars=mock_task_vars)
+
+    assert not dest.exists()
+    assert not list(tmp_path.glob(".tmp-*"))
@@ -16,7 +16,7 @@ from ansible_collections.itential.platform.plugins.action.get_tasks import Actio
         "equals[name]": "greg"
     }),
 ])
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_action_module_with_inputs(mock_http_request, mock_http_login_response, mock_task_vars, action_module_class, input_args, expected_endpoint, expected_method, expected_params):
     """Test action modules that construct parameters dynamically based on input arguments."""
 
@@ -64,7 +64,7 @@ def test_action_module_with_inputs(mock_http_request, mock_http_login_response,
     (GetJobs, None),
     (GetTasks, None),
 ])
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_action_module_missing_args(mock_http_request, mock_http_login_response, mock_task_vars, action_module_class, missing_args_behavior):
     """Test action modules with missing required arguments."""
 
@@ -0,0 +1,80 @@
+import json
+import pytest
+from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils.json_stream import ArrayStream, iter_array
+
+
+def chunked(document, size):
+    body = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+def test_array_stream_items_and_siblings(size):
+    """Test that array items are yielded in order whatever the chunk boundaries."""
+    document = {
+        "metadata": {"total": 50},
+        "data": [{"_id": i, "name": "tâche" * (i % 3), "count": 123456 + i, "ratio": i / 7} for i in range(50)],
+        "links": ["next"],
+    }
+
+    stream = ArrayStream(chunked(document, size))
+
+    assert list(stream) == document["data"]
+    assert stream.found is True
+    assert stream.siblings == {"metadata": {"total": 50}, "links": ["next"]}
+
+
+def test_array_stream_is_lazy():
+    """Test that items are parsed as chunks arrive instead of after the whole document is read."""
+    read = []
+
+    def chunks():
+        for chunk in (b'{"data": [1, ', b'2, ', b'3]}'):
+            read.append(chunk)
+            yield chunk
+
+    items = iter_array(chunks())
+
+    assert next(items) == 1
+    assert len(read) < 3
+
+
+def test_array_stream_numbers_split_across_chunks():
+    """Test that a number split across chunks is not cut short."""
+    assert list(iter_array([b"[12", b"34, 5", b"6]"], path=())) == [1234, 56]
+
+
+def test_array_stream_split_at_every_byte():
+    """Test that the document parses whichever byte it is split at, including inside a fraction or exponent."""
+    body = b'{"data":[1.25,2e10,-3E-2,4],"count":12.5}'
+
+    for index in range(len(body) + 1):
+        stream = ArrayStream([body[:index], body[index:]])
+
+        assert list(stream) == [1.25, 2e10, -3e-2, 4], index
+        assert stream.siblings == {"count": 12.5}, index
+
+
+def test_array_stream_nested_path():
+    """Test locating an array below several object keys."""
+    stream = ArrayStream([b'{"result": {"total": 2, "items": [{"a": 1}, {"a": 2}]}, "ok": true}'], path=("result", "items"))
+
+    assert list(stream) == [{"a": 1}, {"a": 2}]
+    assert stream.siblings == {"result": {"total": 2}, "ok": True}
+
+
+@pytest.mark.parametrize("body", [b'{"metadata": {}}', b'{"data": {"not": "an array"}}', b'{}'])
+def test_array_stream_missing_array(body):
+    """Test that a document without the array yields nothing."""
+    stream = ArrayStream([body])
+
+    assert list(stream) == []
+    assert stream.found is False
+
+
+@pytest.mark.parametrize("body", [b'{"data": [1, 2', b'{"data": [1 2]}', b'{"data": []} []', b'[1]'])
+def test_array_stream_malformed(body):
+    """Test that truncated or malformed documents are rejected."""
+    with pytest.raises(AnsibleError, match="Failed to parse JSON response"):
+        list(ArrayStream([body]))
@@ -1,8 +1,10 @@
 import pytest
 import json
+import threading
+import time
 from unittest.mock import patch, MagicMock
 from ansible.errors import AnsibleError
-from ansible_collections.itential.platform.plugins.module_utils.login import login
+from ansible_collections.itential.platform.plugins.module_utils.login import login, get_token, invalidate_token, clear_token_cache
 
 @pytest.fixture
 def mock_host():
@@ -16,12 +18,17 @@ def mock_host():
     mock.verify = False
     mock.disable_warnings = False
     mock.headers = {"custom": "header"}
+    mock.token_cache_ttl = 600
+    mock.token_cache_shared = False
+    mock.token_cache_dir = None
+    mock.connect_timeout = 10
+    mock.read_timeout = 120
     return mock
 
 @pytest.fixture
 def mock_http_response():
     """Fixture for a mock HTTP response used in `login()` tests."""
-    with patch("ansible_collections.itential.core.plugins.module_utils.http.send_request") as mock_request:
+    with patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request") as mock_request:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "mocked_token"
@@ -38,6 +45,7 @@ def test_login_success(mock_host, mock_http_response):
 
     # Ensure `send_request` was called with the correct parameters
     mock_http_response.assert_called_once_with(
+        mock_host,
         method="POST",
         url="http://example.com:3000/login",
         headers={
@@ -47,12 +55,13 @@ def test_login_success(mock_host, mock_http_response):
         },
         data=json.dumps({"user": {"username": "admin", "password": "admin"}}).encode("utf-8"),
         verify=False,  # Matches `mock_host`
-        disable_warnings=False
+        disable_warnings=False,
+        timeout=(10, 120)
     )
 
 def test_login_http_error(mock_host):
     """Test that `login()` raises an error on HTTP failure."""
-    with patch("ansible_collections.itential.core.plugins.module_utils.http.send_request") as mock_request:
+    with patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request") as mock_request:
         mock_request.side_effect = Exception("HTTP Error")
 
         with pytest.raises(AnsibleError, match="HTTP request failed: HTTP Error"):
@@ -60,7 +69,7 @@ def test_login_http_error(mock_host):
 
 def test_login_invalid_json(mock_host):
     """Test that `login()` handles non-JSON responses correctly."""
-    with patch("ansible_collections.itential.core.plugins.module_utils.http.send_request") as mock_request:
+    with patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request") as mock_request:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "Invalid JSON"
@@ -97,7 +106,7 @@ def test_login_missing_headers():
     mock_host.disable_warnings = False
     mock_host.headers = None
 
-    with patch("ansible_collections.itential.core.plugins.module_utils.http.send_request") as mock_request:
+    with patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request") as mock_request:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "mocked_token"
@@ -108,7 +117,7 @@ def test_login_missing_headers():
 
 def test_login_non_200_response(mock_host):
     """Test that `login()` raises an error when the API returns a non-200 status code."""
-    with patch("ansible_collections.itential.core.plugins.module_utils.http.send_request") as mock_request:
+    with patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request") as mock_request:
         mock_response = MagicMock()
         mock_response.status_code = 401
         mock_response.text = "Unauthorized"
@@ -120,8 +129,121 @@ def test_login_non_200_response(mock_host):
 
 def test_login_timeout(mock_host):
     """Test that `login()` raises an error when a timeout occurs."""
-    with patch("ansible_collections.itential.core.plugins.module_utils.http.send_request") as mock_request:
+    with patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request") as mock_request:
         mock_request.side_effect = TimeoutError("Request timed out")
 
         with pytest.raises(AnsibleError, match="HTTP request failed: Request timed out"):
-            login(mock_host)
\ No newline at end of file
+            login(mock_host)
+
+def test_get_token_uses_cache(mock_host, mock_http_response):
+    """Test that `get_token()` only logs in once while the cached token is valid."""
+    assert get_token(mock_host) == "mocked_token"
+    assert get_token(mock_host) == "mocked_token"
+
+    mock_http_response.assert_called_once()
+
+
+def test_get_token_cache_disabled(mock_host, mock_http_response):
+    """Test that a `token_cache_ttl` of 0 logs in on every call."""
+    mock_host.token_cache_ttl = 0
+
+    get_token(mock_host)
+    get_token(mock_host)
+
+    assert mock_http_response.call_count == 2
+
+
+def test_get_token_cache_expired(mock_host, mock_http_response):
+    """Test that an expired cached token triggers a new login."""
+    with patch("time.monotonic", return_value=0):
+        get_token(mock_host)
+    with patch("time.monotonic", return_value=1000):
+        get_token(mock_host)
+
+    assert mock_http_response.call_count == 2
+
+
+def test_get_token_cache_keyed_by_username(mock_host, mock_http_response):
+    """Test that tokens are cached separately for each username."""
+    get_token(mock_host)
+    mock_host.username = "other"
+    get_token(mock_host)
+
+    assert mock_http_response.call_count == 2
+
+
+def test_invalidate_token(mock_host, mock_http_response):
+    """Test that `invalidate_token()` forces the next call to log in again."""
+    get_token(mock_host)
+    invalidate_token(mock_host, "stale_token")
+    get_token(mock_host)
+    assert mock_http_response.call_count == 1
+
+    invalidate_token(mock_host, "mocked_token")
+    get_token(mock_host)
+    assert mock_http_response.call_count == 2
+
+
+def test_get_token_shared_between_processes(mock_host, mock_http_response):
+    """Test that a token saved to the shared store is reused once the in-memory cache is empty."""
+    mock_host.token_cache_shared = True
+
+    get_token(mock_host)
+    clear_token_cache()  # Simulates a separate worker process
+    assert get_token(mock_host) == "mocked_token"
+
+    mock_http_response.assert_called_once()
+
+
+def test_invalidate_token_evicts_shared_store(mock_host, mock_http_response):
+    """Test that invalidating a token also removes it from the shared store."""
+    mock_host.token_cache_shared = True
+
+    get_token(mock_host)
+    invalidate_token(mock_host, "mocked_token")
+    clear_token_cache()
+    get_token(mock_host)
+
+    assert mock_http_response.call_count == 2
+
+
+def test_get_token_unusable_shared_store(mock_host, mock_http_response, tmp_path):
+    """Test that a token store that cannot be written falls back to the in-process cache."""
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    mock_host.token_cache_shared = True
+    mock_host.token_cache_dir = str(not_a_dir / "tokens")
+
+    assert get_token(mock_host) == "mocked_token"
+    assert get_token(mock_host) == "mocked_token"
+    invalidate_token(mock_host, "mocked_token")
+
+    mock_http_response.assert_called_once()
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_get_token_single_flight(mock_host, shared):
+    """Test that concurrent callers for the same host share a single login."""
+    mock_host.token_cache_shared = shared
+
+    def slow_login(host, **kwargs):
+        time.sleep(0.1)
+        return MagicMock(status_code=200, text="mocked_token")
+
+    with patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request", side_effect=slow_login) as mock_request:
+        tokens = []
+        threads = [threading.Thread(target=lambda: tokens.append(get_token(mock_host))) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert tokens == ["mocked_token"] * 10
+    mock_request.assert_called_once()
+
+
+def test_login_timeout_override(mock_host, mock_http_response):
+    """Test that `login()` replaces the host's read timeout with the given timeout."""
+    login(mock_host, timeout=5)
+
+    assert mock_http_response.call_args[1]["timeout"] == (10, 5)
@@ -0,0 +1,142 @@
+import os
+import pytest
+import re
+from unittest.mock import MagicMock, patch
+from ansible_collections.itential.platform.plugins.module_utils import metrics
+from ansible_collections.itential.platform.plugins.module_utils.request import make_request
+
+
+@pytest.fixture
+def metrics_host(tmp_path):
+    """Fixture to create a mock host object that exports metrics."""
+    mock = MagicMock()
+    mock.host = "example.com"
+    mock.port = 3000
+    mock.metrics_file = str(tmp_path / "itential.prom")
+    return mock
+
+
+def test_record_request_histogram(metrics_host, tmp_path):
+    """Test that request durations are exported as a cumulative histogram."""
+
+    metrics.record_request(metrics_host, "GET", "/health/status", 200, 0.2)
+    metrics.record_request(metrics_host, "GET", "/health/status", 200, 3.0, retries=2)
+
+    text = (tmp_path / "itential.prom").read_text()
+    labels = 'endpoint="/health/status",host="example.com:3000",method="GET",status="200"'
+
+    assert "# TYPE itential_platform_request_duration_seconds histogram" in text
+    assert f'itential_platform_request_duration_seconds_bucket{{{labels},le="0.1"}} 0' in text
+    assert f'itential_platform_request_duration_seconds_bucket{{{labels},le="0.25"}} 1' in text
+    assert f'itential_platform_request_duration_seconds_bucket{{{labels},le="5.0"}} 2' in text
+    assert f'itential_platform_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"itential_platform_request_duration_seconds_sum{{{labels}}} 3.2" in text
+    assert f"itential_platform_request_duration_seconds_count{{{labels}}} 2" in text
+    assert 'itential_platform_request_retries_total{endpoint="/health/status",host="example.com:3000",method="GET"} 2' in text
+
+
+def test_counters_accumulate(metrics_host, tmp_path):
+    """Test that counters accumulate across updates, as they would across worker processes."""
+
+    metrics.record_login(metrics_host)
+    metrics.record_login(metrics_host)
+    metrics.record_circuit_open(metrics_host)
+
+    text = (tmp_path / "itential.prom").read_text()
+
+    assert 'itential_platform_logins_total{host="example.com:3000"} 2' in text
+    assert 'itential_platform_circuit_breaker_opens_total{host="example.com:3000"} 1' in text
+    assert not list(tmp_path.glob(".tmp-*"))
+
+
+def test_label_values_escaped(metrics_host, tmp_path):
+    """Test that label values are escaped."""
+
+    metrics.record_request(metrics_host, "GET", '/workflows/a"b', "error", 0.01)
+
+    assert 'endpoint="/workflows/a\\"b"' in (tmp_path / "itential.prom").read_text()
+
+
+@pytest.mark.parametrize("endpoint,label", [
+    ("/health/status?verbose=true", "/health/status"),
+    ("/adapters/local_aaa/restart", "/adapters/{name}/restart"),
+    ("/health/applications/WorkFlowEngine", "/health/applications/{name}"),
+    ("/operations-manager/jobs/65f1c0de2a9b4c0012345678", "/operations-manager/jobs/{id}"),
+    ("/workflow/123/tasks/0f8fad5b-d9cb-469f-a165-70867728950e", "/workflow/{id}/tasks/{id}"),
+])
+def test_endpoint_label(endpoint, label):
+    """Test that names and ID-like segments are replaced so endpoints have bounded cardinality."""
+    assert metrics.endpoint_label(endpoint) == label
+
+
+def test_endpoints_capped(metrics_host, tmp_path, monkeypatch):
+    """Test that endpoints beyond `MAX_ENDPOINTS` are labelled `other`."""
+    monkeypatch.setattr(metrics, "MAX_ENDPOINTS", 1)
+
+    metrics.record_request(metrics_host, "GET", "/health/status", 200, 0.1)
+    metrics.record_request(metrics_host, "GET", "/health/system", 200, 0.1)
+
+    text = (tmp_path / "itential.prom").read_text()
+    assert 'endpoint="/health/status"' in text
+    assert 'endpoint="other"' in text
+    assert 'endpoint="/health/system"' not in text
+
+
+def test_batch_writes_once(metrics_host, tmp_path):
+    """Test that updates recorded in a batch are written when it ends."""
+    with patch.object(metrics, "_write", wraps=metrics._write) as mock_write:
+        with metrics.batch():
+            metrics.record_login(metrics_host)
+            metrics.record_request(metrics_host, "GET", "/health/status", 200, 0.1)
+            assert not (tmp_path / "itential.prom").exists()
+
+    mock_write.assert_called_once()
+    text = (tmp_path / "itential.prom").read_text()
+    assert 'itential_platform_logins_total{host="example.com:3000"} 1' in text
+    assert "itential_platform_request_duration_seconds_count" in text
+
+
+def test_textfile_readable_by_exporter(metrics_host, tmp_path):
+    """Test that the textfile can be read by node_exporter running as another user."""
+    umask = os.umask(0o022)
+    try:
+        metrics.record_login(metrics_host)
+    finally:
+        os.umask(umask)
+
+    assert (tmp_path / "itential.prom").stat().st_mode & 0o777 == 0o644
+
+
+def test_disabled_without_metrics_file(metrics_host, tmp_path):
+    """Test that nothing is written when `metrics_file` is not set."""
+
+    metrics_host.metrics_file = None
+    metrics.record_login(metrics_host)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unwritable_metrics_file(metrics_host, tmp_path):
+    """Test that a metrics file that cannot be written does not raise."""
+
+    metrics_host.metrics_file = str(tmp_path / "missing" / "itential.prom")
+
+    metrics.record_login(metrics_host)
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_records_metrics(mock_http_request, mock_http_login_response, mock_task_vars, tmp_path):
+    """Test that `make_request` records its request and login when `platform_metrics_file` is set."""
+
+    metrics_file = tmp_path / "itential.prom"
+    mock_task_vars["hostvars"]["platform"]["platform_metrics_file"] = str(metrics_file)
+
+    api_response = MagicMock(status_code=200)
+    api_response.headers = {}
+    mock_http_request.side_effect = [mock_http_login_response, api_response]
+
+    make_request(mock_task_vars, "GET", "/health/status")
+
+    text = metrics_file.read_text()
+    assert re.search(r'^itential_platform_logins_total\{host="example\.com[:0-9]*"\} 1$', text, re.M)
+    assert re.search(r'^itential_platform_request_duration_seconds_count\{endpoint="/health/status",.*status="200"\} 1$', text, re.M)
@@ -0,0 +1,180 @@
+import pytest
+import json
+import time
+from unittest.mock import patch
+from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils import pagination
+from ansible_collections.itential.platform.plugins.action.get_jobs import ActionModule as GetJobs
+
+
+def list_api(total, report_total=True, delays=None, max_limit=None, short=()):
+    """Return a fake_send_request handler that serves limit/skip pages of `total` records.
+
+    max_limit caps the number of records returned per page, as some servers do,
+    and the pages at the skips in short are one record short.
+    """
+
+    def handler(method, url, params):
+        skip, limit = params["skip"], min(params["limit"], max_limit or params["limit"])
+        limit -= 1 if skip in short else 0
+        time.sleep((delays or {}).get(skip, 0))
+        body = {"data": [{"_id": i} for i in range(skip, min(skip + limit, total))]}
+        if report_total:
+            body["metadata"] = {"total": total, "skip": skip, "limit": limit}
+        return body
+
+    return handler
+
+
+def page_requests(mock_http_request):
+    return [c[1]["params"]["skip"] for c in mock_http_request.call_args_list if "params" in c[1]]
+
+
+@pytest.mark.parametrize("report_total", [True, False])
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_paginator_fetches_all_pages(mock_http_request, mock_task_vars, report_total, fake_send_request):
+    """Test that every page is fetched and records are yielded in order."""
+
+    mock_http_request.side_effect = fake_send_request(list_api(25, report_total=report_total))
+
+    paginator = pagination.Paginator(mock_task_vars, "/operations-manager/jobs", page_size=10)
+    records = [r["_id"] for page in paginator for r in page]
+
+    assert records == list(range(25))
+    assert paginator.pages == 3
+    assert paginator.count == 25
+    # Without a total the short last page may be capped, an empty page ends the retrieval
+    assert sorted(page_requests(mock_http_request)) == ([0, 10, 20] if report_total else [0, 10, 20, 25])
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_paginator_concurrent_pages_in_order(mock_http_request, mock_task_vars, fake_send_request):
+    """Test that pages fetched concurrently are still yielded in order."""
+
+    mock_http_request.side_effect = fake_send_request(list_api(40, delays={10: 0.1}))
+
+    paginator = pagination.Paginator(mock_task_vars, "/operations-manager/jobs", page_size=10, concurrency=3)
+    records = [r["_id"] for page in paginator for r in page]
+
+    assert records == list(range(40))
+    assert paginator.total == 40
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_paginator_sorts_pages(mock_http_request, mock_task_vars, fake_send_request):
+    """Test that pages are sorted by `_id` unless another sort is requested."""
+
+    mock_http_request.side_effect = fake_send_request(list_api(5))
+
+    list(pagination.Paginator(mock_task_vars, "/operations-manager/jobs", page_size=10))
+    list(pagination.Paginator(mock_task_vars, "/operations-manager/jobs", params={"sort": "name"}, page_size=10))
+
+    first, second = [c[1]["params"] for c in mock_http_request.call_args_list if "params" in c[1]]
+    assert (first["sort"], first["order"]) == ("_id", 1)
+    assert second["sort"] == "name" and "order" not in second
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_paginator_server_capped_pages(mock_http_request, mock_task_vars, concurrency, fake_send_request):
+    """Test that no record is skipped when the server returns fewer records than requested."""
+
+    # A page in the middle of a concurrent window comes back short
+    mock_http_request.side_effect = fake_send_request(list_api(45, short={10}))
+
+    paginator = pagination.Paginator(mock_task_vars, "/operations-manager/jobs", page_size=10, concurrency=concurrency)
+    assert [r["_id"] for page in paginator for r in page] == list(range(45))
+
+    # Every page is capped
+    mock_http_request.side_effect = fake_send_request(list_api(45, max_limit=7))
+
+    paginator = pagination.Paginator(mock_task_vars, "/operations-manager/jobs", page_size=10, concurrency=concurrency)
+    assert [r["_id"] for page in paginator for r in page] == list(range(45))
+    assert paginator.count == 45
+
+    # Every page is capped and the server reports no total
+    mock_http_request.side_effect = fake_send_request(list_api(45, report_total=False, max_limit=7))
+
+    paginator = pagination.Paginator(mock_task_vars, "/operations-manager/jobs", page_size=10, concurrency=concurrency)
+    assert [r["_id"] for page in paginator for r in page] == list(range(45))
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_get_jobs_streams_to_dest(mock_http_request, mock_task_vars, tmp_path, make_action, fake_send_request):
+    """Test that `get_jobs` writes every job to an NDJSON file and returns only metadata."""
+
+    mock_http_request.side_effect = fake_send_request(list_api(25))
+    dest = tmp_path / "jobs.ndjson"
+
+    action_module = make_action(GetJobs, {"status": "running", "page_size": 10, "concurrency": 2, "dest": str(dest)})
+
+    result = action_module.run(task_vars=mock_task_vars)
+
+    assert result["changed"] is True
+    assert result["count"] == 25
+    assert result["pages"] == 3
+    assert "json" not in result
+
+    lines = dest.read_text().splitlines()
+    assert [json.loads(line)["_id"] for line in lines] == list(range(25))
+
+    # Reserved options are not sent as filters
+    for c in mock_http_request.call_args_list[1:]:
+        assert c[1]["params"]["equals[status]"] == "running"
+        assert not any(key.startswith("equals[page_size") or key.startswith("equals[dest") for key in c[1]["params"])
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_get_jobs_paginated_result(mock_http_request, mock_task_vars, make_action, fake_send_request):
+    """Test that `get_jobs` with `page_size` returns every job in a single result."""
+
+    mock_http_request.side_effect = fake_send_request(list_api(15))
+
+    action_module = make_action(GetJobs, {"page_size": 10})
+
+    result = action_module.run(task_vars=mock_task_vars)
+
+    assert len(result["json"]["data"]) == 15
+    assert result["json"]["metadata"] == {"total": 15, "count": 15}
+    assert result["timing"]["requests"] == 2
+
+
+@pytest.mark.parametrize("page_size", ["many", 0])
+def test_get_jobs_invalid_page_size(mock_task_vars, make_action, page_size):
+    """Test that a `page_size` that is not a positive integer is rejected."""
+
+    with pytest.raises(AnsibleError, match="'page_size' must be a positive integer"):
+        make_action(GetJobs, {"page_size": page_size}).run(task_vars=mock_task_vars)
+
+
+def test_write_ndjson_leaves_no_partial_file(tmp_path):
+    """Test that a failure while writing leaves neither the destination nor a temporary file behind."""
+
+    def pages():
+        yield [{"_id": 1}]
+        raise RuntimeError("connection lost")
+
+    dest = tmp_path / "jobs.ndjson"
+
+    with pytest.raises(RuntimeError):
+        pagination.write_ndjson(str(dest), pages())
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_get_jobs_dest_unchanged(mock_http_request, mock_task_vars, tmp_path, make_action, fake_send_request):
+    """Test that exporting the same jobs again leaves the file in place and reports no change."""
+
+    mock_http_request.side_effect = fake_send_request(list_api(5))
+    dest = tmp_path / "jobs.ndjson"
+
+    action_module = make_action(GetJobs, {"page_size": 10, "dest": str(dest)})
+
+    first = action_module.run(task_vars=mock_task_vars)
+    second = action_module.run(task_vars=mock_task_vars)
+
+    assert first["changed"] is True
+    assert second["changed"] is False
+    assert second["checksum"] == first["checksum"]
+    assert second["count"] == 5
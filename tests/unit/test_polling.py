@@ -0,0 +1,35 @@
+from unittest.mock import MagicMock, patch
+from ansible_collections.itential.platform.plugins.module_utils.polling import poll_until
+
+
+@patch("time.sleep")
+def test_poll_until_success(mock_sleep):
+    """Test that polling stops as soon as the check succeeds and backs off in between."""
+    check = MagicMock(side_effect=[None, None, "RUNNING"])
+
+    value, attempts = poll_until(check, timeout=60, interval=1, max_interval=10)
+
+    assert value == "RUNNING"
+    assert attempts == 3
+    assert [c[0][0] for c in mock_sleep.call_args_list] == [1, 2]
+
+
+@patch("time.sleep")
+def test_poll_until_backoff_capped(mock_sleep):
+    """Test that the backoff interval never exceeds `max_interval`."""
+    check = MagicMock(side_effect=[None] * 5 + [True])
+
+    poll_until(check, timeout=600, interval=1, max_interval=4)
+
+    assert [c[0][0] for c in mock_sleep.call_args_list] == [1, 2, 4, 4, 4]
+
+
+def test_poll_until_deadline():
+    """Test that polling gives up once the deadline passes."""
+    check = MagicMock(return_value=None)
+
+    with patch("time.monotonic", side_effect=[0, 0, 5, 11]), patch("time.sleep"):
+        value, attempts = poll_until(check, timeout=10, interval=5)
+
+    assert value is None
+    assert attempts == 3
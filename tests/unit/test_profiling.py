@@ -0,0 +1,100 @@
+import os
+import pstats
+import re
+import pytest
+from unittest.mock import MagicMock, patch
+from ansible_collections.itential.platform.plugins.module_utils import profiling
+from ansible_collections.itential.platform.plugins.action.get_system_health import ActionModule as GetSystemHealth
+
+
+@pytest.fixture
+def api_responses(mock_http_login_response):
+    api_response = MagicMock(status_code=200)
+    api_response.headers = {"Content-Type": "application/json"}
+    api_response.json.return_value = {"status": "running"}
+    return [mock_http_login_response, api_response]
+
+
+@patch("cProfile.Profile")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_profiling_off_by_default(mock_http_request, mock_profile, api_responses, mock_task_vars, monkeypatch, make_action):
+    """Test that run() is not profiled unless a profile directory is configured."""
+
+    monkeypatch.delenv(profiling.PROFILE_DIR_ENV, raising=False)
+    mock_http_request.side_effect = api_responses
+
+    result = make_action(GetSystemHealth).run(task_vars=mock_task_vars)
+
+    assert "profile" not in result
+    mock_profile.assert_not_called()
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_profile_dir_host_var(mock_http_request, api_responses, mock_task_vars, tmp_path, make_action):
+    """Test that a .pstats file is written per task when `platform_profile_dir` is set."""
+
+    mock_task_vars["hostvars"]["platform"]["platform_profile_dir"] = str(tmp_path / "profiles")
+    mock_http_request.side_effect = api_responses
+
+    result = make_action(GetSystemHealth).run(task_vars=mock_task_vars)
+
+    assert result["json"] == {"status": "running"}
+    assert re.search(rf"-platform-itential\.platform\.get_system_health-{os.getpid()}-\d+\.pstats$", result["profile"]["pstats"])
+    assert "memory" not in result["profile"]
+
+    stats = pstats.Stats(result["profile"]["pstats"])
+    assert any(func[2] == "make_request" for func in stats.stats)
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_profile_memory_env(mock_http_request, api_responses, mock_task_vars, tmp_path, monkeypatch, make_action):
+    """Test that the environment variables enable profiling with a memory report."""
+
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV, str(tmp_path))
+    monkeypatch.setenv(profiling.PROFILE_MEMORY_ENV, "true")
+    mock_http_request.side_effect = api_responses
+
+    result = make_action(GetSystemHealth).run(task_vars=mock_task_vars)
+
+    with open(result["profile"]["memory"], encoding="utf-8") as f:
+        report = f.read()
+
+    assert report.startswith("Current: ")
+    assert "Top 25 allocating lines:" in report
+    assert not profiling.tracemalloc.is_tracing()
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_profile_written_when_run_fails(mock_http_request, mock_http_login_response, mock_task_vars, tmp_path, make_action):
+    """Test that the profile of a failing task is still written."""
+
+    mock_task_vars["hostvars"]["platform"]["platform_profile_dir"] = str(tmp_path)
+    mock_http_request.side_effect = [mock_http_login_response, MagicMock(status_code=500, text="boom")]
+
+    with pytest.raises(Exception, match="status 500"):
+        make_action(GetSystemHealth).run(task_vars=mock_task_vars)
+
+    assert len(list(tmp_path.glob("*.pstats"))) == 1
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_profiles_of_back_to_back_runs(mock_http_request, mock_http_login_response, mock_task_vars, tmp_path, make_action):
+    """Test that runs in the same process and second, like loop items, do not overwrite each other's files."""
+
+    mock_task_vars["hostvars"]["platform"]["platform_profile_dir"] = str(tmp_path)
+    mock_task_vars["hostvars"]["platform"]["platform_profile_memory"] = True
+
+    api_response = MagicMock(status_code=200)
+    api_response.headers = {"Content-Type": "application/json"}
+    api_response.json.return_value = {"status": "running"}
+    mock_http_request.side_effect = [mock_http_login_response, api_response, api_response]
+
+    action_module = make_action(GetSystemHealth)
+    with patch("time.strftime", return_value="20250101T000000"):
+        first = action_module.run(task_vars=mock_task_vars)
+        second = action_module.run(task_vars=mock_task_vars)
+
+    assert first["profile"]["pstats"] != second["profile"]["pstats"]
+    assert first["profile"]["memory"] != second["profile"]["memory"]
+    assert len(list(tmp_path.glob("*.pstats"))) == 2
+    assert len(list(tmp_path.glob("*.memory.txt"))) == 2
@@ -0,0 +1,154 @@
+import pytest
+import json
+from unittest.mock import MagicMock, patch
+from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils import projection
+from ansible_collections.itential.platform.plugins.module_utils.projection import Projection
+from ansible_collections.itential.platform.plugins.action.get_jobs import ActionModule as GetJobs
+from ansible_collections.itential.platform.plugins.action.generic_request import ActionModule as GenericRequest
+
+JOBS = [
+    {"_id": i, "name": f"job-{i}", "status": "running", "metrics": {"start_time": i, "user": "admin"}}
+    for i in range(5)
+]
+
+
+def streamed_response(body, chunk_size=7):
+    """Return a mocked response whose body is read in chunks with iter_content."""
+    data = json.dumps(body).encode("utf-8")
+    resp = MagicMock(status_code=200)
+    resp.headers = {"Content-Type": "application/json"}
+    resp.json.return_value = body
+    resp.iter_content.return_value = iter([data[i:i + chunk_size] for i in range(0, len(data), chunk_size)])
+    return resp
+
+
+def test_from_args_without_projection():
+    """Test that no Projection is built when nothing is requested."""
+
+    assert Projection.from_args({}) is None
+    assert Projection.from_args({"return_body": "yes"}) is None
+
+
+@pytest.mark.parametrize("fields", ["name, metrics.start_time", ["name", "metrics.start_time"]])
+def test_fields_as_string_or_list(fields):
+    """Test that fields are accepted as a list or a comma-separated string of dotted paths."""
+
+    shape = Projection.from_args({"fields": fields})
+
+    assert shape.item(JOBS[0]) == {"name": "job-0", "metrics": {"start_time": 0}}
+
+
+def test_select_alias_and_whole_parent():
+    """Test that select is accepted and a parent path keeps its whole value."""
+
+    shape = Projection.from_args({"select": ["metrics.user", "metrics"]})
+
+    assert shape.item(JOBS[1]) == {"metrics": {"start_time": 1, "user": "admin"}}
+    assert shape.include == "metrics"
+
+
+@pytest.mark.parametrize("max_items", ["many", -1])
+def test_invalid_max_items(max_items):
+    """Test that a max_items that is not a non-negative integer is rejected."""
+
+    with pytest.raises(AnsibleError, match="'max_items' must be a non-negative integer"):
+        Projection.from_args({"max_items": max_items})
+
+
+def test_body_projects_data_list():
+    """Test that list endpoint bodies keep their metadata and lose items past max_items."""
+
+    shape = Projection(fields=["_id"], max_items=2)
+    body = {"data": JOBS, "metadata": {"total": 5}}
+
+    assert shape.body(body) == {"data": [{"_id": 0}, {"_id": 1}], "metadata": {"total": 5}}
+    assert shape.body(JOBS) == [{"_id": 0}, {"_id": 1}]
+
+
+def test_pages_stop_at_max_items():
+    """Test that pages are not consumed past max_items."""
+
+    consumed = []
+
+    def pages():
+        for start in range(0, 5, 2):
+            consumed.append(start)
+            yield JOBS[start:start + 2]
+
+    shape = Projection(fields=["_id"], max_items=3)
+
+    assert [r["_id"] for page in shape.pages(pages()) for r in page] == [0, 1, 2]
+    assert consumed == [0, 2]
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_get_jobs_projected(mock_http_request, mock_http_login_response, mock_task_vars, make_action):
+    """Test that `get_jobs` streams the list and stops reading once max_items jobs are kept."""
+
+    api_response = streamed_response({"data": JOBS, "metadata": {"total": 5}})
+    mock_http_request.side_effect = [mock_http_login_response, api_response]
+
+    action_module = make_action(GetJobs, {"status": "running", "fields": "name,metrics.start_time", "max_items": 2})
+    result = action_module.run(task_vars=mock_task_vars)
+
+    assert result["json"]["data"] == [
+        {"name": "job-0", "metrics": {"start_time": 0}},
+        {"name": "job-1", "metrics": {"start_time": 1}},
+    ]
+    assert result["status"] == 200
+
+    params = mock_http_request.call_args[1]["params"]
+    assert params["limit"] == 2
+    assert params["include"] == "name,metrics"
+    assert params["equals[status]"] == "running"
+    assert not any(key.startswith("equals[fields") or key.startswith("equals[max_items") for key in params)
+
+    # The rest of the body is never read
+    assert len(list(api_response.iter_content.return_value)) > 0
+    api_response.close.assert_called()
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_get_jobs_without_body(mock_http_request, mock_http_login_response, mock_task_vars, make_action):
+    """Test that `return_body: false` leaves the body unparsed and out of the result."""
+
+    api_response = streamed_response({"data": JOBS})
+    mock_http_request.side_effect = [mock_http_login_response, api_response]
+
+    result = make_action(GetJobs, {"return_body": False}).run(task_vars=mock_task_vars)
+
+    assert "json" not in result
+    assert result["status"] == 200
+    api_response.json.assert_not_called()
+    assert mock_http_request.call_args[1]["params"]["include"] == "name,status"
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_generic_request_projected(mock_http_request, mock_http_login_response, mock_task_vars, make_action):
+    """Test that `generic_request` projects the JSON body of the response."""
+
+    api_response = streamed_response({"_id": "abc", "name": "workflow", "tasks": {"a": {}, "b": {}}})
+    mock_http_request.side_effect = [mock_http_login_response, api_response]
+
+    action_module = make_action(GenericRequest, {"method": "GET", "endpoint": "/automation-studio/workflows/abc", "select": ["name"]})
+    result = action_module.run(task_vars=mock_task_vars)
+
+    assert result["json"] == {"name": "workflow"}
+
+
+@patch.object(projection, "stream_request")
+def test_projected_request_without_data_list(mock_stream_request, mock_task_vars):
+    """Test that a response without a data list is projected as a whole."""
+
+    stream = MagicMock()
+    stream.__iter__.return_value = iter([])
+    stream.found = False
+    stream.siblings = {"name": "adapter", "state": "RUNNING"}
+    stream.result = {"status": 200}
+    mock_stream_request.return_value = stream
+
+    result = projection.projected_request(mock_task_vars, "GET", "/adapters/a", Projection(fields=["state"]))
+
+    assert result["json"] == {"state": "RUNNING"}
+    stream.close.assert_called()
@@ -1,13 +1,16 @@
+import gzip
 import pytest
 import json
 import re
 from unittest.mock import patch, MagicMock
 from ansible.errors import AnsibleError
 import requests
-from ansible_collections.itential.platform.plugins.module_utils.request import make_request, VALID_HTTP_METHODS
+from ansible_collections.itential.platform.plugins.module_utils.request import make_request, stream_request, VALID_HTTP_METHODS
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import Deadline, DeadlineExceeded
+from ansible_collections.itential.core.plugins.module_utils import hosts
 
 
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_make_request_success(mock_http_request, mock_http_login_response, mock_task_vars):
     """Test successful execution of `make_request` when authentication succeeds."""
 
@@ -30,7 +33,7 @@ def test_make_request_success(mock_http_request, mock_http_login_response, mock_
     assert mock_http_request.call_count == 2  # Ensures both login and API requests were made
 
 
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_make_request_invalid_json_data(mock_task_vars):
     """Test that `make_request` raises an error when given non-serializable JSON data."""
 
@@ -41,7 +44,7 @@ def test_make_request_invalid_json_data(mock_task_vars):
         make_request(mock_task_vars, "POST", "/api/endpoint", data=UnserializableObject())
 
 
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_make_request_invalid_params(mock_task_vars):
     """Test that `make_request` raises an error when params is not a dictionary."""
 
@@ -49,7 +52,7 @@ def test_make_request_invalid_params(mock_task_vars):
         make_request(mock_task_vars, "GET", "/api/endpoint", params="invalid")
 
 
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_make_request_invalid_http_method(mock_task_vars):
     """Test that `make_request` raises an error when an invalid HTTP method is provided."""
 
@@ -59,7 +62,7 @@ def test_make_request_invalid_http_method(mock_task_vars):
         make_request(mock_task_vars, invalid_method, "/api/endpoint")
 
 
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 @patch("ansible_collections.itential.platform.plugins.module_utils.login.login")
 def test_make_request_with_manual_token(mock_login, mock_http_request, mock_task_vars):
     """Test that `make_request` does not call `login()` if a token is already provided in task_vars."""
@@ -104,7 +107,7 @@ def test_make_request_with_manual_token(mock_login, mock_http_request, mock_task
     "http://example.com/api/resource?key=value",
     "https://example.com/api#fragment",
 ])
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_make_request_valid_urls(mock_http_request, mock_http_login_response, mock_task_vars, valid_url):
     """Test that `make_request` correctly accepts valid URLs."""
     
@@ -137,7 +140,7 @@ def test_make_request_valid_urls(mock_http_request, mock_http_login_response, mo
     "http://example.com/ api",  # Space in path
     "http://.com/api",  # No domain before TLD
 ])
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_make_request_invalid_urls(mock_http_request, mock_http_login_response, mock_task_vars, invalid_url):
     """Test that `make_request` raises an error for malformed URLs."""
 
@@ -146,7 +149,7 @@ def test_make_request_invalid_urls(mock_http_request, mock_http_login_response,
             make_request(mock_task_vars, "GET", "/api/endpoint")
 
 
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_make_request_invalid_status_code(mock_http_request, mock_http_login_response, mock_task_vars):
     """Test that `make_request` raises an error when the API returns a non-200 response (400 Bad Request) for the non-login API request."""
 
@@ -172,7 +175,7 @@ def test_make_request_invalid_status_code(mock_http_request, mock_http_login_res
     (json.dumps({"key": "value"}), {"key": "value"}),  # Valid JSON response
     ("Invalid JSON", None),  # Invalid JSON response
 ])
-@patch("ansible_collections.itential.core.plugins.module_utils.http.send_request")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
 def test_make_request_json_response_handling(mock_http_request, mock_http_login_response, mock_task_vars, response_text, expected_json):
     """Test handling of valid and invalid JSON responses."""
 
@@ -191,3 +194,317 @@ def test_make_request_json_response_handling(mock_http_request, mock_http_login_
 
         with pytest.raises(AnsibleError, match="Failed to parse JSON response: Invalid JSON"):
             make_request(mock_task_vars, "GET", "/api/endpoint")
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_reuses_cached_token(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that consecutive calls to `make_request` only log in once."""
+
+    api_response = MagicMock(status_code=200, text=json.dumps({"key": "value"}))
+    api_response.json.return_value = {"key": "value"}
+
+    mock_http_request.side_effect = [mock_http_login_response, api_response, api_response]
+
+    make_request(mock_task_vars, "GET", "/api/endpoint")
+    make_request(mock_task_vars, "GET", "/api/endpoint")
+
+    assert mock_http_request.call_count == 3
+    assert mock_http_request.call_args_list[1][1]["params"]["token"] == mock_http_request.call_args_list[2][1]["params"]["token"]
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_reauthenticates_on_401(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that a rejected cached token is invalidated and the request is replayed once with a new token."""
+
+    expired_response = MagicMock(status_code=401, text="Unauthorized")
+    new_login_response = MagicMock(status_code=200, text="new_token")
+    api_response = MagicMock(status_code=200, text=json.dumps({"key": "value"}))
+    api_response.json.return_value = {"key": "value"}
+
+    mock_http_request.side_effect = [mock_http_login_response, expired_response, new_login_response, api_response]
+
+    result = make_request(mock_task_vars, "GET", "/api/endpoint")
+
+    assert result["json"] == {"key": "value"}
+    assert mock_http_request.call_count == 4
+    assert mock_http_request.call_args_list[3][1]["params"]["token"] == "new_token"
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_reauthenticates_stale_manual_token(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that a rejected `platform_auth_token` falls back to logging in with credentials."""
+
+    mock_task_vars["hostvars"]["platform"]["platform_auth_token"] = "stale-token"
+
+    expired_response = MagicMock(status_code=403, text="Token has expired")
+    api_response = MagicMock(status_code=200, text=json.dumps({"key": "value"}))
+    api_response.json.return_value = {"key": "value"}
+
+    mock_http_request.side_effect = [expired_response, mock_http_login_response, api_response]
+
+    result = make_request(mock_task_vars, "GET", "/api/endpoint")
+
+    assert result["json"] == {"key": "value"}
+    assert mock_http_request.call_args_list[0][1]["params"]["token"] == "stale-token"
+    assert mock_http_request.call_args_list[2][1]["params"]["token"] == mock_http_login_response.text
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_reauthenticates_only_once(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that `make_request` fails if the request is still rejected after logging in again."""
+
+    expired_response = MagicMock(status_code=401, text="Unauthorized")
+
+    mock_http_request.side_effect = [mock_http_login_response, expired_response, mock_http_login_response, expired_response]
+
+    with pytest.raises(AnsibleError, match="API request failed with status 401"):
+        make_request(mock_task_vars, "GET", "/api/endpoint")
+
+    assert mock_http_request.call_count == 4
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_forbidden_not_retried(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that a 403 unrelated to token expiry is not retried."""
+
+    forbidden_response = MagicMock(status_code=403, text="Insufficient permissions")
+
+    mock_http_request.side_effect = [mock_http_login_response, forbidden_response]
+
+    with pytest.raises(AnsibleError, match="API request failed with status 403"):
+        make_request(mock_task_vars, "GET", "/api/endpoint")
+
+    assert mock_http_request.call_count == 2
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+@patch("ansible_collections.itential.core.plugins.module_utils.hosts.new", wraps=hosts.new)
+def test_make_request_caches_host(mock_host_new, mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that the host object is built once and reused for the same hostvars."""
+
+    api_response = MagicMock(status_code=200, text=json.dumps({"key": "value"}))
+    api_response.json.return_value = {"key": "value"}
+
+    mock_http_request.side_effect = [mock_http_login_response, api_response, api_response, mock_http_login_response, api_response]
+
+    make_request(mock_task_vars, "GET", "/api/endpoint")
+    make_request(mock_task_vars, "GET", "/api/endpoint")
+    assert mock_host_new.call_count == 1
+
+    # Changing a host variable produces a new host object
+    mock_task_vars["hostvars"]["platform"]["platform_username"] = "other"
+    make_request(mock_task_vars, "GET", "/api/endpoint")
+    assert mock_host_new.call_count == 2
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_does_not_mutate_host_headers(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that the configured `platform_http_headers` are merged without being modified."""
+
+    custom_headers = {"x-custom": "value"}
+    mock_task_vars["hostvars"]["platform"]["platform_http_headers"] = custom_headers
+
+    api_response = MagicMock(status_code=200, text=json.dumps({"key": "value"}))
+    mock_http_request.side_effect = [mock_http_login_response, api_response]
+
+    make_request(mock_task_vars, "GET", "/api/endpoint")
+
+    assert custom_headers == {"x-custom": "value"}
+    assert mock_http_request.call_args[1]["headers"] == {
+        "x-custom": "value",
+        "content-type": "application/json",
+        "accept": "application/json",
+        "accept-encoding": "gzip, deflate",
+    }
+
+
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_retries_transient_failures(mock_http_request, mock_sleep, mock_http_login_response, mock_task_vars):
+    """Test that transient failures of idempotent requests are retried and every attempt is reported."""
+
+    unavailable = MagicMock(status_code=503, text="Service Unavailable")
+    unavailable.headers = {"Retry-After": "2"}
+    api_response = MagicMock(status_code=200, text=json.dumps({"key": "value"}))
+    api_response.headers = {"Content-Type": "application/json"}
+    api_response.json.return_value = {"key": "value"}
+
+    mock_http_request.side_effect = [
+        mock_http_login_response,
+        requests.exceptions.ConnectionError("Connection reset by peer"),
+        unavailable,
+        api_response,
+    ]
+
+    result = make_request(mock_task_vars, "GET", "/api/endpoint")
+
+    assert result["json"] == {"key": "value"}
+    assert result["retries"] == 2
+    assert [a["status"] for a in result["attempts"]] == [None, 503, 200]
+    assert "Connection reset" in result["attempts"][0]["error"]
+    assert result["attempts"][1]["delay"] == 2
+    assert result["attempts"][2]["delay"] is None
+    assert mock_sleep.call_count == 2
+
+
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_does_not_retry_post(mock_http_request, mock_sleep, mock_http_login_response, mock_task_vars):
+    """Test that non-idempotent requests are not retried by default."""
+
+    unavailable = MagicMock(status_code=503, text="Service Unavailable")
+    unavailable.headers = {}
+
+    mock_http_request.side_effect = [mock_http_login_response, unavailable]
+
+    with pytest.raises(AnsibleError, match="API request failed with status 503"):
+        make_request(mock_task_vars, "POST", "/api/endpoint", data={"key": "value"})
+
+    mock_sleep.assert_not_called()
+
+
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_retries_exhausted(mock_http_request, mock_sleep, mock_http_login_response, mock_task_vars):
+    """Test that the last error is raised once the retries are used up."""
+
+    mock_task_vars["hostvars"]["platform"]["platform_http_retries"] = 1
+
+    mock_http_request.side_effect = [
+        mock_http_login_response,
+        requests.exceptions.ConnectionError("Connection refused"),
+        requests.exceptions.ConnectionError("Connection refused"),
+    ]
+
+    with pytest.raises(requests.exceptions.ConnectionError, match="Connection refused"):
+        make_request(mock_task_vars, "GET", "/api/endpoint")
+
+    assert mock_http_request.call_count == 3
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_timeouts(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that the host's timeouts are sent with every request and `timeout` overrides the read timeout."""
+
+    mock_task_vars["hostvars"]["platform"]["platform_http_connect_timeout"] = 3
+    mock_http_request.side_effect = [mock_http_login_response, MagicMock(status_code=200), MagicMock(status_code=200)]
+
+    make_request(mock_task_vars, "GET", "/api/endpoint")
+    make_request(mock_task_vars, "GET", "/api/endpoint", timeout=7)
+
+    assert [c[1]["timeout"] for c in mock_http_request.call_args_list] == [(3, 120), (3, 120), (3, 7)]
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_deadline_exceeded(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that no request is sent once the deadline has passed."""
+
+    mock_http_request.side_effect = [mock_http_login_response]
+
+    with patch("time.monotonic", return_value=0):
+        deadline = Deadline(10)
+
+    with patch("time.monotonic", return_value=10):
+        with pytest.raises(DeadlineExceeded):
+            make_request(mock_task_vars, "GET", "/api/endpoint", deadline=deadline)
+
+    assert not any(c[1]["url"].endswith("/api/endpoint") for c in mock_http_request.call_args_list)
+
+
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_no_retry_past_deadline(mock_http_request, mock_sleep, mock_http_login_response, mock_task_vars):
+    """Test that a retry is not scheduled when its delay would run past the deadline."""
+
+    unavailable = MagicMock(status_code=503, text="Service Unavailable")
+    unavailable.headers = {"Retry-After": "20"}
+    mock_http_request.side_effect = [mock_http_login_response, unavailable]
+
+    with pytest.raises(AnsibleError, match="API request failed with status 503"):
+        make_request(mock_task_vars, "GET", "/api/endpoint", deadline=Deadline(10))
+
+    mock_sleep.assert_not_called()
+    assert mock_http_request.call_count == 2
+
+
+@patch("ansible_collections.itential.core.plugins.module_utils.display.vvv")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_debug_output_skipped(mock_http_request, mock_vvv, mock_http_login_response, mock_task_vars):
+    """Test that request and response details are not formatted below -vvv."""
+
+    api_response = MagicMock(status_code=200)
+    type(api_response).text = property(lambda self: pytest.fail("response body decoded for debug output"))
+    mock_http_request.side_effect = [mock_http_login_response, api_response]
+
+    with patch("ansible_collections.itential.platform.plugins.module_utils.request.Display") as mock_display:
+        mock_display.return_value.verbosity = 0
+        make_request(mock_task_vars, "GET", "/api/endpoint")
+
+    assert not any("API Request" in str(c[0][0]) for c in mock_vvv.call_args_list)
+    assert not any("API Response" in str(c[0][0]) for c in mock_vvv.call_args_list)
+
+
+@patch("ansible_collections.itential.core.plugins.module_utils.display.vvv")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_debug_output_redacted_and_truncated(mock_http_request, mock_vvv, mock_http_login_response, mock_task_vars):
+    """Test that debug output hides the token and truncates large bodies."""
+
+    body = json.dumps({"data": ["x" * 100] * 1000})
+    api_response = MagicMock(status_code=200, content=body.encode("utf-8"), encoding="utf-8")
+    api_response.headers = {}
+    mock_http_request.side_effect = [mock_http_login_response, api_response]
+
+    with patch("ansible_collections.itential.platform.plugins.module_utils.request.Display") as mock_display:
+        mock_display.return_value.verbosity = 3
+        make_request(mock_task_vars, "GET", "/api/endpoint", params={"status": "running"})
+
+    output = "\n".join(str(c[0][0]) for c in mock_vvv.call_args_list)
+    assert "mocked_token" not in output
+    assert '"token": "********"' in output
+    assert '"status": "running"' in output
+    assert f"[truncated, {len(body)} characters in total]" in output
+    assert len(output) < 10000
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_compressed_body(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that large bodies are gzip compressed on request and small bodies are left alone."""
+
+    mock_http_request.side_effect = [mock_http_login_response, MagicMock(status_code=200), MagicMock(status_code=200)]
+    large = {"tasks": ["task"] * 1000}
+
+    make_request(mock_task_vars, "POST", "/api/endpoint", data=large, compress=True)
+    make_request(mock_task_vars, "POST", "/api/endpoint", data={"key": "value"}, compress=True)
+
+    compressed, small = mock_http_request.call_args_list[1][1], mock_http_request.call_args_list[2][1]
+    assert compressed["headers"]["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(compressed["data"])) == large
+    assert "content-encoding" not in small["headers"]
+    assert small["data"] == json.dumps({"key": "value"})
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_stream_request(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that `stream_request` yields list items from a streamed response and closes it."""
+
+    body = json.dumps({"data": [{"_id": i} for i in range(3)], "metadata": {"total": 3}}).encode("utf-8")
+    api_response = MagicMock(status_code=200)
+    api_response.iter_content.return_value = [body[i:i + 5] for i in range(0, len(body), 5)]
+    mock_http_request.side_effect = [mock_http_login_response, api_response]
+
+    stream = stream_request(mock_task_vars, "GET", "/operations-manager/jobs")
+
+    assert [job["_id"] for job in stream] == [0, 1, 2]
+    assert stream.siblings == {"metadata": {"total": 3}}
+    assert mock_http_request.call_args[1]["stream"] is True
+    api_response.close.assert_called()
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_stream_request_failure(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that `stream_request` raises on a non-200 response."""
+
+    mock_http_request.side_effect = [mock_http_login_response, MagicMock(status_code=500, text="boom")]
+
+    with pytest.raises(AnsibleError, match="API request failed with status 500: boom"):
+        stream_request(mock_task_vars, "GET", "/operations-manager/jobs")
@@ -0,0 +1,93 @@
+import pytest
+import time
+import requests
+from unittest.mock import MagicMock, patch
+from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.action.restart_adapters import ActionModule as RestartAdapter
+
+
+def restart_api(delays=None, failures=()):
+    """Return a fake_send_request handler that restarts adapters, slowly or failing for some."""
+
+    def handler(method, url, params):
+        adapter = url.split("/")[-2]
+        time.sleep((delays or {}).get(adapter, 0))
+        if adapter in failures:
+            return MagicMock(status_code=500, text="restart failed")
+        return {"adapter": adapter}
+
+    return handler
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_adapters_concurrent_preserves_order(mock_http_request, mock_task_vars, make_action, fake_send_request):
+    """Test that concurrent restarts are returned in input order with per-adapter timing."""
+
+    names = ["a", "b", "c", "d"]
+    mock_http_request.side_effect = fake_send_request(restart_api(delays={"a": 0.2, "b": 0.1}))
+
+    start = time.perf_counter()
+    result = make_action(RestartAdapter, {"adapter_names": names, "concurrency": 4}).run(task_vars=mock_task_vars)
+    elapsed = time.perf_counter() - start
+
+    assert "failed" not in result
+    assert [r["adapter"] for r in result["results"]] == names
+    assert all("duration" in r for r in result["results"])
+    assert elapsed < 0.3  # Restarts overlapped instead of running back to back
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_adapters_failure_does_not_abort(mock_http_request, mock_task_vars, make_action, fake_send_request):
+    """Test that a failed restart is captured and the remaining adapters are still restarted."""
+
+    mock_http_request.side_effect = fake_send_request(restart_api(failures={"b"}))
+
+    result = make_action(RestartAdapter, {"adapter_names": ["a", "b", "c"], "concurrency": 2}).run(task_vars=mock_task_vars)
+
+    assert result["failed"] is True
+    assert "b" in result["msg"]
+    assert [r["adapter"] for r in result["results"]] == ["a", "b", "c"]
+    assert result["results"][1]["failed"] is True
+    assert "status 500" in result["results"][1]["msg"]
+    assert result["results"][2]["json"] == {"adapter": "c"}
+
+
+@pytest.mark.parametrize("concurrency", [0, -1, "many"])
+def test_restart_adapters_invalid_concurrency(mock_task_vars, concurrency, make_action):
+    """Test that an invalid `concurrency` value is rejected."""
+
+    with pytest.raises(AnsibleError, match="'concurrency' must be a positive integer"):
+        make_action(RestartAdapter, {"adapter_names": ["a"], "concurrency": concurrency}).run(task_vars=mock_task_vars)
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_adapters_deadline(mock_http_request, mock_task_vars, make_action, fake_send_request):
+    """Test that adapters not restarted before the deadline are reported as failed."""
+
+    mock_http_request.side_effect = fake_send_request(restart_api(delays={"a": 0.3}))
+
+    result = make_action(RestartAdapter, {"adapter_names": ["a", "b"], "deadline": 0.2}).run(task_vars=mock_task_vars)
+
+    assert result["failed"] is True
+    assert result["results"][0]["json"] == {"adapter": "a"}
+    assert result["results"][1]["failed"] is True
+    assert "deadline of 0.2 seconds exceeded" in result["results"][1]["msg"]
+
+
+@patch("time.sleep")
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_adapters_read_timeout_not_retried(mock_http_request, mock_sleep, mock_task_vars, make_action, fake_send_request):
+    """Test that a restart the server may already have accepted is not sent again."""
+
+    mock_task_vars["hostvars"]["platform"]["platform_http_retries"] = 2
+
+    def handler(method, url, params):
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    mock_http_request.side_effect = fake_send_request(handler)
+
+    result = make_action(RestartAdapter, {"adapter_names": ["a"]}).run(task_vars=mock_task_vars)
+
+    assert result["failed"] is True
+    assert [c.kwargs["method"] for c in mock_http_request.call_args_list] == ["POST", "PUT"]
+    mock_sleep.assert_not_called()
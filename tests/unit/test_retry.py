@@ -0,0 +1,99 @@
+import pytest
+from email.utils import formatdate
+from unittest.mock import MagicMock, patch
+import requests
+from ansible_collections.itential.platform.plugins.module_utils.retry import RetryPolicy, parse_retry_after
+
+
+def response(status_code, headers=None):
+    resp = MagicMock(status_code=status_code)
+    resp.headers = headers or {}
+    return resp
+
+
+@pytest.mark.parametrize("method, status_code, expected", [
+    ("GET", 503, True),
+    ("GET", 429, True),
+    ("GET", 502, True),
+    ("GET", 504, True),
+    ("DELETE", 503, True),
+    ("GET", 500, False),
+    ("GET", 404, False),
+    ("POST", 503, False),  # Not idempotent
+    ("PATCH", 503, False),  # Not idempotent
+])
+def test_should_retry_status(method, status_code, expected):
+    """Test that only transient statuses of idempotent methods are retried."""
+    policy = RetryPolicy(retries=2)
+
+    assert policy.should_retry(method, 1, resp=response(status_code)) is expected
+
+
+def test_should_retry_errors():
+    """Test that connection errors and timeouts are retried but other errors are not."""
+    policy = RetryPolicy(retries=2)
+
+    assert policy.should_retry("GET", 1, error=requests.exceptions.ConnectionError("reset"))
+    assert policy.should_retry("GET", 1, error=requests.exceptions.ReadTimeout("slow"))
+    assert not policy.should_retry("GET", 1, error=ValueError("bug"))
+
+
+def test_should_retry_exhausted():
+    """Test that no attempt is retried once the retry budget is spent."""
+    policy = RetryPolicy(retries=2)
+
+    assert policy.should_retry("GET", 2, resp=response(503))
+    assert not policy.should_retry("GET", 3, resp=response(503))
+
+
+def test_should_retry_custom_methods():
+    """Test that `retry_methods` opts non-idempotent methods in to retries."""
+    policy = RetryPolicy(retries=1, methods=["post"])
+
+    assert policy.should_retry("POST", 1, resp=response(503))
+    assert not policy.should_retry("GET", 1, resp=response(503))
+
+
+def test_should_retry_not_idempotent():
+    """Test that a request marked not idempotent is only retried when the server cannot have acted on it."""
+    policy = RetryPolicy(retries=2)
+
+    assert policy.should_retry("PUT", 1, error=requests.exceptions.ConnectTimeout("no route"), idempotent=False)
+    assert policy.should_retry("PUT", 1, resp=response(429), idempotent=False)
+    assert not policy.should_retry("PUT", 1, error=requests.exceptions.ReadTimeout("slow"), idempotent=False)
+    assert not policy.should_retry("PUT", 1, error=requests.exceptions.ConnectionError("reset"), idempotent=False)
+    assert not policy.should_retry("PUT", 1, resp=response(503), idempotent=False)
+
+
+def test_delay_exponential_with_jitter():
+    """Test that the delay is drawn from a doubling, capped window."""
+    policy = RetryPolicy(retries=5, backoff=1, max_backoff=5)
+
+    with patch("random.uniform", side_effect=lambda low, high: high):
+        assert [policy.delay(attempt) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+
+def test_delay_honors_retry_after():
+    """Test that a `Retry-After` header replaces the computed backoff, up to the maximum."""
+    policy = RetryPolicy(retries=2, backoff=1, max_backoff=10)
+
+    assert policy.delay(1, response(503, {"Retry-After": "3"})) == 3
+    assert policy.delay(1, response(503, {"Retry-After": "120"})) == 10
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("5", 5.0),
+    ("0", 0.0),
+    (None, None),
+    ("", None),
+    ("soon", None),
+])
+def test_parse_retry_after(value, expected):
+    """Test parsing `Retry-After` values given in seconds."""
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    """Test parsing a `Retry-After` value given as an HTTP date."""
+    with patch("time.time", return_value=1000.0):
+        assert parse_retry_after(formatdate(1030.0, usegmt=True)) == pytest.approx(30.0)
@@ -0,0 +1,144 @@
+import pytest
+from unittest.mock import MagicMock, patch
+import requests
+from ansible_collections.itential.platform.plugins.module_utils import session
+from ansible_collections.itential.platform.plugins.module_utils import circuit_breaker
+
+
+@pytest.fixture
+def mock_host():
+    """Fixture to create a mock host object with pool settings."""
+    mock = MagicMock()
+    mock.host = "example.com"
+    mock.port = 3000
+    mock.use_tls = True
+    mock.verify = True
+    mock.pool_maxsize = 4
+    mock.pool_idle_timeout = 60
+    mock.circuit_breaker_threshold = 2
+    mock.circuit_breaker_reset_timeout = 30
+    return mock
+
+
+def test_get_session_reused_for_same_host(mock_host):
+    """Test that the same pooled session is returned for repeated calls."""
+    assert session.get_session(mock_host) is session.get_session(mock_host)
+
+
+def test_get_session_per_host(mock_host):
+    """Test that different hosts get separate sessions."""
+    first = session.get_session(mock_host)
+    mock_host.host = "other.example.com"
+
+    assert session.get_session(mock_host) is not first
+
+
+def test_get_session_pool_size(mock_host):
+    """Test that the session's adapter is sized from `pool_maxsize`."""
+    adapter = session.get_session(mock_host).get_adapter("https://example.com:3000/")
+
+    assert adapter._pool_maxsize == 4
+
+
+def test_get_session_idle_timeout(mock_host):
+    """Test that a session idle for longer than `pool_idle_timeout` is replaced."""
+    with patch("time.monotonic", return_value=0):
+        first = session.get_session(mock_host)
+    with patch("time.monotonic", return_value=30):
+        assert session.get_session(mock_host) is first
+    with patch("time.monotonic", return_value=100):
+        assert session.get_session(mock_host) is not first
+
+
+def test_send_request_uses_pooled_session(mock_host):
+    """Test that `send_request()` sends through the host's pooled session."""
+    with patch("requests.Session.request") as mock_request:
+        mock_request.return_value = MagicMock(status_code=200)
+
+        resp = session.send_request(
+            mock_host,
+            method="GET",
+            url="https://example.com:3000/health/system",
+            headers={"accept": "application/json"},
+            params={"token": "abc"},
+            verify=True,
+            timeout=(10, 120),
+        )
+
+    assert resp.status_code == 200
+    mock_request.assert_called_once_with(
+        "GET",
+        "https://example.com:3000/health/system",
+        headers={"accept": "application/json"},
+        params={"token": "abc"},
+        data=None,
+        verify=True,
+        timeout=(10, 120),
+        stream=False,
+    )
+
+
+def test_close_sessions(mock_host):
+    """Test that `close_sessions()` discards all pooled sessions."""
+    first = session.get_session(mock_host)
+    session.close_sessions()
+
+    assert session.get_session(mock_host) is not first
+
+
+def test_send_request_circuit_breaker(mock_host):
+    """Test that repeated failures open the host's circuit and later requests fail fast."""
+    with patch("requests.Session.request") as mock_request, \
+            patch("ansible_collections.itential.platform.plugins.module_utils.metrics.record_circuit_open") as mock_record_open:
+        mock_request.side_effect = requests.exceptions.ConnectionError("Connection refused")
+
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                session.send_request(mock_host, method="GET", url="https://example.com:3000/health/system")
+
+        with pytest.raises(circuit_breaker.CircuitOpenError, match="Circuit breaker open for example.com:3000"):
+            session.send_request(mock_host, method="GET", url="https://example.com:3000/health/system")
+
+    assert mock_request.call_count == 2
+    mock_record_open.assert_called_once_with(mock_host)
+
+
+def test_connection_timing(mock_host):
+    """Test that a new connection reports its connect time and a reused one reports none."""
+    import http.server
+    import threading
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        mock_host.host = "127.0.0.1"
+        mock_host.port = server.server_port
+        mock_host.use_tls = False
+        url = f"http://127.0.0.1:{server.server_port}/health"
+
+        session.send_request(mock_host, "GET", url, timeout=5)
+        first = session.connection_timing()
+        session.send_request(mock_host, "GET", url, timeout=5)
+        second = session.connection_timing()
+    finally:
+        session.close_sessions()
+        server.shutdown()
+        server.server_close()
+
+    assert first["new_connections"] == 1
+    assert first["connect"] > 0
+    assert first["tls"] == 0
+    assert second == {"connect": 0.0, "tls": 0.0, "new_connections": 0}
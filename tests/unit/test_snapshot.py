@@ -0,0 +1,142 @@
+import pytest
+import json
+import os
+from unittest.mock import patch
+from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils import snapshot
+from ansible_collections.itential.platform.plugins.action.get_tasks import ActionModule as GetTasks
+
+
+def test_snapshot_merge_and_reload(tmp_path):
+    """Test that merged records and the checkpoint survive a save and reload."""
+    path = str(tmp_path / "tasks.json")
+
+    state = snapshot.load(path, "last_updated")
+    assert state.checkpoint is None
+
+    changed = state.merge([{"_id": "a", "last_updated": "2025-01-01"}, {"_id": "b", "last_updated": "2025-01-03"}])
+    state.save()
+
+    assert changed == 2
+    reloaded = snapshot.load(path, "last_updated")
+    assert reloaded.checkpoint == "2025-01-03"
+    assert set(reloaded.records) == {"a", "b"}
+
+    assert reloaded.merge([{"_id": "a", "last_updated": "2025-01-01"}]) == 0
+
+
+def test_snapshot_scope_change_starts_over(tmp_path):
+    """Test that a snapshot taken with different filters is discarded."""
+    path = str(tmp_path / "tasks.json")
+
+    state = snapshot.load(path, "last_updated", scope={"equals[status]": "running"})
+    state.merge([{"_id": "a", "last_updated": "2025-01-01"}])
+    state.save()
+
+    assert snapshot.load(path, "last_updated", scope={"equals[status]": "complete"}).records == {}
+    assert snapshot.load(path, "updated", scope={"equals[status]": "running"}).records == {}
+
+
+def test_snapshot_save_mode(tmp_path):
+    """Test that a snapshot is created with the umask mode, not readable by its owner only."""
+    path = tmp_path / "tasks.json"
+    umask = os.umask(0o022)
+    try:
+        snapshot.load(str(path), "last_updated").save()
+        assert path.stat().st_mode & 0o777 == 0o644
+    finally:
+        os.umask(umask)
+    assert [p.name for p in tmp_path.iterdir()] == ["tasks.json"]
+
+
+def test_snapshot_merge_requires_id(tmp_path):
+    """Test that records without an `_id` are rejected."""
+    state = snapshot.load(str(tmp_path / "tasks.json"), "last_updated")
+
+    with pytest.raises(AnsibleError, match="without an '_id'"):
+        state.merge([{"name": "task"}])
+
+
+def tasks_api(tasks):
+    """Return a fake_send_request handler that serves `tasks` honoring a `gte[last_updated]` filter."""
+
+    def handler(method, url, params):
+        since = params.get("gte[last_updated]")
+        matching = [t for t in tasks if since is None or t["last_updated"] >= since]
+        page = matching[params["skip"]:params["skip"] + params["limit"]]
+        return {"data": page, "metadata": {"total": len(matching)}}
+
+    return handler
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_get_tasks_incremental(mock_http_request, mock_task_vars, tmp_path, make_action, fake_send_request):
+    """Test that a second run only requests and returns tasks changed since the checkpoint."""
+
+    tasks = [
+        {"_id": "1", "status": "complete", "last_updated": "2025-01-01T00:00:00Z"},
+        {"_id": "2", "status": "running", "last_updated": "2025-01-02T00:00:00Z"},
+    ]
+    mock_http_request.side_effect = fake_send_request(tasks_api(tasks))
+    path = str(tmp_path / "tasks.json")
+
+    def run():
+        return make_action(GetTasks, {"snapshot": path}).run(task_vars=mock_task_vars)
+
+    first = run()
+    assert first["changed"] is True
+    assert len(first["json"]["data"]) == 2
+    assert first["checkpoint"] == "2025-01-02T00:00:00Z"
+
+    tasks[1] = dict(tasks[1], status="complete", last_updated="2025-01-03T00:00:00Z")
+    tasks.append({"_id": "3", "status": "running", "last_updated": "2025-01-03T00:00:00Z"})
+
+    second = run()
+    assert second["previous_checkpoint"] == "2025-01-02T00:00:00Z"
+    assert mock_http_request.call_args[1]["params"]["gte[last_updated]"] == "2025-01-02T00:00:00Z"
+    assert sorted(t["_id"] for t in second["json"]["data"]) == ["2", "3"]
+    assert second["snapshot_total"] == 3
+    assert second["checkpoint"] == "2025-01-03T00:00:00Z"
+
+    third = run()
+    assert third["changed"] is False
+    assert third["json"]["data"] == []
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_get_tasks_dest(mock_http_request, mock_task_vars, tmp_path, make_action, fake_send_request):
+    """Test that `get_tasks` streams every task to an NDJSON file and returns only metadata."""
+
+    tasks = [{"_id": str(i), "status": "complete", "last_updated": "2025-01-01T00:00:00Z"} for i in range(3)]
+    mock_http_request.side_effect = fake_send_request(tasks_api(tasks))
+    dest = tmp_path / "tasks.ndjson"
+
+    result = make_action(GetTasks, {"dest": str(dest), "page_size": 2}).run(task_vars=mock_task_vars)
+
+    assert result["count"] == 3
+    assert result["pages"] == 2
+    assert "json" not in result
+    assert [json.loads(line)["_id"] for line in dest.read_text().splitlines()] == ["0", "1", "2"]
+
+
+@pytest.mark.parametrize("fields, include", [
+    ("status", "status,last_updated"),
+    ("metrics.start_time,last_updated", "metrics,last_updated"),
+])
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_get_tasks_snapshot_includes_fields(mock_http_request, mock_task_vars, tmp_path, make_action, fake_send_request, fields, include):
+    """Test that the top-level fields of `fields` and the checkpoint field are requested."""
+
+    tasks = [{"_id": "1", "status": "complete", "last_updated": "2025-01-01T00:00:00Z"}]
+    mock_http_request.side_effect = fake_send_request(tasks_api(tasks))
+
+    make_action(GetTasks, {"snapshot": str(tmp_path / "tasks.json"), "fields": fields}).run(task_vars=mock_task_vars)
+
+    assert mock_http_request.call_args[1]["params"]["include"] == include
+
+
+def test_get_tasks_dest_and_snapshot(mock_task_vars, tmp_path, make_action):
+    """Test that `dest` cannot be combined with `snapshot`."""
+
+    with pytest.raises(AnsibleError, match="'snapshot' and 'dest' are mutually exclusive"):
+        make_action(GetTasks, {"dest": str(tmp_path / "a"), "snapshot": str(tmp_path / "b")}).run(task_vars=mock_task_vars)
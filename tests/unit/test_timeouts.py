@@ -0,0 +1,71 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from ansible.errors import AnsibleError
+from ansible_collections.itential.platform.plugins.module_utils import timeouts
+from ansible_collections.itential.platform.plugins.module_utils.timeouts import Deadline, DeadlineExceeded
+
+
+@pytest.fixture
+def mock_host():
+    """Fixture to create a mock host object with timeout settings."""
+    return MagicMock(connect_timeout=10, read_timeout=120)
+
+
+def test_request_timeout_from_host(mock_host):
+    """Test that the host's connect and read timeouts are used by default."""
+    assert timeouts.request_timeout(mock_host) == (10, 120)
+
+
+def test_request_timeout_override(mock_host):
+    """Test that a per-task timeout replaces only the read timeout."""
+    assert timeouts.request_timeout(mock_host, timeout=5) == (10, 5)
+
+
+def test_request_timeout_disabled(mock_host):
+    """Test that 0 waits indefinitely."""
+    mock_host.connect_timeout = 0
+    mock_host.read_timeout = 0
+
+    assert timeouts.request_timeout(mock_host) == (None, None)
+
+
+def test_request_timeout_capped_by_deadline(mock_host):
+    """Test that neither phase may wait past the deadline."""
+    with patch("time.monotonic", return_value=100):
+        deadline = Deadline(30)
+
+    with patch("time.monotonic", return_value=125):
+        assert timeouts.request_timeout(mock_host, deadline=deadline) == (5, 5)
+
+    mock_host.read_timeout = 0
+    with patch("time.monotonic", return_value=110):
+        assert timeouts.request_timeout(mock_host, deadline=deadline) == (10, 20)
+
+
+def test_deadline_check():
+    """Test that `check()` raises once the deadline has passed."""
+    with patch("time.monotonic", return_value=100):
+        deadline = Deadline(30)
+        deadline.check()
+
+    with patch("time.monotonic", return_value=130):
+        assert deadline.remaining() == 0
+        with pytest.raises(DeadlineExceeded, match="Task deadline of 30 seconds exceeded"):
+            deadline.check()
+
+
+def test_task_arguments():
+    """Test reading the `timeout` and `deadline` task arguments."""
+    assert timeouts.task_timeout({}) is None
+    assert timeouts.task_deadline({}) is None
+    assert timeouts.task_timeout({"timeout": "2.5"}) == 2.5
+    assert timeouts.task_deadline({"deadline": 60}).seconds == 60
+
+
+@pytest.mark.parametrize("value", [0, -1, "soon"])
+def test_task_arguments_invalid(value):
+    """Test that invalid `timeout` and `deadline` values are rejected."""
+    with pytest.raises(AnsibleError, match="'timeout' must be a positive number"):
+        timeouts.task_timeout({"timeout": value})
+    with pytest.raises(AnsibleError, match="'deadline' must be a positive number"):
+        timeouts.task_deadline({"deadline": value})
@@ -0,0 +1,108 @@
+import datetime
+import pytest
+import json
+from unittest.mock import MagicMock, patch
+from ansible_collections.itential.platform.plugins.module_utils import timing
+from ansible_collections.itential.platform.plugins.module_utils.request import make_request
+
+CONNECTION = {"connect": 0.25, "tls": 0.5, "new_connections": 1}
+
+
+def test_add_send_splits_response_time():
+    """Test that an attempt is split into connection setup, time to first byte and transfer."""
+
+    resp = MagicMock(elapsed=datetime.timedelta(seconds=2))
+    request_timing = timing.RequestTiming()
+    request_timing.add_send(resp, 3.0, CONNECTION)
+
+    result = request_timing.as_dict()
+    assert result["connect"] == 0.25
+    assert result["tls"] == 0.5
+    assert result["ttfb"] == pytest.approx(1.25)
+    assert result["transfer"] == pytest.approx(1.0)
+    assert result["new_connections"] == 1
+    assert result["parse"] is None
+
+
+def test_add_send_streamed_body_not_transferred():
+    """Test that a streamed attempt leaves transfer time to whoever reads the body."""
+
+    resp = MagicMock(elapsed=datetime.timedelta(seconds=2))
+    request_timing = timing.RequestTiming()
+    request_timing.add_send(resp, 2.0, CONNECTION, stream=True)
+    request_timing.add_transfer(4.0)
+
+    assert request_timing.as_dict()["transfer"] == 4.0
+
+
+def test_retries_and_backoff():
+    """Test that retries and the time waited between them are reported."""
+
+    attempts = [
+        {"status": 503, "error": None, "elapsed": 0.1, "delay": 1.5},
+        {"status": 200, "error": None, "elapsed": 0.1, "delay": None},
+    ]
+    result = timing.RequestTiming("GET", "/health/status", attempts).as_dict()
+
+    assert result["attempts"] == 2
+    assert result["retries"] == 1
+    assert result["errors"] == 1
+    assert result["backoff"] == 1.5
+
+
+def test_combine():
+    """Test that timings are summed and their token sources listed."""
+
+    first = dict(timing.RequestTiming().as_dict(), login=1.0, ttfb=0.5, parse=0.25, token_source="login", attempts=1)
+    second = dict(timing.RequestTiming().as_dict(), ttfb=0.5, token_source="cache", attempts=2, retries=1)
+
+    combined = timing.combine(iter([first, second]))
+
+    assert combined["requests"] == 2
+    assert combined["login"] == 1.0
+    assert combined["ttfb"] == 1.0
+    assert combined["parse"] == 0.25
+    assert combined["attempts"] == 3
+    assert combined["retries"] == 1
+    assert combined["token_source"] == ["login", "cache"]
+    assert combined["latencies"] == [first["total"], second["total"]]
+    assert combined["logins"] == 1
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_timing(mock_http_request, mock_http_login_response, mock_task_vars):
+    """Test that `make_request` reports its timing and whether the token came from the cache."""
+
+    def api_response():
+        resp = MagicMock(status_code=200, elapsed=datetime.timedelta(seconds=0))
+        resp.headers = {"Content-Type": "application/json"}
+        resp.json.return_value = {"key": "value"}
+        return resp
+
+    mock_http_request.side_effect = [mock_http_login_response, api_response(), api_response()]
+
+    first = make_request(mock_task_vars, "GET", "/health/status")["timing"]
+    second = make_request(mock_task_vars, "GET", "/health/status")["timing"]
+
+    assert first["token_source"] == "login"
+    assert second["token_source"] == "cache"
+    assert first["parse"] is not None
+    assert first["attempts"] == 1
+    assert first["total"] >= first["login"] + first["parse"]
+    json.dumps(first)
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_make_request_provided_token(mock_http_request, mock_task_vars):
+    """Test that a token given in `platform_auth_token` is reported as provided."""
+
+    mock_task_vars["hostvars"]["platform"]["platform_auth_token"] = "provided_token"
+    resp = MagicMock(status_code=200)
+    resp.headers = {}
+    mock_http_request.return_value = resp
+
+    result = make_request(mock_task_vars, "GET", "/health/status")
+
+    assert result["timing"]["token_source"] == "provided"
+    assert result["timing"]["login"] == 0.0
+    assert result["timing"]["parse"] is None
@@ -0,0 +1,90 @@
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+from ansible_collections.itential.platform.plugins.module_utils import token_store
+
+
+@pytest.fixture
+def mock_host(tmp_path):
+    """Fixture to create a mock host object with an isolated token store directory."""
+    mock = MagicMock()
+    mock.host = "example.com"
+    mock.port = 3000
+    mock.username = "admin"
+    mock.token_cache_dir = str(tmp_path / "store")
+    return mock
+
+
+def test_save_and_load(mock_host):
+    """Test that a saved token can be loaded back before it expires."""
+    token_store.save(mock_host, "stored_token", 600)
+
+    token, expires_at = token_store.load(mock_host)
+
+    assert token == "stored_token"
+    assert expires_at > 0
+
+
+def test_load_missing(mock_host):
+    """Test that loading a token that was never saved returns None."""
+    assert token_store.load(mock_host) is None
+
+
+def test_store_permissions(mock_host):
+    """Test that the store directory and entries are only readable by the owner."""
+    token_store.save(mock_host, "stored_token", 600)
+
+    path = token_store._entry_path(mock_host)
+
+    assert os.stat(mock_host.token_cache_dir).st_mode & 0o077 == 0
+    assert os.stat(path).st_mode & 0o077 == 0
+
+
+def test_load_expired_evicts_entry(mock_host):
+    """Test that an expired entry is removed from the store when loaded."""
+    with patch("time.time", return_value=1000):
+        token_store.save(mock_host, "stored_token", 600)
+
+    with patch("time.time", return_value=2000):
+        assert token_store.load(mock_host) is None
+
+    assert not os.path.exists(token_store._entry_path(mock_host))
+
+
+def test_entries_keyed_by_username(mock_host):
+    """Test that tokens for different usernames are stored separately."""
+    token_store.save(mock_host, "admin_token", 600)
+    mock_host.username = "other"
+
+    assert token_store.load(mock_host) is None
+
+
+def test_evict_only_matching_token(mock_host):
+    """Test that evicting a stale token does not remove a refreshed one."""
+    token_store.save(mock_host, "new_token", 600)
+
+    token_store.evict(mock_host, "old_token")
+    assert token_store.load(mock_host)[0] == "new_token"
+
+    token_store.evict(mock_host, "new_token")
+    assert token_store.load(mock_host) is None
+
+
+def test_save_replaces_entry_atomically(mock_host):
+    """Test that saving over an existing entry leaves no temporary files behind."""
+    token_store.save(mock_host, "first_token", 600)
+    token_store.save(mock_host, "second_token", 600)
+
+    assert token_store.load(mock_host)[0] == "second_token"
+    assert not [f for f in os.listdir(mock_host.token_cache_dir) if f.startswith(".tmp-")]
+
+
+def test_login_lock_times_out(mock_host):
+    """Test that a caller gives up waiting for a login lock held by another process."""
+    with token_store.login_lock(mock_host) as first:
+        with token_store.login_lock(mock_host, timeout=0.1) as second:
+            assert first is True
+            assert second is False
+
+    with token_store.login_lock(mock_host) as third:
+        assert third is True
@@ -0,0 +1,102 @@
+import pytest
+import json
+from unittest.mock import patch
+from ansible_collections.itential.platform.plugins.module_utils import tracing
+from ansible_collections.itential.platform.plugins.module_utils import parallel
+from ansible_collections.itential.platform.plugins.action.restart_adapters import ActionModule as RestartAdapter
+
+
+def read_spans(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_nested_spans(tmp_path):
+    """Test that child spans share the trace of their parent and link to it."""
+
+    trace_file = tmp_path / "trace.jsonl"
+
+    with tracing.span("parent", str(trace_file), attributes={"key": "value"}):
+        with tracing.span("child", kind=tracing.CLIENT) as child:
+            child.set_attribute("http.response.status_code", 200)
+
+    child, parent = read_spans(trace_file)
+
+    assert parent["name"] == "parent"
+    assert parent["parent_span_id"] is None
+    assert parent["attributes"]["key"] == "value"
+    assert child["trace_id"] == parent["trace_id"]
+    assert child["parent_span_id"] == parent["span_id"]
+    assert child["kind"] == tracing.CLIENT
+    assert child["attributes"]["http.response.status_code"] == 200
+    assert parent["start_time_unix_nano"] <= child["start_time_unix_nano"] <= child["end_time_unix_nano"] <= parent["end_time_unix_nano"]
+
+
+def test_tracing_off(tmp_path):
+    """Test that nothing is recorded without a trace file."""
+
+    with tracing.span("parent") as current:
+        assert current is tracing.NO_SPAN
+        with tracing.span("child") as child:
+            child.set_attribute("key", "value")
+        assert tracing.current() is tracing.NO_SPAN
+
+
+def test_exception_recorded(tmp_path):
+    """Test that an exception raised in a span marks it as failed and is re-raised."""
+
+    trace_file = tmp_path / "trace.jsonl"
+
+    with pytest.raises(ValueError):
+        with tracing.span("parent", str(trace_file)):
+            raise ValueError("boom")
+
+    span, = read_spans(trace_file)
+    assert span["status"] == {"code": tracing.STATUS_ERROR, "message": "boom"}
+    assert span["events"][0]["attributes"]["exception.type"] == "ValueError"
+
+
+def test_run_ordered_propagates_span(tmp_path):
+    """Test that calls made on other threads are children of the caller's span."""
+
+    trace_file = tmp_path / "trace.jsonl"
+
+    def call(item):
+        with tracing.span(f"call {item}"):
+            pass
+
+    with tracing.span("parent", str(trace_file)):
+        parallel.run_ordered(call, [1, 2, 3], concurrency=3)
+
+    spans = read_spans(trace_file)
+    parent = spans[-1]
+    assert sorted(span["name"] for span in spans[:-1]) == ["call 1", "call 2", "call 3"]
+    assert all(span["parent_span_id"] == parent["span_id"] for span in spans[:-1])
+
+
+@patch("ansible_collections.itential.platform.plugins.module_utils.session.send_request")
+def test_restart_adapters_traced(mock_http_request, mock_task_vars, tmp_path, make_action, fake_send_request):
+    """Test that an action, its concurrent requests and its login are traced."""
+
+    trace_file = tmp_path / "trace.jsonl"
+    mock_task_vars["hostvars"]["platform"]["platform_trace_file"] = str(trace_file)
+
+    mock_http_request.side_effect = fake_send_request(lambda method, url, params: {})
+
+    action_module = make_action(RestartAdapter, {"adapter_names": ["a", "b"], "concurrency": 2})
+
+    action_module.run(task_vars=mock_task_vars)
+
+    spans = {span["name"]: span for span in read_spans(trace_file)}
+    action = spans["action itential.platform.restart_adapters"]
+    requests = [spans["PUT /adapters/a/restart"], spans["PUT /adapters/b/restart"]]
+
+    assert action["parent_span_id"] is None
+    assert action["attributes"]["ansible.host"] == "platform"
+    for request in requests:
+        assert request["trace_id"] == action["trace_id"]
+        assert request["parent_span_id"] == action["span_id"]
+        assert request["attributes"]["http.response.status_code"] == 200
+        assert request["attributes"]["url.path"].startswith("/adapters/")
+
+    # The token is obtained once, as part of whichever request needed it first
+    assert spans["login"]["parent_span_id"] in {request["span_id"] for request in requests}